@@ -0,0 +1,58 @@
+import time
+
+import numpy as np
+
+from hasa.graph import WeightGraph
+from hasa.model import weight_breakdown
+from hasa.x37b import x37b_inputs
+
+# What-if session benchmark for the incremental HASA dependency graph (hasa/graph.py).
+# Run from the repository root with: python -m benchmarks.hasa_graph_whatif
+#
+# Each edit changes one input by a few percent and reads the allowable payload, once through
+# the graph and once by re-running the whole model.
+
+N_EDITS = 20_000
+EDITED_INPUTS = ("HRSI_area", "RCC_area", "FRSI_area", "W_ins", "S_wfh", "S_wfv", "fuel_residual", "W_entry",
+                 "S_ref", "V_oms_tnk", "T_req_oms", "L_f")
+
+
+def main():
+    rng = np.random.default_rng(0)
+    base = x37b_inputs()
+    names = rng.choice(EDITED_INPUTS, N_EDITS)
+    factors = rng.uniform(0.95, 1.05, N_EDITS)
+    edits = [(str(name), base[name] * factor) for name, factor in zip(names, factors)]
+
+    graph = WeightGraph(base)
+    graph["W_allow_payload"]
+    graph.reset_counts()
+    start = time.perf_counter()
+    incremental = []
+    for name, value in edits:
+        graph.set(**{name: value})
+        incremental.append(graph["W_allow_payload"])
+    t_graph = time.perf_counter() - start
+
+    inputs = dict(base)
+    start = time.perf_counter()
+    full = []
+    for name, value in edits:
+        inputs[name] = value
+        full.append(weight_breakdown(inputs)["W_allow_payload"])
+    t_full = time.perf_counter() - start
+
+    n_nodes = len(graph.nodes)
+    n_recomputed = sum(graph.recompute_counts.values())
+    print(f"{N_EDITS} single-input edits:")
+    print(f"  Full re-evaluation: {t_full*1e3:.1f} ms ({N_EDITS * n_nodes} node evaluations)")
+    print(f"  Incremental graph:  {t_graph*1e3:.1f} ms ({n_recomputed} node evaluations, "
+          f"{n_recomputed / (N_EDITS * n_nodes) * 100:.1f}% of full)")
+    print(f"  Max |difference|: {np.max(np.abs(np.array(incremental) - np.array(full))):.1e} lbs")
+    print("Recompute counts per node:")
+    for name, count in sorted(graph.recompute_counts.items(), key=lambda item: -item[1]):
+        print(f"  {name:<24}{count:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+import contextlib
+import io
+import subprocess
+import sys
+import time
+import timeit
+
+import hasa
+from hasa.x37b import x37b_inputs
+
+# Import-time and per-call overhead benchmark for the hasa package.
+# Run from the repository root with: python -m benchmarks.hasa_import_overhead
+#
+# Exits with a non-zero status if `import hasa` prints anything, pulls in NumPy, or exceeds
+# the import-time budget, or if any weight function prints while being called.
+
+IMPORT_BUDGET = 0.050     # s, import hasa on top of a bare interpreter start
+N_IMPORT_RUNS = 10
+N_CALLS = 100_000
+
+
+def interpreter_time(code, runs=N_IMPORT_RUNS):
+    """Best-of-runs wall time of a fresh interpreter running code, and its stdout."""
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        best = min(best, time.perf_counter() - start)
+    return best, result.stdout
+
+
+def function_calls(p):
+    """(name, zero-argument callable) for each scalar weight function at the X-37B inputs."""
+    W_rcs_thrusters = [1.0, 2.0, 3.0, 4.0]
+    return [
+        ("fuselage_weight_func", lambda: hasa.fuselage_weight_func(
+            p["L_f"], p["ULF"], p["q_max"], p["S_btot"], p["V_tot"], p["mf"])),
+        ("wing_weight_func", lambda: hasa.wing_weight_func(
+            p["W_gtot"], p["W_prop"], p["ULF"], p["S_ref"], p["AR"], p["taper_ratio"], p["t_c"],
+            p["sweep_angle"], p["mf"])),
+        ("horizontal_stabilizer_weight_func", lambda: hasa.horizontal_stabilizer_weight_func(
+            p["W_gtot"], p["S_ref"], p["S_wfh"], p["q_max"])),
+        ("vertical_stabilizer_weight_func", lambda: hasa.vertical_stabilizer_weight_func(p["S_wfv"])),
+        ("tps_weight_func", lambda: hasa.tps_weight_func(p["W_ins"], p["HRSI_area"], p["RCC_area"], p["FRSI_area"])),
+        ("landing_gear_weight_func", lambda: hasa.landing_gear_weight_func(p["W_gtot"], p["fuel_residual"],
+                                                                           p["W_prop"])),
+        ("structure_weight_func", lambda: hasa.structure_weight_func(1.0, 2.0, 3.0, 4.0, 5.0, 6.0)),
+        ("oms_engine_weight_func", lambda: hasa.oms_engine_weight_func(p["T_req_oms"])),
+        ("oms_pressurization_weight_func", lambda: hasa.oms_pressurization_weight_func(
+            p["P_oms_press"], p["V_oms_press"], p["V_oms_ox"], p["V_oms_fuel"])),
+        ("rcs_thruster_weight_func", lambda: hasa.rcs_thruster_weight_func(p["N_pf"], p["T_req_qp"], p["R_p"])),
+        ("rcs_installation_weight_func", lambda: hasa.rcs_installation_weight_func(W_rcs_thrusters)),
+        ("total_rcs_weight_func", lambda: hasa.total_rcs_weight_func(W_rcs_thrusters, 1.0, 2.0)),
+        ("total_tank_weight_func", lambda: hasa.total_tank_weight_func(
+            p["P_oms_tnk"], p["V_oms_tnk"], p["P_rcs_tnk"], p["V_rcs_tnk"])),
+        ("surface_control_actuators_weight_func", lambda: hasa.surface_control_actuators_weight_func(p["W_entry"])),
+        ("avionics_weight_func", lambda: hasa.avionics_weight_func(p["W_gtot"])),
+        ("electrical_weight_func", lambda: hasa.electrical_weight_func(p["W_gtot"], p["L_f"])),
+        ("weight_breakdown (full model)", lambda: hasa.weight_breakdown(p)),
+    ]
+
+
+def main():
+    failures = []
+
+    # Import time (fresh interpreters, so nothing is cached in sys.modules)
+    t_bare, _ = interpreter_time("pass")
+    t_import, stdout = interpreter_time("import hasa")
+    _, numpy_loaded = interpreter_time("import hasa, sys; print('numpy' in sys.modules)", runs=1)
+    overhead = t_import - t_bare
+    print(f"Bare interpreter: {t_bare*1e3:.1f} ms, with import hasa: {t_import*1e3:.1f} ms "
+          f"(import overhead {overhead*1e3:.1f} ms, budget {IMPORT_BUDGET*1e3:.0f} ms)")
+    if overhead > IMPORT_BUDGET:
+        failures.append("import hasa exceeds the import-time budget")
+    if stdout:
+        failures.append(f"import hasa printed {len(stdout.splitlines())} lines")
+    if numpy_loaded.strip() != "False":
+        failures.append("import hasa imports NumPy")
+
+    # Per-call overhead; none of the functions may print
+    print(f"\nPer-call time ({N_CALLS} calls each):")
+    for name, call in function_calls(x37b_inputs()):
+        captured = io.StringIO()
+        with contextlib.redirect_stdout(captured):
+            t = timeit.timeit(call, number=N_CALLS) / N_CALLS
+        print(f"  {name}: {t*1e9:.0f} ns")
+        if captured.getvalue():
+            failures.append(f"{name} prints")
+
+    if failures:
+        print("\nFAILED: " + "; ".join(failures))
+        sys.exit(1)
+    print("\nOK: import hasa is side-effect free and no weight function prints.")
+
+
+if __name__ == "__main__":
+    main()
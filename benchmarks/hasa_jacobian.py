@@ -0,0 +1,62 @@
+import time
+
+import numpy as np
+
+from hasa.model import INPUT_NAMES, OUTPUT_NAMES
+from hasa.sensitivity import jacobian
+from hasa.vectorized import weight_breakdown
+from hasa.x37b import x37b_inputs
+
+# Validation and timing of the analytic HASA Jacobian (hasa/sensitivity.py) against central
+# finite differences (2 model evaluations per input).
+# Run from the repository root with: python -m benchmarks.hasa_jacobian
+
+N_POINTS = 20_000
+REL_STEP = 1e-6
+FIXED_INPUTS = ("sweep_angle",)  # see benchmarks/hasa_vectorized_throughput.py
+
+
+def finite_difference_jacobian(inputs):
+    """Central finite-difference Jacobian with a relative step, shape (n, outputs, inputs)."""
+    n = max(np.size(v) for v in inputs.values())
+    J = np.empty((n, len(OUTPUT_NAMES), len(INPUT_NAMES)))
+    for j, name in enumerate(INPUT_NAMES):
+        x = np.broadcast_to(np.asarray(inputs[name], dtype=np.float64), (n,))
+        h = REL_STEP * np.maximum(np.abs(x), 1.0)
+        plus = weight_breakdown({**inputs, name: x + h})
+        minus = weight_breakdown({**inputs, name: x - h})
+        for i, out in enumerate(OUTPUT_NAMES):
+            J[:, i, j] = (plus[out] - minus[out]) / (2 * h)
+    return J
+
+
+def main():
+    rng = np.random.default_rng(0)
+    inputs = {name: value if name in FIXED_INPUTS else value * rng.uniform(0.9, 1.1, N_POINTS)
+              for name, value in x37b_inputs().items()}
+    inputs.update(eta_vol=0.7 * rng.uniform(0.9, 1.1, N_POINTS), R_oms=22.0, TRF=0.05,
+                  avionics_factor=0.69 * rng.uniform(0.9, 1.1, N_POINTS))
+
+    start = time.perf_counter()
+    J = jacobian(inputs)
+    t_analytic = time.perf_counter() - start
+
+    start = time.perf_counter()
+    J_fd = finite_difference_jacobian(inputs)
+    t_fd = time.perf_counter() - start
+
+    scale = np.maximum(np.abs(J_fd), np.abs(J_fd).max(axis=2, keepdims=True) * 1e-6 + 1e-12)
+    rel_err = np.abs(J - J_fd) / scale
+    worst = np.unravel_index(np.argmax(rel_err.max(axis=0)), rel_err.shape[1:])
+
+    print(f"Jacobian of {len(OUTPUT_NAMES)} outputs w.r.t. {len(INPUT_NAMES)} inputs at {N_POINTS} design points")
+    print(f"  Analytic:           {t_analytic*1e3:.1f} ms")
+    print(f"  Finite differences: {t_fd*1e3:.1f} ms ({2 * len(INPUT_NAMES)} model evaluations)")
+    print(f"  Speed-up: {t_fd / t_analytic:.1f}x")
+    print(f"  Max relative difference: {rel_err.max():.2e} "
+          f"(d{OUTPUT_NAMES[worst[0]]}/d{INPUT_NAMES[worst[1]]})")
+    print(f"  Median relative difference: {np.median(rel_err[J_fd != 0]):.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from hasa.sobol import X37B_SOBOL, sobol_indices
+
+# Scaling benchmark for the Sobol sensitivity engine (hasa/sobol.py).
+# Run from the repository root with: python -m benchmarks.hasa_sobol
+#
+# The number of base samples is increased tenfold at a time with every continuous X-37B input
+# uncertain (python -m hasa.sobol --all-inputs, ~40 inputs); each run is a fresh process so its
+# peak resident memory can be compared. The bootstrap interval widths should shrink as
+# 1/sqrt(N) while the memory stays flat. Finally, the indices are checked to be identical for
+# 1 and 2 worker processes.
+
+SAMPLES = (1e4, 1e5, 1e6)
+N_CHECK = 50_000  # Base samples of the worker reproducibility check
+
+
+def main():
+    print("W_allow_payload, all continuous inputs uncertain")
+    print(f"{'N':>9}{'evaluations':>13}{'time [s]':>10}{'peak [MB]':>11}   top input: first order, total [95% CI]")
+    for n in SAMPLES:
+        start = time.perf_counter()
+        run = subprocess.run([sys.executable, "-m", "hasa.sobol", "--samples", str(n), "--all-inputs", "--workers", "1"],
+                             capture_output=True, text=True, check=True)
+        elapsed = time.perf_counter() - start
+        lines = run.stdout.splitlines()
+        evaluations = lines[0].split(",")[2].split()[0]
+        peak = lines[-1].split(":")[1].split()[0]
+        print(f"{int(n):>9}{evaluations:>13}{elapsed:>10.1f}{peak:>11}   {lines[4].strip()}")
+
+    a = sobol_indices(N_CHECK, uncertainty=X37B_SOBOL, chunk_size=N_CHECK // 4, workers=1)
+    b = sobol_indices(N_CHECK, uncertainty=X37B_SOBOL, chunk_size=N_CHECK // 4, workers=2)
+    identical = all(np.array_equal(a[name][key], b[name][key]) for name in a for key in a[name])
+    print(f"\nIndices identical for 1 and 2 workers: {identical}")
+
+
+if __name__ == "__main__":
+    main()
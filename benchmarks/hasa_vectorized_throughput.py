@@ -0,0 +1,65 @@
+import time
+
+import numpy as np
+
+from hasa.model import weight_breakdown as scalar_weight_breakdown
+from hasa.vectorized import weight_breakdown
+from hasa.x37b import x37b_inputs
+
+# Throughput benchmark for the vectorized HASA weight engine (hasa/vectorized.py).
+# Run from the repository root with: python -m benchmarks.hasa_vectorized_throughput
+#
+# The X-37B case is perturbed by +/-10% on every continuous input, the batch is evaluated
+# in one vectorized pass, and a subsample is checked bit-for-bit against the scalar functions.
+
+N_POINTS = 1_000_000  # Number of design points in the vectorized batch
+N_SCALAR = 20_000     # Number of design points evaluated with the scalar functions
+N_REPEAT = 5
+# Integer inputs (thruster counts) are not perturbed. Neither is sweep_angle: wing_weight_func
+# takes cos(degrees(sweep_angle)), which changes sign within +/-10% of 50 deg, and the scalar
+# function then returns a complex wing weight (NaN in the vectorized engine).
+FIXED_INPUTS = ("N_pf", "N_vf", "N_pa", "N_va", "sweep_angle")
+
+
+def random_design_points(n, seed=0):
+    """Perturbs the X-37B inputs by +/-10% (uniform) to get n design points."""
+    rng = np.random.default_rng(seed)
+    return {
+        name: value if name in FIXED_INPUTS else value * rng.uniform(0.9, 1.1, n)
+        for name, value in x37b_inputs().items()
+    }
+
+
+def main():
+    inputs = random_design_points(N_POINTS)
+
+    # Vectorized engine
+    times = []
+    for _ in range(N_REPEAT):
+        start = time.perf_counter()
+        result = weight_breakdown(inputs)
+        times.append(time.perf_counter() - start)
+    t_vec = min(times)
+
+    # Scalar functions on a subsample
+    points = [{name: value if np.ndim(value) == 0 else float(value[i]) for name, value in inputs.items()}
+              for i in range(N_SCALAR)]
+    start = time.perf_counter()
+    scalar = [scalar_weight_breakdown(p) for p in points]
+    t_scalar = time.perf_counter() - start
+
+    mismatches = sum(
+        int(np.count_nonzero(result[name][:N_SCALAR] != np.array([s[name] for s in scalar])))
+        for name in scalar[0]
+    )
+
+    print(f"Vectorized: {N_POINTS} design points in {t_vec*1e3:.1f} ms "
+          f"({N_POINTS / t_vec:,.0f} design points/s)")
+    print(f"Scalar:     {N_SCALAR} design points in {t_scalar*1e3:.1f} ms "
+          f"({N_SCALAR / t_scalar:,.0f} design points/s)")
+    print(f"Speed-up: {(N_POINTS / t_vec) / (N_SCALAR / t_scalar):.1f}x")
+    print(f"Bit-for-bit mismatches vs. scalar functions (all {len(scalar[0])} outputs): {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
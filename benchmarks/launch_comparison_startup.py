@@ -0,0 +1,63 @@
+import json
+import subprocess
+import sys
+import time
+
+# Startup-time budget of the headless launch_comparison.py batch mode.
+# Run from the repository root with: python -m benchmarks.launch_comparison_startup
+#
+# Exits with a non-zero status if `python launch_comparison.py --json` exceeds the budget (on top
+# of a bare interpreter start), imports scipy.stats, statsmodels or matplotlib, or prints
+# anything but valid JSON; also reports the interactive-mode imports for comparison.
+
+STARTUP_BUDGET = 0.750  # s, headless run on top of a bare interpreter start
+N_RUNS = 5
+HEAVY_MODULES = ("scipy.stats", "statsmodels", "matplotlib")
+
+
+def interpreter_time(args, runs=N_RUNS):
+    """Best-of-runs wall time of a fresh interpreter, and its stdout."""
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, *args], capture_output=True, text=True, check=True)
+        best = min(best, time.perf_counter() - start)
+    return best, result.stdout
+
+
+def main():
+    failures = []
+
+    t_bare, _ = interpreter_time(["-c", "pass"])
+    t_batch, stdout = interpreter_time(["launch_comparison.py", "--json"])
+    t_report_imports, _ = interpreter_time(
+        ["-c", "import scipy.stats, matplotlib.pyplot, statsmodels.stats.proportion"], runs=2)
+    overhead = t_batch - t_bare
+    print(f"Bare interpreter: {t_bare*1e3:.1f} ms")
+    print(f"launch_comparison.py --json: {t_batch*1e3:.1f} ms "
+          f"(overhead {overhead*1e3:.1f} ms, budget {STARTUP_BUDGET*1e3:.0f} ms)")
+    print(f"Importing scipy.stats, matplotlib and statsmodels alone: {t_report_imports*1e3:.1f} ms")
+    if overhead > STARTUP_BUDGET:
+        failures.append("headless run exceeds the startup-time budget")
+
+    try:
+        results = json.loads(stdout)
+        print(f"P-value of the z-test: {results['z_test']['p_value']:.4f}")
+    except (ValueError, KeyError):
+        failures.append("--json output is not the results JSON")
+
+    code = ("import sys, runpy; sys.argv = ['launch_comparison.py', '--batch']; "
+            "runpy.run_path('launch_comparison.py', run_name='__main__'); "
+            f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules], file=sys.stderr)")
+    loaded = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stderr
+    if loaded.strip() != "[]":
+        failures.append(f"headless run imports {loaded.strip()}")
+
+    if failures:
+        print("\nFAILED: " + "; ".join(failures))
+        sys.exit(1)
+    print("\nOK: headless launch_comparison.py stays within the startup budget without heavy imports.")
+
+
+if __name__ == "__main__":
+    main()
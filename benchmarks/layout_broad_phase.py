@@ -0,0 +1,44 @@
+import numpy as np
+
+from optimization.layout import solve_layout
+
+# Layout optimization with every pair constrained up front against the broad phase with lazy
+# non-overlap constraints (optimization/layout.py), for a growing number of components.
+# Run from the repository root with: python -m benchmarks.layout_broad_phase
+#
+# Workload: a drafted layout of random boxes (0.4 .. 1.2 per side) in a cylinder of radius 5
+# whose length grows with the component count (constant packing density), legalized with the
+# "anchor" objective. Note that the "axes" separation (every axis at once) is stricter than
+# non-overlap: with all pairs constrained it stops being feasible beyond about ten boxes.
+
+R_CYL = 5.0
+LENGTH_PER_COMPONENT = 1.0
+COMPONENT_COUNTS = (10, 20, 50, 100, 200, 500, 1000, 2000)
+ALL_PAIRS_MAX = 50  # largest problem solved with every pair constrained
+
+
+def draft_layout(n, seed=0):
+    """Box dimensions, cylinder height and a drafted (overlapping) layout of n components."""
+    rng = np.random.default_rng(seed)
+    H_cyl = max(10.0, LENGTH_PER_COMPONENT * n)
+    dimensions = rng.uniform(0.4, 1.2, (n, 3))
+    r = (R_CYL - 1) * np.sqrt(rng.uniform(0, 1, n))
+    theta = rng.uniform(0, 2 * np.pi, n)
+    z = rng.uniform(-(H_cyl - 1.2) / 2, (H_cyl - 1.2) / 2, n)
+    return dimensions, H_cyl, np.column_stack([r * np.cos(theta), r * np.sin(theta), z])
+
+
+def main():
+    print(f"{'n':>5}  {'mode':<12}{'pairs':>8}{'rounds':>8}{'iters':>7}{'time [s]':>10}  feasible")
+    for n in COMPONENT_COUNTS:
+        dimensions, H_cyl, centers = draft_layout(n)
+        for broad_phase in (False, True):
+            if not broad_phase and n > ALL_PAIRS_MAX:
+                continue
+            result = solve_layout(dimensions, R_CYL, H_cyl, centers, broad_phase=broad_phase, objective="anchor")
+            print(f"{n:>5}  {'broad phase' if broad_phase else 'all pairs':<12}{result['n_pairs']:>8}"
+                  f"{result['rounds']:>8}{result['iterations']:>7}{result['wall_time']:>10.2f}  {result['feasible']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+import time
+
+import numpy as np
+
+from hasa.vectorized import weight_breakdown
+from hasa.x37b import x37b_inputs
+from optimization.containment import SignedDistanceGrid, polygon_distance, superellipse_sections
+from optimization.layout import solve_layout
+from optimization.prepack import prepack
+from optimization.telemetry import timing_splits
+
+# Containment in a non-circular, tapered fuselage through a signed distance grid
+# (optimization/containment.py). The body is X-37B-like: the HASA fuselage length L_f and
+# equivalent body diameter D_be, flattened superelliptic sections, a tapered nose and boattail
+# (an illustrative shape, not the vehicle's IML). It is given as a cross-section table and as a
+# triangle mesh at several resolutions:
+#   1. build time and accuracy of the grid (against the exact section distance, and mesh against table),
+#      and the sign of the distance far outside the grid;
+#   2. layout solves in the fuselage, started from a pre-packed layout in the inscribed cylinder:
+#      the constraint cost per iteration does not depend on the resolution of the shape, only on
+#      the number of boxes.
+# Run from the repository root with: python -m benchmarks.layout_containment
+
+SPACING = 0.15  # ft
+VERTEX_COUNTS = (32, 128, 512)  # vertices per section
+N_STATIONS = 41
+N_BOXES = (10, 40, 100)
+
+
+def fuselage_size():
+    """HASA fuselage length and equivalent body diameter (ft) of the X-37B inputs."""
+    inputs = x37b_inputs()
+    return float(inputs["L_f"]), float(weight_breakdown(inputs)["D_be"])
+
+
+def fuselage_table(n_vertices):
+    """Stations along z (ft, centered) and sections of the illustrative fuselage."""
+    L_f, D_be = fuselage_size()
+    s = np.linspace(0, 1, N_STATIONS)
+    taper = np.minimum(1.0, np.sqrt(np.clip(s / 0.3, 0.02, None))) * np.minimum(1.0, 1 - 0.4 * (s - 0.8) / 0.2 * (s > 0.8))
+    half_widths, half_heights = 0.6 * D_be * taper, 0.42 * D_be * taper
+    return (s - 0.5) * L_f, superellipse_sections(half_widths, half_heights, exponent=2.5, n_vertices=n_vertices)
+
+
+def table_mesh(stations, sections):
+    """Closed, outward-oriented triangle mesh of the lofted table (end sections closed by fans)."""
+    m, k = sections.shape[:2]
+    vertices = np.concatenate([np.column_stack([sections.reshape(-1, 2), np.repeat(stations, k)]),
+                               [[0, 0, stations[0]], [0, 0, stations[-1]]]])
+    i, j = np.meshgrid(np.arange(m - 1), np.arange(k), indexing="ij")
+    a, b, c, d = i * k + j, i * k + (j + 1) % k, (i + 1) * k + j, (i + 1) * k + (j + 1) % k
+    faces = [np.column_stack([a.ravel(), b.ravel(), d.ravel()]), np.column_stack([a.ravel(), d.ravel(), c.ravel()])]
+    j = np.arange(k)
+    faces.append(np.column_stack([np.full(k, m * k), (j + 1) % k, j]))
+    faces.append(np.column_stack([np.full(k, m * k + 1), (m - 1) * k + j, (m - 1) * k + (j + 1) % k]))
+    return vertices, np.concatenate(faces)
+
+
+def main():
+    rng = np.random.default_rng(0)
+    stations, sections = fuselage_table(VERTEX_COUNTS[-1])
+    # Test points on a middle section plane near the wall
+    k = N_STATIONS // 2
+    angles = rng.uniform(0, 2 * np.pi, 2000)
+    plane = sections[k].max(axis=0) * rng.uniform(0.8, 1.1, (2000, 1)) * np.column_stack([np.cos(angles), np.sin(angles)])
+    exact = polygon_distance(plane, sections[k])
+    points = np.column_stack([plane, np.full(len(plane), stations[k])])[np.abs(exact) < 2 * SPACING]
+    exact = exact[np.abs(exact) < 2 * SPACING]
+
+    print(f"Grid spacing {SPACING} ft, error at the points of a middle section within {2 * SPACING} ft of the wall")
+    print(f"{'shape':<24}{'build [s]':>10}{'grid points':>13}{'max error [ft]':>16}")
+    containers = {}
+    for n_vertices in VERTEX_COUNTS:
+        table = fuselage_table(n_vertices)
+        start = time.perf_counter()
+        containers[f"table, {n_vertices} vertices"] = SignedDistanceGrid.from_sections(*table, SPACING)
+        build = time.perf_counter() - start
+        grid = containers[f"table, {n_vertices} vertices"]
+        print(f"{f'table, {n_vertices} vertices':<24}{build:>10.2f}{grid.values.size:>13}"
+              f"{np.abs(grid(points) - exact).max():>16.4f}")
+    for n_vertices in VERTEX_COUNTS[:2]:
+        vertices, faces = table_mesh(*fuselage_table(n_vertices))
+        start = time.perf_counter()
+        grid = SignedDistanceGrid.from_mesh(vertices, faces, SPACING)
+        build = time.perf_counter() - start
+        print(f"{f'mesh, {len(faces)} triangles':<24}{build:>10.2f}{grid.values.size:>13}"
+              f"{np.abs(grid(points) - exact).max():>16.4f}")
+
+    # Points outside the grid (up to 10 fuselage lengths away) must read as outside
+    L_f, D_be = fuselage_size()
+    directions = rng.normal(size=(2000, 3))
+    far = directions / np.linalg.norm(directions, axis=1, keepdims=True) * rng.uniform(0.6, 10, (2000, 1)) * L_f
+    outside = [container(far).min() for container in (*containers.values(), grid)]
+    print(f"Smallest distance at 2000 points outside the grids: {min(outside):.2f} ft (must be > 0)")
+
+    # Start: pre-packed in the cylinder inscribed in the constant section part (the middle 40%)
+    print(f"\nLayout solves in the fuselage (dispersion objective, softmax separation)")
+    print(f"{'boxes':>6}{'shape':<26}{'iters':>6}{'time [s]':>10}{'constraints/iter [ms]':>23}{'feasible':>10}")
+    for n in N_BOXES:
+        dimensions = np.random.default_rng(n).uniform(0.5, 1.3, (n, 3))
+        init_centers = prepack(dimensions, 0.42 * D_be, 0.4 * L_f)
+        for label, container in containers.items():
+            result = solve_layout(dimensions, None, None, init_centers, objective="dispersion", separation="softmax",
+                                  container=container)
+            splits = timing_splits(result["problem"])
+            per_iter = (splits["nlp_g"] + splits["nlp_jac_g"]) / max(result["iterations"], 1) * 1e3
+            print(f"{n:>6}  {label:<24}{result['iterations']:>6}{result['wall_time']:>10.2f}{per_iter:>23.2f}"
+                  f"{str(result['feasible']):>10}")
+
+
+if __name__ == "__main__":
+    main()
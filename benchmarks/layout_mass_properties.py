@@ -0,0 +1,83 @@
+import time
+
+import numpy as np
+
+from optimization.layout import solve_layout
+from optimization.mass_properties import constrain_cg, hasa_component_masses, mass_properties
+from optimization.prepack import prepack
+
+# Mass properties of packed layouts (optimization/mass_properties.py):
+#   1. evaluation time of CG and inertia tensor for a batch of layouts, vectorized against a
+#      per-box Python loop (checked to agree);
+#   2. cost of a CG limit as a constraint of the layout solve, with the HASA (X-37B) component
+#      masses on the first boxes and the other boxes as uniform-density payload.
+# Run from the repository root with: python -m benchmarks.layout_mass_properties
+
+R_CYL, H_CYL = 5, 20
+BOX_COUNTS = (10, 100, 500)
+N_LAYOUTS = 1000
+LOOP_LAYOUTS = 20
+N_SOLVE = 60
+CG_Z_LIMIT = -1.0  # CG at least this far below the cylinder mid-plane
+
+
+def mass_properties_loop(centers, dimensions, masses):
+    """Reference: one box at a time."""
+    M = masses.sum()
+    cg = sum(m * c for m, c in zip(masses, centers)) / M
+    inertia = np.zeros((3, 3))
+    for m, c, (w, l, h) in zip(masses, centers, dimensions):
+        r = c - cg
+        inertia += m / 12 * np.diag([l ** 2 + h ** 2, w ** 2 + h ** 2, w ** 2 + l ** 2])
+        inertia += m * (r @ r * np.eye(3) - np.outer(r, r))
+    return cg, inertia
+
+
+def layout_masses(dimensions):
+    """HASA component masses on the first boxes, uniform density (average of those) on the rest."""
+    component = np.array(list(hasa_component_masses().values()), dtype=float)
+    volumes = dimensions.prod(axis=1)
+    k = min(len(component), len(dimensions))
+    density = component[:k].sum() / volumes[:k].sum()
+    masses = density * volumes
+    masses[:k] = component[:k]
+    return masses
+
+
+def main():
+    print(f"Evaluation of {N_LAYOUTS} layouts")
+    print(f"{'boxes':>6}{'per-box loop [s]':>18}{'vectorized [s]':>16}{'speedup':>9}{'max rel. error':>16}")
+    for n in BOX_COUNTS:
+        rng = np.random.default_rng(n)
+        dimensions = rng.uniform(0.4, 1.2, (n, 3))
+        centers = rng.uniform(-1, 1, (N_LAYOUTS, n, 3)) * [R_CYL, R_CYL, H_CYL / 2]
+        masses = layout_masses(dimensions)
+
+        start = time.perf_counter()
+        batch = mass_properties(centers, dimensions, masses)
+        vectorized = time.perf_counter() - start
+
+        start = time.perf_counter()
+        reference = [mass_properties_loop(c, dimensions, masses) for c in centers[:LOOP_LAYOUTS]]
+        loop = (time.perf_counter() - start) * N_LAYOUTS / LOOP_LAYOUTS
+        error = max(np.abs(batch["inertia"][i] - inertia).max() / np.abs(inertia).max()
+                    + np.abs(batch["cg"][i] - cg).max() / R_CYL for i, (cg, inertia) in enumerate(reference))
+        print(f"{n:>6}{loop:>18.3f}{vectorized:>16.4f}{loop / vectorized:>8.0f}x{error:>16.1e}")
+
+    rng = np.random.default_rng(0)
+    dimensions = rng.uniform(0.4, 1.2, (N_SOLVE, 3))
+    masses = layout_masses(dimensions)
+    init_centers = prepack(dimensions, R_CYL, H_CYL)
+    print(f"\nLayout solve, {N_SOLVE} boxes, {masses.sum():.0f} lb")
+    print(f"{'CG limit':<18}{'iters':>6}{'time [s]':>10}{'feasible':>10}{'CG z':>8}{'Ixx':>10}{'Izz':>10}")
+    for label, limit in (("none", None), (f"z <= {CG_Z_LIMIT}", CG_Z_LIMIT)):
+        constraints = None if limit is None else lambda problem: constrain_cg(problem, masses, upper=(None, None, limit))
+        result = solve_layout(dimensions, R_CYL, H_CYL, init_centers, objective="anchor", separation="softmax",
+                              constraints=constraints)
+        properties = mass_properties(result["centers"], dimensions, masses)
+        print(f"{label:<18}{result['iterations']:>6}{result['wall_time']:>10.2f}{str(result['feasible']):>10}"
+              f"{properties['cg'][2]:>8.2f}{properties['inertia'][0, 0]:>10.0f}{properties['inertia'][2, 2]:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
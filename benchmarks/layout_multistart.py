@@ -0,0 +1,41 @@
+import os
+
+import numpy as np
+
+from optimization.multistart import multistart_layout
+
+# Multi-start layout optimization (optimization/multistart.py) of the layout_optimization_test.py
+# problem: the hand-picked initial guess is start 0, the other starts are random layouts.
+# Run from the repository root with: python -m benchmarks.layout_multistart
+#
+# The starts are run in-process and then in a process pool with all cores; the results must be
+# identical (deterministic seeding), only the wall time changes.
+
+R_CYL, H_CYL = 5, 20
+DIMENSIONS = np.array([[1, 1, 1], [1, 1, 1], [1, 1, 1], [1.1, 1.1, 1.1], [2, 2, 8]])
+INIT_CENTERS = np.array([[0, 0, 0], [1, 1, 1], [4, 4, 4], [5, 4, 5], [5, 5, 7]])
+N_STARTS = 32
+
+
+def main():
+    cores = max(os.cpu_count(), 2)  # always exercise the process pool
+    for separation in ("axes", "softmax"):
+        runs = {workers: multistart_layout(DIMENSIONS, R_CYL, H_CYL, N_STARTS, INIT_CENTERS, workers=workers,
+                                           broad_phase=False, objective="pairwise", separation=separation)
+                for workers in (1, cores)}
+        serial, parallel = runs[1], runs[cores]
+        starts = serial["starts"]
+        objectives = np.array([result["objective"] if result["feasible"] else np.nan for result in starts])
+        same = all(a["objective"] == b["objective"] for a, b in zip(starts, parallel["starts"]))
+
+        print(f"separation={separation}: {N_STARTS} starts, {np.isfinite(objectives).sum()} feasible, "
+              f"{sum(result['iterations'] for result in starts)} IPOPT iterations")
+        print(f"  hand-picked guess: objective {objectives[0]:.4f}")
+        print(f"  best start {serial['best']['start']}: objective {serial['best']['objective']:.4f} "
+              f"(median of feasible starts {np.nanmedian(objectives):.4f})")
+        print(f"  1 worker {serial['wall_time']:.2f} s, {cores} workers {parallel['wall_time']:.2f} s "
+              f"(speedup {serial['wall_time'] / parallel['wall_time']:.1f}x), identical results: {same}")
+
+
+if __name__ == "__main__":
+    main()
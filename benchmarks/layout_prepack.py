@@ -0,0 +1,46 @@
+import time
+
+import numpy as np
+
+from optimization.layout import containment_violation, overlapping_pairs, solve_layout
+from optimization.multistart import random_layout
+from optimization.prepack import prepack
+
+# Warm start of the layout NLP from the greedy pre-packer (optimization/prepack.py) against the
+# hard-coded initial guesses of layout_optimization_test.py (5 boxes) or, for more components,
+# overlapping guesses drawn in the cylinder.
+# Run from the repository root with: python -m benchmarks.layout_prepack
+
+R_CYL, H_CYL = 5, 20
+DIMENSIONS_5 = np.array([[1, 1, 1], [1, 1, 1], [1, 1, 1], [1.1, 1.1, 1.1], [2, 2, 8]])
+INIT_CENTERS_5 = np.array([[0, 0, 0], [1, 1, 1], [4, 4, 4], [5, 4, 5], [5, 5, 7]])
+COMPONENT_COUNTS = (5, 10, 20, 50, 100, 200, 500)
+OPTIONS = {"objective": "dispersion", "separation": "softmax", "broad_phase": True}
+GUESSES_MAX = 200  # beyond this the solves from overlapping guesses take tens of minutes
+
+
+def main():
+    print(f"{'n':>5}  {'start':<12}{'prepack [ms]':>13}{'rounds':>8}{'iters':>7}{'time [s]':>10}{'objective':>11}  feasible")
+    for n in COMPONENT_COUNTS:
+        if n == 5:
+            dimensions, guess = DIMENSIONS_5, INIT_CENTERS_5
+        else:
+            rng = np.random.default_rng(n)
+            dimensions = rng.uniform(0.4, 1.2, (n, 3))
+            guess = random_layout(dimensions, R_CYL, H_CYL, rng)
+
+        start = time.perf_counter()
+        packed = prepack(dimensions, R_CYL, H_CYL)
+        elapsed = time.perf_counter() - start
+        assert overlapping_pairs(packed, dimensions, tol=0)[0].size == 0
+        assert containment_violation(packed, dimensions, R_CYL, H_CYL) == 0
+
+        starts = [("hard-coded" if n == 5 else "guesses", guess, "")] if n <= GUESSES_MAX else []
+        for label, init_centers, prepack_time in starts + [("prepacked", packed, f"{elapsed*1e3:.1f}")]:
+            result = solve_layout(dimensions, R_CYL, H_CYL, init_centers, **OPTIONS)
+            print(f"{n:>5}  {label:<12}{prepack_time:>13}{result['rounds']:>8}{result['iterations']:>7}"
+                  f"{result['wall_time']:>10.2f}{result['objective']:>11.2f}  {result['feasible']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import io
+import time
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+
+from optimization.prepack import prepack
+from optimization.render import render_layout
+
+# Render time of a layout plot against the number of boxes: the former drawing code of
+# layout_optimization_test.py (six plot3D calls per box, 50 x 100 cylinder surface) against the
+# batched renderer (optimization/render.py, one Line3DCollection). Both render off-screen (Agg)
+# to a PNG in memory.
+# Run from the repository root with: python -m benchmarks.layout_render
+
+R_CYL, H_CYL = 5, 20
+BOX_COUNTS = (5, 50, 200, 500, 1000)
+LEGACY_MAX = 500
+
+
+def render_legacy(centers, dimensions, path):
+    """The per-box drawing of the former layout_optimization_test.py."""
+    fig = plt.figure(figsize=(7, 6))
+    ax = fig.add_subplot(111, projection='3d')
+    z = np.linspace(-H_CYL / 2, H_CYL / 2, 50)
+    theta, z = np.meshgrid(np.linspace(0, 2 * np.pi, 100), z)
+    ax.plot_surface(R_CYL * np.cos(theta), R_CYL * np.sin(theta), z, color='gray', alpha=0.1, rstride=5, cstride=5,
+                    edgecolor='none')
+    for center, (w, l, h) in zip(centers, dimensions):
+        corners = np.array([[center[0] + sx * w / 2, center[1] + sy * l / 2, center[2] + sz * h / 2]
+                            for sz in (-1, 1) for sx in (-1, 1) for sy in (-1, 1)])
+        ax.plot3D(*zip(*corners[[0, 1, 3, 2, 0]]), color='blue')
+        ax.plot3D(*zip(*corners[[4, 5, 7, 6, 4]]), color='blue')
+        for start, end in zip(corners[:4], corners[4:]):
+            ax.plot3D(*zip(start, end), color='blue')
+    ax.set_xlim([-R_CYL, R_CYL])
+    ax.set_ylim([-R_CYL, R_CYL])
+    ax.set_zlim([-H_CYL / 2, H_CYL / 2])
+    fig.savefig(path, dpi=150)
+    plt.close(fig)
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    function(*args, io.BytesIO())
+    return time.perf_counter() - start
+
+
+def main():
+    print(f"{'boxes':>6}{'per-box plot3D [s]':>20}{'batched [s]':>13}{'speedup':>9}")
+    for n in BOX_COUNTS:
+        dimensions = np.random.default_rng(n).uniform(0.4, 1.2, (n, 3)) * min(1.0, (200 / n) ** (1 / 3))
+        centers = prepack(dimensions, R_CYL, H_CYL)
+        batched = timed(lambda c, d, path: render_layout(c, d, R_CYL, H_CYL, path=path), centers, dimensions)
+        if n <= LEGACY_MAX:
+            legacy = timed(render_legacy, centers, dimensions)
+            print(f"{n:>6}{legacy:>20.2f}{batched:>13.2f}{legacy / batched:>8.1f}x")
+        else:
+            print(f"{n:>6}{'':>20}{batched:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
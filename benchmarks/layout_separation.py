@@ -0,0 +1,43 @@
+import numpy as np
+
+from benchmarks.layout_broad_phase import R_CYL, draft_layout
+from optimization.layout import SEPARATIONS, solve_layout
+
+# Convergence of the non-overlap formulations of optimization/layout.py: "axes" (separated along
+# every axis, as layout_optimization_test.py) against the smooth disjunctive "softmax" and
+# "complementarity" modes.
+# Run from the repository root with: python -m benchmarks.layout_separation
+#
+# Packing: random boxes pulled together ("dispersion" objective) with every pair constrained.
+# Legalization: a drafted layout twice as dense as in benchmarks/layout_broad_phase.py,
+# moved as little as possible ("anchor" objective) with the broad phase.
+
+PACKING_COUNTS = (5, 10, 20, 40)
+LEGALIZATION_COUNTS = (50, 200, 500)
+DENSITY = 2.0  # relative to benchmarks/layout_broad_phase.py
+
+
+def packing_layout(n, seed=0):
+    rng = np.random.default_rng(seed)
+    dimensions = rng.uniform(0.4, 1.2, (n, 3))
+    centers = np.column_stack([rng.uniform(-3, 3, n), rng.uniform(-3, 3, n), rng.uniform(-8, 8, n)])
+    return dimensions, 20.0, centers
+
+
+def main():
+    print(f"{'case':<14}{'n':>5}  {'separation':<17}{'rounds':>7}{'iters':>7}{'time [s]':>10}{'objective':>11}  feasible")
+    cases = [("packing", n, "dispersion", False, packing_layout(n)) for n in PACKING_COUNTS]
+    for n in LEGALIZATION_COUNTS:
+        dimensions, H_cyl, centers = draft_layout(n)
+        cases.append(("legalization", n, "anchor", True, (dimensions, H_cyl / DENSITY, centers / [1, 1, DENSITY])))
+
+    for case, n, objective, broad_phase, (dimensions, H_cyl, centers) in cases:
+        for separation in SEPARATIONS:
+            result = solve_layout(dimensions, R_CYL, H_cyl, centers, broad_phase=broad_phase,
+                                  objective=objective, separation=separation)
+            print(f"{case:<14}{n:>5}  {separation:<17}{result['rounds']:>7}{result['iterations']:>7}"
+                  f"{result['wall_time']:>10.2f}{result['objective']:>11.2f}  {result['feasible']}")
+
+
+if __name__ == "__main__":
+    main()
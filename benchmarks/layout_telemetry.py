@@ -0,0 +1,79 @@
+import os
+import sys
+import tempfile
+
+import casadi
+import numpy as np
+
+from optimization.layout import solve_layout
+from optimization.prepack import prepack
+from optimization.telemetry import SolverTelemetry, load_telemetry, timing_splits
+
+# Cost of logging the layout solve: no callback, the per-center opti.debug.value logging of
+# layout_optimization_test.py (into growing lists), and SolverTelemetry (optimization/telemetry.py)
+# sampling every iteration or every 10th iteration streamed to disk.
+# Run from the repository root with: python -m benchmarks.layout_telemetry
+
+R_CYL, H_CYL = 5, 20
+N_BOXES = 60
+OPTIONS = {"objective": "dispersion", "separation": "softmax", "broad_phase": True}
+
+
+class ListLogger:
+    """The former log_values callback: one opti.debug.value per center and one for the objective."""
+
+    def attach(self, problem):
+        self.problem = problem
+        self.centers = [casadi.vertcat(problem.x[i], problem.y[i], problem.z[i]) for i in range(problem.n)]
+        self.centers_iter, self.objective_values = [], []
+        return self
+
+    def __call__(self, iteration):
+        debug = self.problem.opti.debug
+        self.centers_iter.append([debug.value(center) for center in self.centers])
+        self.objective_values.append(debug.value(self.problem.objective))
+
+    def nbytes(self):
+        return sum(sys.getsizeof(row) + sum(center.nbytes for center in row) for row in self.centers_iter) \
+            + sys.getsizeof(self.objective_values) + 24 * len(self.objective_values)
+
+
+def main():
+    rng = np.random.default_rng(0)
+    dimensions = rng.uniform(0.4, 1.2, (N_BOXES, 3))
+    init_centers = prepack(dimensions, R_CYL, H_CYL)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "layout.telemetry")
+        loggers = {
+            "no logging": None,
+            "per-center lists": ListLogger(),
+            "telemetry (every 1)": SolverTelemetry(capacity=1024),
+            "telemetry (every 10, streamed)": SolverTelemetry(capacity=64, every=10, path=path, flush_rows=32),
+        }
+        print(f"{N_BOXES} boxes")
+        print(f"{'logging':<32}{'iters':>6}{'solve [s]':>11}{'callback [s]':>14}{'samples':>9}{'memory [kB]':>13}")
+        for label, logger in loggers.items():
+            result = solve_layout(dimensions, R_CYL, H_CYL, init_centers, **OPTIONS, telemetry=logger)
+            splits = timing_splits(result["problem"])
+            if isinstance(logger, SolverTelemetry):
+                logger.close()
+                samples, memory = logger.count, logger.buffer.nbytes
+            elif logger is not None:
+                samples, memory = len(logger.objective_values), logger.nbytes()
+            else:
+                samples, memory = 0, 0
+            print(f"{label:<32}{result['iterations']:>6}{splits['total']:>11.3f}{splits['callback_fun']:>14.3f}"
+                  f"{samples:>9}{memory / 1024:>13.1f}")
+
+        streamed = load_telemetry(path)
+        print(f"\nstreamed file: {len(streamed['objective'])} samples, final objective {streamed['objective'][-1]:.4f}")
+
+    print("\nWhere the solve time goes (last run):")
+    for name, value in sorted(splits.items(), key=lambda item: -item[1]):
+        if name != "total":
+            print(f"  {name:<14}{value:>8.3f} s  ({value / splits['total'] * 100:4.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
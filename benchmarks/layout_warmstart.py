@@ -0,0 +1,70 @@
+import tempfile
+
+import numpy as np
+
+from optimization.layout import solve_layout
+from optimization.prepack import prepack
+from optimization.warmstart import LayoutCache
+
+# Warm-start cache (optimization/warmstart.py) over a simulated design-iteration session:
+# every step resizes, adds or removes one box of the current design, or goes back to an
+# earlier design. Each step is solved cold (from the greedy pre-packer) and through the cache.
+# Run from the repository root with: python -m benchmarks.layout_warmstart
+
+R_CYL, H_CYL = 5, 20
+N_BOXES = 40
+N_STEPS = 16
+OPTIONS = {"objective": "dispersion", "separation": "softmax", "broad_phase": True}
+
+
+def design_session(seed=0):
+    """List of (edit, dimensions) of a design-iteration session."""
+    rng = np.random.default_rng(seed)
+    dimensions = rng.uniform(0.4, 1.2, (N_BOXES, 3))
+    designs = [("initial", dimensions)]
+    for step in range(1, N_STEPS):
+        edit = ("resize", "resize", "add", "remove", "revert")[step % 5]
+        if edit == "resize":
+            dimensions = dimensions.copy()
+            dimensions[rng.integers(len(dimensions))] *= rng.uniform(0.85, 1.15)
+        elif edit == "add":
+            dimensions = np.vstack([dimensions, rng.uniform(0.4, 1.2, (1, 3))])
+        elif edit == "remove":
+            dimensions = np.delete(dimensions, rng.integers(len(dimensions)), axis=0)
+        else:
+            dimensions = designs[rng.integers(len(designs))][1]
+        designs.append((edit, dimensions))
+    return designs
+
+
+def main():
+    with tempfile.TemporaryDirectory() as path:
+        cache = LayoutCache(path, max_entries=8)
+        totals = {"cold": [0, 0.0], "cached": [0, 0.0]}
+        print(f"{'step':>4}  {'edit':<8}{'n':>4}  {'cache':<8}{'cold iters':>11}{'cached iters':>13}"
+              f"{'cold [s]':>10}{'cached [s]':>11}")
+        for step, (edit, dimensions) in enumerate(design_session()):
+            init_centers = prepack(dimensions, R_CYL, H_CYL)
+            cold = solve_layout(dimensions, R_CYL, H_CYL, init_centers, **OPTIONS)
+            cached = cache.solve(dimensions, R_CYL, H_CYL, init_centers, **OPTIONS)
+            cached_time = cached.get("wall_time", 0.0)
+            for label, result, elapsed in (("cold", cold, cold["wall_time"]), ("cached", cached, cached_time)):
+                totals[label][0] += result["iterations"]
+                totals[label][1] += elapsed
+            print(f"{step:>4}  {edit:<8}{len(dimensions):>4}  {cached['cache']:<8}{cold['iterations']:>11}"
+                  f"{cached['iterations']:>13}{cold['wall_time']:>10.2f}{cached_time:>11.2f}")
+
+        stats = cache.stats()
+        print(f"\nhit rate {stats['hit_rate']*100:.0f}% ({stats['exact']} exact, {stats['nearest']} nearest, "
+              f"{stats['miss']} misses), {stats['entries']} entries kept")
+        print(f"IPOPT iterations: {totals['cold'][0]} cold, {totals['cached'][0]} cached "
+              f"({(1 - totals['cached'][0] / totals['cold'][0])*100:.0f}% saved); "
+              f"solve time {totals['cold'][1]:.1f} s cold, {totals['cached'][1]:.1f} s cached")
+
+        # The cache persists: a new instance finds the last design
+        kind, _, _ = LayoutCache(path).lookup(dimensions, R_CYL, H_CYL, **OPTIONS)
+        print(f"last design after reopening the cache: {kind}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+import math
+import time
+
+import numpy as np
+
+from mission import X37B_MISSION, phase_propellant
+from propulsion_analysis_no_ascent import g
+
+# Throughput of the multi-phase delta-V budget engine (mission.py) over mission variants.
+# Run from the repository root with: python -m benchmarks.mission_budget_batch
+#
+# Every phase's delta-V, Isp and reserve factor of the X-37B mission is perturbed by +/-10%.
+# The vectorized cumulative-mass chain is compared against a per-variant Python loop.
+
+N_VARIANTS = 1_000_000
+N_LOOP = 20_000
+
+
+def chain_loop(phases, W_final):
+    """Reference cumulative-mass chain for one variant (plain Python)."""
+    growth = [math.exp(deltaV / (Isp * g)) for _, _, deltaV, Isp, _ in phases]
+    after, factors = 1.0, []
+    for k in reversed(range(len(phases))):
+        factors.append(after * (growth[k] - 1))
+        after *= growth[k]
+    factors.reverse()
+    M_end = W_final / (1 - sum((phase[4] - 1) * f for phase, f in zip(phases, factors)))
+    return sum(phase[4] * M_end * f for phase, f in zip(phases, factors))
+
+
+def main():
+    rng = np.random.default_rng(0)
+    phases = [(name, engine, deltaV * rng.uniform(0.9, 1.1, N_VARIANTS), Isp * rng.uniform(0.9, 1.1, N_VARIANTS),
+               1 + (reserve - 1) * rng.uniform(0.9, 1.1, N_VARIANTS))
+              for name, engine, deltaV, Isp, reserve in X37B_MISSION["phases"]]
+    W_final = X37B_MISSION["W_final"]
+
+    start = time.perf_counter()
+    budget = phase_propellant(phases, W_final)
+    vectorized = time.perf_counter() - start
+
+    start = time.perf_counter()
+    reference = [chain_loop([(name, engine, dv[i], isp[i], rf[i]) for name, engine, dv, isp, rf in phases], W_final)
+                 for i in range(N_LOOP)]
+    loop = (time.perf_counter() - start) * N_VARIANTS / N_LOOP
+
+    error = np.abs(budget["W_prop"][:N_LOOP] - reference).max()
+    print(f"{N_VARIANTS} mission variants, {len(phases)} phases:")
+    print(f"  vectorized chain: {vectorized*1e3:8.1f} ms ({N_VARIANTS/vectorized:,.0f} variants/s)")
+    print(f"  Python loop:      {loop*1e3:8.1f} ms (extrapolated from {N_LOOP} variants)")
+    print(f"  speedup {loop/vectorized:.0f}x, max |W_prop| difference {error:.2e} lbs")
+    print(f"  W_prop range {budget['W_prop'].min():.1f} .. {budget['W_prop'].max():.1f} lbs")
+
+
+if __name__ == "__main__":
+    main()
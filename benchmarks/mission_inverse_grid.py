@@ -0,0 +1,44 @@
+import time
+
+import numpy as np
+
+from hasa import x37b
+from mission import ORBIT_KEEPING_RATE, X37B_MISSION, max_duration, phase_propellant, tank_capacity
+
+# Inverse propulsion solver (mission.py): longest mission for fixed tank volumes over a grid of
+# OMS Isp x mixture ratio x OMS tank volume.
+# Run from the repository root with: python -m benchmarks.mission_inverse_grid
+#
+# Only the orbit-keeping phase scales with the duration (closed form), then orbit keeping on both
+# OMS and RCS (batched root-finding). Both are checked by running the forward budget at the result.
+
+GRID = {"Isp_oms": np.linspace(250, 350, 100), "mixture_ratio": np.linspace(4, 7, 50), "V_oms_tnk": np.linspace(50, 300, 200)}
+RCS_ORBIT_RATE = 200 / 365  # fps per day, if the RCS orbit budget also scaled with the duration
+
+
+def main():
+    Isp, MR, V = np.meshgrid(*GRID.values(), indexing="ij", sparse=True)
+    phases = [(name, engine, deltaV, Isp if engine == "OMS" else I, reserve)
+              for name, engine, deltaV, I, reserve in X37B_MISSION["phases"]]
+    capacity = {"OMS": tank_capacity(V, MR), "RCS": tank_capacity(1.5 * x37b.V_rcs_tnk)}
+    W_final = X37B_MISSION["W_final"]
+    n = Isp.size * MR.size * V.size
+
+    for label, rates in (("closed form (OMS orbit keeping)", {0: ORBIT_KEEPING_RATE}),
+                         ("root-finding (OMS + RCS orbit keeping)", {0: ORBIT_KEEPING_RATE, 1: RCS_ORBIT_RATE})):
+        start = time.perf_counter()
+        days = max_duration(phases, rates, capacity, W_final)
+        elapsed = time.perf_counter() - start
+
+        table = [(name, engine, rates[k] * days if k in rates else deltaV, I, reserve)
+                 for k, (name, engine, deltaV, I, reserve) in enumerate(phases)]
+        with np.errstate(invalid="ignore"):
+            engines = phase_propellant(table, W_final)["engines"]
+        margin = np.minimum(*(1 - engines[engine] / capacity[engine] for engine in capacity))
+        print(f"{label}: {n} grid points in {elapsed*1e3:.1f} ms, "
+              f"{np.isnan(days).mean()*100:.1f}% infeasible, days {np.nanmin(days):.1f} .. {np.nanmax(days):.1f}, "
+              f"max |tank margin| at the result {np.nanmax(np.abs(margin)):.1e}")
+
+
+if __name__ == "__main__":
+    main()
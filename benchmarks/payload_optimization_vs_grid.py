@@ -0,0 +1,46 @@
+import itertools
+import time
+
+import numpy
+
+from hasa.x37b import x37b_inputs
+from optimization.payload_optimization import DESIGN_VARIABLES, optimize_payload, payload_model
+
+# Gradient-based payload maximization (optimization/payload_optimization.py) against a
+# brute-force full-factorial grid sweep of the same design variables.
+# Run from the repository root with: python -m benchmarks.payload_optimization_vs_grid
+
+GRID_LEVELS = (4, 6, 8)  # Levels per design variable
+CHUNK = 200_000
+
+
+def grid_search(levels):
+    """Best feasible grid point, number of evaluations and wall time."""
+    start = time.perf_counter()
+    base = x37b_inputs()
+    axes = [numpy.linspace(lower, upper, levels) for _, lower, upper in DESIGN_VARIABLES.values()]
+    points = numpy.array(list(itertools.product(*axes)))
+    best, best_payload = None, -numpy.inf
+    for i in range(0, len(points), CHUNK):
+        chunk = points[i:i + CHUNK]
+        design = dict(zip(DESIGN_VARIABLES, chunk.T))
+        w = payload_model(design, base, xp=numpy)
+        payload = numpy.where(w["volume_margin"] >= 0, w["W_allow_payload"], -numpy.inf)
+        j = int(numpy.argmax(payload))
+        if payload[j] > best_payload:
+            best, best_payload = chunk[j], payload[j]
+    return best_payload, len(points), time.perf_counter() - start
+
+
+def main():
+    result = optimize_payload()
+    print(f"asb.Opti (IPOPT): {result['W_allow_payload']:.2f} lbs, {result['iterations']} iterations, "
+          f"{result['evaluations']} objective evaluations, {result['wall_time']*1e3:.0f} ms")
+    for levels in GRID_LEVELS:
+        payload, evaluations, wall_time = grid_search(levels)
+        print(f"Grid {levels}^{len(DESIGN_VARIABLES)}: {payload:.2f} lbs, {evaluations} evaluations, "
+              f"{wall_time*1e3:.0f} ms (gap to optimum {result['W_allow_payload'] - payload:.2f} lbs)")
+
+
+if __name__ == "__main__":
+    main()
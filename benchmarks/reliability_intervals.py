@@ -0,0 +1,50 @@
+import time
+
+import numpy as np
+import scipy.stats as stats
+
+from reliability import METHODS, IntervalCache, binomial_interval
+
+# Batched binomial intervals (reliability.intervals) against one scipy call per record.
+# Run from the repository root with: python -m benchmarks.reliability_intervals
+#
+# A synthetic launch database of N_RECORDS (n, k) records (many repeated pairs) is evaluated with
+# every method, then refreshed through an IntervalCache with 1% new records.
+
+N_RECORDS = 50_000
+N_LOOP = 2_000
+
+
+def main():
+    rng = np.random.default_rng(0)
+    n = rng.integers(1, 400, N_RECORDS)
+    k = rng.binomial(n, rng.uniform(0.85, 1.0, N_RECORDS))
+    print(f"{N_RECORDS} records, {np.unique(n * 1000 + k).size} unique (n, k) pairs")
+
+    for method in METHODS:
+        start = time.perf_counter()
+        binomial_interval(k, n, method)
+        print(f"  {method:>15}: {(time.perf_counter() - start)*1e3:7.1f} ms")
+
+    start = time.perf_counter()
+    reference = np.array([(stats.beta.ppf(0.025, kk, nn - kk + 1) if kk > 0 else 0.0,
+                           stats.beta.ppf(0.975, kk + 1, nn - kk) if kk < nn else 1.0)
+                          for kk, nn in zip(k[:N_LOOP], n[:N_LOOP])])
+    loop = (time.perf_counter() - start) * N_RECORDS / N_LOOP
+    lower, upper = binomial_interval(k[:N_LOOP], n[:N_LOOP])
+    error = np.abs(reference - np.column_stack([lower, upper])).max()
+    print(f"  scipy.stats.beta.ppf per record: {loop*1e3:7.1f} ms (extrapolated), max difference {error:.1e}")
+
+    cache = IntervalCache()
+    cache.interval(k, n)
+    n_new = N_RECORDS // 100
+    n = np.concatenate([n, rng.integers(1, 400, n_new)])
+    k = np.concatenate([k, rng.binomial(n[-n_new:], 0.95)])
+    start = time.perf_counter()
+    cache.interval(k, n)
+    print(f"  cached refresh with {n_new} new records: {(time.perf_counter() - start)*1e3:7.1f} ms "
+          f"({cache.hits} unique pairs reused, {cache.misses} computed in total)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import time
+
+import numpy as np
+from scipy import integrate, stats
+
+from reliability.superiority import posterior_params, prob_greater, superiority_matrix
+
+# Scaling of the all-pairs superiority matrix (reliability.superiority) with the fleet size N.
+# Run from the repository root with: python -m benchmarks.reliability_superiority
+#
+# Synthetic fleet: 1..400 launches per vehicle with success rates of 85-100% and Beta(1, 1) priors.
+# Reported per N: exact sums, exact sums with near-identical posteriors merged (tol = 0.05), and
+# the error against scipy.integrate.quad on a small fleet (one call per pair). The finite sums are
+# also checked against the quadrature on a grid where only one of a1 and b2 is an integer.
+
+FLEET_SIZES = (100, 300, 1000, 3000)
+N_REFERENCE = 12
+TOL = 0.05
+HALF_INTEGER_GRID = np.arange(0.5, 12, 0.5)  # Beta parameters of the exact vs. quadrature check
+
+
+def fleet(n_vehicles, rng):
+    n = rng.integers(1, 400, n_vehicles)
+    k = rng.binomial(n, rng.uniform(0.85, 1.0, n_vehicles))
+    return posterior_params(k, n)
+
+
+def quad_superiority(a, b):
+    """P[i, j] = P(p_j > p_i) with one adaptive quadrature per pair."""
+    P = np.full((a.size, a.size), 0.5)
+    for i in range(a.size):
+        for j in range(a.size):
+            if i != j:
+                P[i, j] = integrate.quad(lambda x: stats.beta.pdf(x, a[i], b[i]) * stats.beta.sf(x, a[j], b[j]),
+                                         0, 1, points=[a[i] / (a[i] + b[i])], limit=200, epsabs=1e-12)[0]
+    return P
+
+
+def main():
+    rng = np.random.default_rng(0)
+    a, b = fleet(N_REFERENCE, rng)
+    start = time.perf_counter()
+    reference = quad_superiority(a, b)
+    quad_time = time.perf_counter() - start
+    error = np.abs(superiority_matrix(a, b) - reference).max()
+    print(f"N = {N_REFERENCE}: scipy quad per pair {quad_time*1e3:.0f} ms, max |exact - quad| {error:.1e}")
+
+    # Every (a1, b1, a2, b2) of the grid with an integer a1 or b2, which the exact sum accepts
+    grid = np.stack(np.meshgrid(*(HALF_INTEGER_GRID,) * 4, indexing="ij"), axis=-1).reshape(-1, 4)
+    grid = grid[(grid[:, 0] % 1 == 0) | (grid[:, 3] % 1 == 0)]
+    error = np.abs(prob_greater(*grid.T, method="exact") - prob_greater(*grid.T, method="quadrature")).max()
+    print(f"{len(grid)} pairs with integer a1 or b2: max |exact - quadrature| {error:.1e}")
+
+    for n_vehicles in FLEET_SIZES:
+        a, b = fleet(n_vehicles, rng)
+        start = time.perf_counter()
+        P = superiority_matrix(a, b)
+        exact = time.perf_counter() - start
+        start = time.perf_counter()
+        merged = superiority_matrix(a, b, tol=TOL)
+        dedup = time.perf_counter() - start
+        n_unique = np.unique(np.column_stack([a, b]), axis=0).shape[0]
+        print(f"N = {n_vehicles:5d} ({n_unique} distinct posteriors): exact {exact*1e3:8.1f} ms, "
+              f"merged (tol={TOL}) {dedup*1e3:8.1f} ms, max difference {np.abs(P - merged).max():.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+import numpy as np
+
+from hasa.model import weight_breakdown as scalar_weight_breakdown
+from hasa.x37b import x37b_inputs
+from sizing import fixed_inputs, size_vehicles
+
+# Convergence cost of the closed-loop HASA + propulsion sizing (sizing.py).
+# Run from the repository root with: python -m benchmarks.sizing_convergence
+#
+# A batch of vehicles around the X-37B (geometry and payload perturbed by +/-10%) is sized with
+# naive fixed-point substitution and with the secant-accelerated iteration.
+
+N_VEHICLES = 100_000
+PERTURBED_INPUTS = ("L_f", "S_btot", "V_tot", "S_ref", "AR", "S_wfh", "S_wfv", "HRSI_area", "FRSI_area")
+
+
+def main():
+    rng = np.random.default_rng(0)
+    base = x37b_inputs()
+    inputs = fixed_inputs(base)
+    for name in PERTURBED_INPUTS:
+        inputs[name] = base[name] * rng.uniform(0.9, 1.1, N_VEHICLES)
+    W_payload = scalar_weight_breakdown(base)["W_allow_payload"] * rng.uniform(0.9, 1.1, N_VEHICLES)
+
+    print(f"Sizing {N_VEHICLES} vehicles:")
+    results = {}
+    for method in ("substitution", "secant"):
+        result, stats = size_vehicles(inputs, W_payload, method=method)
+        results[method] = result
+        print(f"  {method:>12}: max {stats['iterations']} iterations "
+              f"(mean {result['iterations'].mean():.1f}), {stats['evaluations']} vehicle-evaluations, "
+              f"{stats['wall_time']*1e3:.1f} ms, {result['converged'].mean()*100:.1f}% converged")
+
+    diff = np.abs(results["secant"]["W_gtot"] - results["substitution"]["W_gtot"]).max()
+    closure = np.abs(results["secant"]["W_allow_payload"] - W_payload).max()
+    print(f"Max |W_gtot| difference between methods: {diff:.2e} lbs")
+    print(f"Max payload closure error (secant): {closure:.2e} lbs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from hasa.x37b import x37b_inputs
+from surrogate import Surrogate, default_bounds
+from sweep import DEFAULT_OUTPUTS, LatinHypercube, evaluate_points
+
+# Query cost of the HASA + propulsion surrogate (surrogate.py) against the exact coupled model
+# (sweep.evaluate_points): build time and errors for several tolerances, load time of the
+# memory-mapped file, single-point latency (as a slider callback) and batch throughput, and the
+# exact fallback for points outside the validated box.
+# Run from the repository root with: python -m benchmarks.surrogate_queries
+
+TOLERANCES = (1e-3, 1e-5, 1e-7)
+N_SINGLE = 2000
+N_BATCH = 100_000
+
+
+def per_call(function, points):
+    start = time.perf_counter()
+    for point in points:
+        function(point)
+    return (time.perf_counter() - start) / len(points)
+
+
+def main():
+    base = x37b_inputs()
+    bounds = default_bounds()
+    names = tuple(bounds)
+    rng = np.random.default_rng(0)
+    test = LatinHypercube(bounds, N_BATCH, seed=1).points(0, N_BATCH)
+    exact = evaluate_points(test, base, DEFAULT_OUTPUTS)
+
+    print(f"{len(names)} inputs ({', '.join(names)}) within +/-15% of the X-37B, {len(DEFAULT_OUTPUTS)} outputs")
+    print(f"{'tol':>8}{'degree':>8}{'terms':>7}{'build [s]':>11}{'file [kB]':>11}{'load [ms]':>11}"
+          f"{'max rel. error (validation)':>29}{'(independent test)':>20}")
+    with tempfile.TemporaryDirectory() as directory:
+        for tol in TOLERANCES:
+            start = time.perf_counter()
+            surrogate = Surrogate.build(bounds, tol=tol)
+            build = time.perf_counter() - start
+            path = os.path.join(directory, f"surrogate_{tol:g}.npy")
+            surrogate.save(path)
+            start = time.perf_counter()
+            surrogate = Surrogate.load(path)
+            load = (time.perf_counter() - start) * 1e3
+            approx = surrogate.evaluate(np.column_stack([test[name] for name in names]))
+            test_error = max(np.abs(approx[k] - exact[name]).max() / np.ptp(exact[name])
+                             for k, name in enumerate(DEFAULT_OUTPUTS))
+            validation_error = max(error["relative"] for error in surrogate.errors.values())
+            print(f"{tol:>8.0e}{surrogate.degree:>8}{len(surrogate.terms):>7}{build:>11.2f}{os.path.getsize(path) / 1024:>11.1f}{load:>11.2f}"
+                  f"{validation_error:>29.1e}{test_error:>20.1e}")
+
+        surrogate = Surrogate.load(os.path.join(directory, f"surrogate_{TOLERANCES[1]:g}.npy"))
+        rows = np.column_stack([test[name] for name in names])[:N_SINGLE]
+        dicts = [dict(zip(names, row)) for row in rows]
+        print(f"\nSingle-point queries (tol {TOLERANCES[1]:g}, mean of {N_SINGLE})")
+        print(f"  exact model (evaluate_points)        {per_call(lambda p: evaluate_points(p, base, DEFAULT_OUTPUTS), dicts) * 1e6:9.1f} us")
+        print(f"  surrogate, dict query with fallback  {per_call(surrogate, dicts) * 1e6:9.1f} us")
+        print(f"  surrogate, array query (evaluate)    {per_call(surrogate.evaluate, rows) * 1e6:9.1f} us")
+
+        x = np.column_stack([test[name] for name in names])
+        start = time.perf_counter()
+        evaluate_points(test, base, DEFAULT_OUTPUTS)
+        exact_batch = time.perf_counter() - start
+        start = time.perf_counter()
+        surrogate.evaluate(x)
+        surrogate_batch = time.perf_counter() - start
+        print(f"\nBatch of {N_BATCH}: exact {exact_batch * 1e3:.1f} ms, surrogate {surrogate_batch * 1e3:.1f} ms")
+
+        outside = {name: test[name][:N_SINGLE] * rng.choice([1.0, 1.3], N_SINGLE) for name in names}
+        result = surrogate(outside)
+        check = evaluate_points(outside, base, DEFAULT_OUTPUTS)
+        error = max(np.abs(result[name] - check[name]).max() / np.ptp(exact[name]) for name in DEFAULT_OUTPUTS)
+        print(f"Mixed query: {result['exact'].sum()} of {N_SINGLE} points outside the box evaluated exactly, "
+              f"max rel. error {error:.1e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+# Modified Hypersonic Aerospace Sizing Analysis (HASA) weight model.
+# Importing the package does no work: it only defines the scalar weight functions.
+# The X-37B case is run with `python -m hasa`; the batched engine is in hasa.vectorized
+# (imported separately so that `import hasa` does not pull in NumPy).
+
+from hasa.weights import (
+    fuselage_weight_func, wing_weight_func, horizontal_stabilizer_weight_func,
+    vertical_stabilizer_weight_func, tps_weight_func, landing_gear_weight_func,
+    structure_weight_func, oms_engine_weight_func, oms_pressurization_weight_func,
+    oms_installation_weight_func, total_oms_weight_func, rcs_thruster_weight_func,
+    rcs_pressurization_weight_func, rcs_installation_weight_func, total_rcs_weight_func,
+    total_engine_weight_func, tank_weight_func, total_tank_weight_func,
+    total_propulsion_weight_func, surface_control_actuators_weight_func, avionics_weight_func,
+    electrical_weight_func, total_weight_without_payload_func,
+)
+from hasa.model import INPUT_NAMES, DEFAULT_INPUTS, OUTPUT_NAMES, weight_breakdown
+from hasa.x37b import x37b_inputs
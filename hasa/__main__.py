@@ -0,0 +1,78 @@
+import argparse
+
+from hasa.model import weight_breakdown
+from hasa.x37b import x37b_inputs
+
+# Command line entry point: runs the X-37B case and prints the weight build-up.
+# Usage: python -m hasa [--lbs]
+
+LB_TO_KG = 0.45359237
+
+
+def print_weights(w, unit="kg"):
+    """Prints the weight build-up returned by hasa.model.weight_breakdown."""
+    scale = LB_TO_KG if unit == "kg" else 1.0
+
+    def line(label, name):
+        print(f"{label} in {unit}: {w[name]*scale:.2f} {unit}")
+
+    line("Fuselage Weight", "W_f")
+    line("Wing Weight", "W_w")
+    print(f"Total Tail Wing Weight in {unit}: {(w['W_finh']*scale + w['W_finv']*scale):.2f} {unit}")
+    line("TPS Weight", "W_tps")
+    line("Landing Gear Weight", "W_gear")
+    print("")
+    line("Total Structure Weight", "W_str")
+    print("")
+
+    line("Surface Actuators Weight", "W_sca")
+    line("Avionics Weight", "W_tavcs")
+    line("Electrical System Weight", "W_eps")
+    line("Total Subsystem Weight", "W_sub")
+    print("")
+
+    line("OMS Engine Weight", "W_oms_eng")
+    line("OMS Pressurization Weight", "W_oms_press")
+    line("OMS Installation Weight", "W_oms_install")
+    line("Total OMS Weight", "W_oms")
+    print("")
+
+    line("RCS Pressurization Weight", "W_rcs_press")
+    line("RCS Installation Weight", "W_rcs_install")
+    line("Total RCS Weight", "W_rcs")
+    print("")
+
+    line("Total Engine Weight", "W_eng")
+    print("")
+
+    line("OMS Tank Weight", "W_oms_tnk")
+    line("RCS Tank Weight", "W_rcs_tnk")
+    line("Total Tank Weight", "W_tnk")
+    print("")
+
+    line("Total Propulsion Weight", "W_pros")
+    print("")
+
+    line("Total Weight WITHOUT Payload", "W_gtot_without_payload")
+    line("Allowable Payload", "W_allow_payload")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m hasa", description="Modified HASA weight analysis of the X-37B.")
+    parser.add_argument("--lbs", action="store_true", help="print weights in lbs instead of kg")
+    args = parser.parse_args(argv)
+
+    print("")
+    print("MODIFIED HASA TEST by 박준규 (SMS)")
+    print("For the most updated version of the source code, refer to https://github.com/junekyoopark/ReUSV")
+    print("ORIGINAL HASA: https://ntrs.nasa.gov/api/citations/19890005736/downloads/19890005736.pdf")
+    print("Modified HASA: https://s-space.snu.ac.kr/handle/10371/196316")
+    print("X-37B dimensions are used; if certain dimensions aren't available online,")
+    print("they are estimated from a fairly accurate CAD model.")
+    print("")
+
+    print_weights(weight_breakdown(x37b_inputs()), unit="lbs" if args.lbs else "kg")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+from numbers import Number
+
+from hasa.model import INPUT_NAMES, check_inputs
+from hasa.weights import (
+    fuselage_weight_func, wing_weight_func, horizontal_stabilizer_weight_func,
+    vertical_stabilizer_weight_func, tps_weight_func, landing_gear_weight_func,
+    structure_weight_func, oms_engine_weight_func, oms_pressurization_weight_func,
+    oms_installation_weight_func, total_oms_weight_func, rcs_thruster_weight_func,
+    rcs_pressurization_weight_func, rcs_installation_weight_func, total_rcs_weight_func,
+    total_engine_weight_func, tank_weight_func, total_propulsion_weight_func,
+    surface_control_actuators_weight_func, avionics_weight_func, electrical_weight_func,
+    total_weight_without_payload_func,
+)
+
+# HASA weight build-up as an explicit dependency graph with memoized node values.
+# Changing an input only marks the nodes downstream of it as dirty; reading a node
+# re-evaluates just the dirty nodes it depends on. Per-node recompute counts show how
+# much work an edit actually caused.
+
+# Computed nodes: name -> (function, names of the nodes/inputs it depends on)
+NODES = {
+    # Structure
+    "W_f": (fuselage_weight_func, ("L_f", "ULF", "q_max", "S_btot", "V_tot", "mf", "eta_vol")),
+    "W_w": (wing_weight_func, ("W_gtot", "W_prop", "ULF", "S_ref", "AR", "taper_ratio", "t_c", "sweep_angle", "mf")),
+    "W_finh": (horizontal_stabilizer_weight_func, ("W_gtot", "S_ref", "S_wfh", "q_max")),
+    "W_finv": (vertical_stabilizer_weight_func, ("S_wfv",)),
+    "W_tps": (tps_weight_func, ("W_ins", "HRSI_area", "RCC_area", "FRSI_area")),
+    "W_gear": (landing_gear_weight_func, ("W_gtot", "fuel_residual", "W_prop")),
+    "W_str": (structure_weight_func, ("W_f", "W_w", "W_finh", "W_finv", "W_tps", "W_gear")),
+    # Subsystems
+    "W_sca": (surface_control_actuators_weight_func, ("W_entry",)),
+    "W_tavcs": (avionics_weight_func, ("W_gtot", "avionics_factor")),
+    "W_eps": (electrical_weight_func, ("W_gtot", "L_f")),
+    "W_sub": (lambda W_sca, W_tavcs, W_eps: W_sca + W_tavcs + W_eps, ("W_sca", "W_tavcs", "W_eps")),
+    # OMS
+    "W_oms_eng": (oms_engine_weight_func, ("T_req_oms", "R_oms")),
+    "W_oms_press": (oms_pressurization_weight_func, ("P_oms_press", "V_oms_press", "V_oms_ox", "V_oms_fuel", "TRF")),
+    "W_oms_install": (oms_installation_weight_func, ("W_oms_eng",)),
+    "W_oms": (total_oms_weight_func, ("W_oms_eng", "W_oms_install", "W_oms_press")),
+    # RCS
+    "W_rcs_pf": (rcs_thruster_weight_func, ("N_pf", "T_req_qp", "R_p")),
+    "W_rcs_vf": (rcs_thruster_weight_func, ("N_vf", "T_req_qv", "R_v")),
+    "W_rcs_pa": (rcs_thruster_weight_func, ("N_pa", "T_req_qp", "R_p")),
+    "W_rcs_va": (rcs_thruster_weight_func, ("N_va", "T_req_qv", "R_v")),
+    "W_rcs_thrusters": (lambda *W: list(W), ("W_rcs_pf", "W_rcs_vf", "W_rcs_pa", "W_rcs_va")),
+    "W_rcs_press": (rcs_pressurization_weight_func, ("P_rcs_press", "V_rcs_press", "V_rcs_ox", "V_rcs_fuel", "TRF")),
+    "W_rcs_install": (rcs_installation_weight_func, ("W_rcs_thrusters",)),
+    "W_rcs": (total_rcs_weight_func, ("W_rcs_thrusters", "W_rcs_install", "W_rcs_press")),
+    # Engines, tanks and propulsion
+    "W_eng": (total_engine_weight_func, ("W_oms", "W_rcs")),
+    "W_oms_tnk": (tank_weight_func, ("P_oms_tnk", "V_oms_tnk")),
+    "W_rcs_tnk": (tank_weight_func, ("P_rcs_tnk", "V_rcs_tnk")),
+    "W_tnk": (lambda W_oms_tnk, W_rcs_tnk: W_oms_tnk + W_rcs_tnk, ("W_oms_tnk", "W_rcs_tnk")),
+    "W_pros": (total_propulsion_weight_func, ("W_tnk", "W_eng")),
+    # Totals
+    "W_gtot_without_payload": (total_weight_without_payload_func, ("W_str", "W_pros", "W_sub", "W_prop")),
+    "W_allow_payload": (lambda W_gtot, W_gtot_without_payload: W_gtot - W_gtot_without_payload,
+                        ("W_gtot", "W_gtot_without_payload")),
+}
+
+
+class WeightGraph:
+    """
+    Incrementally evaluated HASA weight build-up.
+
+    Example:
+        graph = WeightGraph(x37b_inputs())
+        graph["W_allow_payload"]          # evaluates every node once
+        graph.set(HRSI_area=110)          # only W_tps, W_str, ... become dirty
+        graph["W_allow_payload"]          # re-evaluates 4 nodes
+        graph.recompute_counts            # evaluations per node so far
+    """
+
+    def __init__(self, inputs, nodes=NODES):
+        self.nodes = nodes
+        # Inputs and memoized node values share one dict
+        self.values = check_inputs(inputs)
+        self.dirty = set(nodes)
+        self.recompute_counts = dict.fromkeys(nodes, 0)
+
+        # Reverse edges: name -> computed nodes that use it directly
+        self.dependents = {name: [] for name in (*INPUT_NAMES, *nodes)}
+        for name, (_, deps) in nodes.items():
+            for dep in deps:
+                self.dependents[dep].append(name)
+
+    def set(self, **inputs):
+        """Changes inputs and marks every node downstream of a changed input as dirty."""
+        for name, value in inputs.items():
+            if name not in self.dependents or name in self.nodes:
+                raise KeyError(f"Unknown HASA input: {name}")
+            # (only scalars are compared: == on arrays is elementwise, so array inputs always count as changed)
+            old = self.values[name]
+            if isinstance(old, Number) and isinstance(value, Number) and old == value:
+                continue
+            self.values[name] = value
+            self._mark_dirty(name)
+
+    def _mark_dirty(self, name):
+        stack = list(self.dependents[name])
+        while stack:
+            node = stack.pop()
+            if node not in self.dirty:
+                self.dirty.add(node)
+                stack.extend(self.dependents[node])
+
+    def __getitem__(self, name):
+        """Value of an input or node, re-evaluating dirty upstream nodes first."""
+        if name in self.dirty:
+            self._evaluate(name)
+        return self.values[name]
+
+    def _evaluate(self, name):
+        func, deps = self.nodes[name]
+        for dep in deps:
+            if dep in self.dirty:
+                self._evaluate(dep)
+        values = self.values
+        values[name] = func(*[values[dep] for dep in deps])
+        self.recompute_counts[name] += 1
+        self.dirty.discard(name)
+
+    def evaluate(self, names=None):
+        """Values of the given nodes (default: all computed nodes) as a dict."""
+        return {name: self[name] for name in (self.nodes if names is None else names)}
+
+    def reset_counts(self):
+        """Resets the per-node recompute counts."""
+        self.recompute_counts = dict.fromkeys(self.nodes, 0)
@@ -0,0 +1,134 @@
+import math
+
+from hasa.weights import (
+    fuselage_weight_func, wing_weight_func, horizontal_stabilizer_weight_func,
+    vertical_stabilizer_weight_func, tps_weight_func, landing_gear_weight_func,
+    structure_weight_func, oms_engine_weight_func, oms_pressurization_weight_func,
+    oms_installation_weight_func, total_oms_weight_func, rcs_thruster_weight_func,
+    rcs_pressurization_weight_func, rcs_installation_weight_func, total_rcs_weight_func,
+    total_engine_weight_func, total_tank_weight_func, total_propulsion_weight_func,
+    surface_control_actuators_weight_func, avionics_weight_func, electrical_weight_func,
+    total_weight_without_payload_func,
+)
+
+# Full HASA weight build-up for a single design point, chaining the scalar functions
+# in hasa/weights.py in the same order as the X-37B case.
+
+# Inputs of the weight build-up
+INPUT_NAMES = (
+    # Fuselage
+    "L_f", "ULF", "q_max", "S_btot", "V_tot", "mf", "eta_vol",
+    # Wing
+    "W_gtot", "W_prop", "S_ref", "AR", "taper_ratio", "t_c", "sweep_angle",
+    # Tails
+    "S_wfh", "S_wfv",
+    # TPS
+    "W_ins", "HRSI_area", "RCC_area", "FRSI_area",
+    # Surface control actuators, avionics and landing gear
+    "W_entry", "avionics_factor", "fuel_residual",
+    # OMS
+    "T_req_oms", "R_oms", "P_oms_press", "V_oms_ox", "V_oms_fuel", "V_oms_press", "TRF",
+    # RCS
+    "N_pf", "N_vf", "N_pa", "N_va", "T_req_qp", "T_req_qv", "R_p", "R_v",
+    "P_rcs_press", "V_rcs_ox", "V_rcs_fuel", "V_rcs_press",
+    # Tanks
+    "P_oms_tnk", "V_oms_tnk", "P_rcs_tnk", "V_rcs_tnk",
+)
+_INPUT_SET = frozenset(INPUT_NAMES)
+
+# Inputs that have a default value in the scalar functions
+DEFAULT_INPUTS = {
+    "eta_vol": 0.7,  # fuselage_weight_func
+    "R_oms": 22,     # oms_engine_weight_func
+    "TRF": 0.0,      # oms/rcs_pressurization_weight_func
+    "avionics_factor": 0.69,  # avionics_weight_func (advanced avionics: 69% of original HASA)
+}
+
+# Intermediate and total weights returned by weight_breakdown (all in lbs, except D_be in ft)
+OUTPUT_NAMES = (
+    "D_be", "W_f", "W_w", "W_finh", "W_finv", "W_tps", "W_land", "W_gear", "W_str",
+    "W_sca", "W_tavcs", "W_eps", "W_sub",
+    "W_oms_eng", "W_oms_press", "W_oms_install", "W_oms",
+    "W_rcs_pf", "W_rcs_vf", "W_rcs_pa", "W_rcs_va", "W_rcs_press", "W_rcs_install", "W_rcs",
+    "W_eng", "W_oms_tnk", "W_rcs_tnk", "W_tnk", "W_pros",
+    "W_gtot_without_payload", "W_allow_payload",
+)
+
+
+def check_inputs(inputs):
+    """Fills in the default inputs; raises KeyError for missing or unknown inputs."""
+    missing = [name for name in INPUT_NAMES if name not in inputs and name not in DEFAULT_INPUTS]
+    if missing:
+        raise KeyError(f"Missing HASA inputs: {', '.join(missing)}")
+    unknown = [name for name in inputs if name not in _INPUT_SET]
+    if unknown:
+        raise KeyError(f"Unknown HASA inputs: {', '.join(unknown)}")
+    p = dict(DEFAULT_INPUTS)
+    p.update(inputs)
+    return p
+
+
+def weight_breakdown(inputs):
+    """
+    Evaluate the full HASA weight build-up for one design point.
+
+    Parameters:
+    inputs : dict
+        HASA inputs keyed by the names in INPUT_NAMES (see DEFAULT_INPUTS for the optional ones).
+
+    Returns:
+    dict
+        Every intermediate and total weight in OUTPUT_NAMES.
+    """
+    p = check_inputs(inputs)
+    out = {}
+
+    # Structure
+    out["D_be"] = math.sqrt((4 * p["V_tot"]) / (math.pi * p["L_f"] * p["eta_vol"]))
+    out["W_f"] = fuselage_weight_func(p["L_f"], p["ULF"], p["q_max"], p["S_btot"], p["V_tot"], p["mf"],
+                                      p["eta_vol"])
+    out["W_w"] = wing_weight_func(p["W_gtot"], p["W_prop"], p["ULF"], p["S_ref"], p["AR"], p["taper_ratio"],
+                                  p["t_c"], p["sweep_angle"], p["mf"])
+    out["W_finh"] = horizontal_stabilizer_weight_func(p["W_gtot"], p["S_ref"], p["S_wfh"], p["q_max"])
+    out["W_finv"] = vertical_stabilizer_weight_func(p["S_wfv"])
+    out["W_tps"] = tps_weight_func(p["W_ins"], p["HRSI_area"], p["RCC_area"], p["FRSI_area"])
+    out["W_land"] = p["W_gtot"] - ((1.0 - p["fuel_residual"]) * p["W_prop"])
+    out["W_gear"] = landing_gear_weight_func(p["W_gtot"], p["fuel_residual"], p["W_prop"])
+    out["W_str"] = structure_weight_func(out["W_f"], out["W_w"], out["W_finh"], out["W_finv"], out["W_tps"],
+                                         out["W_gear"])
+
+    # Subsystems
+    out["W_sca"] = surface_control_actuators_weight_func(p["W_entry"])
+    out["W_tavcs"] = avionics_weight_func(p["W_gtot"], p["avionics_factor"])
+    out["W_eps"] = electrical_weight_func(p["W_gtot"], p["L_f"])
+    out["W_sub"] = out["W_sca"] + out["W_tavcs"] + out["W_eps"]
+
+    # OMS
+    out["W_oms_eng"] = oms_engine_weight_func(p["T_req_oms"], p["R_oms"])
+    out["W_oms_press"] = oms_pressurization_weight_func(p["P_oms_press"], p["V_oms_press"], p["V_oms_ox"],
+                                                        p["V_oms_fuel"], p["TRF"])
+    out["W_oms_install"] = oms_installation_weight_func(out["W_oms_eng"])
+    out["W_oms"] = total_oms_weight_func(out["W_oms_eng"], out["W_oms_install"], out["W_oms_press"])
+
+    # RCS
+    out["W_rcs_pf"] = rcs_thruster_weight_func(p["N_pf"], p["T_req_qp"], p["R_p"])
+    out["W_rcs_vf"] = rcs_thruster_weight_func(p["N_vf"], p["T_req_qv"], p["R_v"])
+    out["W_rcs_pa"] = rcs_thruster_weight_func(p["N_pa"], p["T_req_qp"], p["R_p"])
+    out["W_rcs_va"] = rcs_thruster_weight_func(p["N_va"], p["T_req_qv"], p["R_v"])
+    W_rcs_thrusters = [out["W_rcs_pf"], out["W_rcs_vf"], out["W_rcs_pa"], out["W_rcs_va"]]
+    out["W_rcs_press"] = rcs_pressurization_weight_func(p["P_rcs_press"], p["V_rcs_press"], p["V_rcs_ox"],
+                                                        p["V_rcs_fuel"], p["TRF"])
+    out["W_rcs_install"] = rcs_installation_weight_func(W_rcs_thrusters)
+    out["W_rcs"] = total_rcs_weight_func(W_rcs_thrusters, out["W_rcs_install"], out["W_rcs_press"])
+
+    # Engines, tanks and propulsion
+    out["W_eng"] = total_engine_weight_func(out["W_oms"], out["W_rcs"])
+    out["W_oms_tnk"], out["W_rcs_tnk"], out["W_tnk"] = total_tank_weight_func(
+        p["P_oms_tnk"], p["V_oms_tnk"], p["P_rcs_tnk"], p["V_rcs_tnk"])
+    out["W_pros"] = total_propulsion_weight_func(out["W_tnk"], out["W_eng"])
+
+    # Total weight without payload and allowable payload
+    out["W_gtot_without_payload"] = total_weight_without_payload_func(out["W_str"], out["W_pros"], out["W_sub"],
+                                                                      p["W_prop"])
+    out["W_allow_payload"] = p["W_gtot"] - out["W_gtot_without_payload"]
+    return out
@@ -0,0 +1,154 @@
+import numpy as np
+
+from hasa.model import INPUT_NAMES, OUTPUT_NAMES, check_inputs
+from hasa.vectorized import weight_breakdown
+
+# Analytic sensitivities of the HASA weight build-up.
+# The HASA relations and the GATech MERs are closed-form power laws and linear sums, so exact
+# partial derivatives follow from the values themselves: for W = c * prod(x_i ** a_i),
+# dW/dx_i = a_i * W / x_i. Partials are propagated forward through the build-up as sparse
+# dicts {input name: array}, vectorized over a batch of design points.
+
+
+def _scaled(grad, factor):
+    """factor * grad for a sparse gradient dict."""
+    return {name: factor * d for name, d in grad.items()}
+
+
+def _sum(*grads):
+    """Sum of sparse gradient dicts."""
+    total = {}
+    for grad in grads:
+        for name, d in grad.items():
+            total[name] = total[name] + d if name in total else d
+    return total
+
+
+def _power_law(value, p, exponents):
+    """Gradient of value = c * prod(p[x] ** a) given {x: a}."""
+    return {name: a * value / p[name] for name, a in exponents.items()}
+
+
+def weight_partials(inputs):
+    """
+    Values and analytic partial derivatives of every HASA output.
+
+    Parameters:
+    inputs : dict
+        HASA inputs (scalars or broadcast-compatible arrays), as for hasa.vectorized.weight_breakdown.
+
+    Returns:
+    tuple : (values, partials)
+        values is the dict returned by hasa.vectorized.weight_breakdown.
+        partials maps each output name to a dict {input name: dOutput/dInput} holding only the
+        inputs the output depends on (arrays of the broadcast shape of the inputs).
+    """
+    p = {name: np.asarray(value, dtype=np.float64) for name, value in check_inputs(inputs).items()}
+    w = weight_breakdown(p)
+    g = {}
+
+    # Fuselage: W_f = 0.341 mf (L ULF / D_be)^0.15 q^0.16 S^1.05, D_be = sqrt(4 V / (pi L eta))
+    g["D_be"] = _power_law(w["D_be"], p, {"V_tot": 0.5, "L_f": -0.5, "eta_vol": -0.5})
+    g["W_f"] = _power_law(w["W_f"], p, {"mf": 1.0, "L_f": 0.225, "ULF": 0.15, "V_tot": -0.075,
+                                         "eta_vol": 0.075, "q_max": 0.16, "S_btot": 1.05})
+
+    # Wing: W_w = 0.2958 mf (term1 term2 term3 term4)^1.017
+    W_emp = p["W_gtot"] - p["W_prop"]
+    u = np.degrees(p["sweep_angle"])
+    term4 = 0.3 + 0.7 / np.cos(u)
+    dlnterm4 = 0.7 * np.sin(u) / np.cos(u) ** 2 * (180 / np.pi) / term4
+    a = 1.017 * w["W_w"]
+    g["W_w"] = {
+        "mf": w["W_w"] / p["mf"],
+        "W_gtot": a * 0.52 / W_emp,
+        "W_prop": -a * 0.52 / W_emp,
+        "ULF": a * 0.52 / p["ULF"],
+        "S_ref": a * 0.7 / p["S_ref"],
+        "AR": a * 0.47 / p["AR"],
+        "taper_ratio": a * 0.4 / (1 + p["taper_ratio"]),
+        "t_c": -a * 0.4 / p["t_c"],
+        "sweep_angle": a * dlnterm4,
+    }
+
+    # Tails
+    g["W_finh"] = _power_law(w["W_finh"], p, {"W_gtot": 0.6, "S_ref": -0.6, "S_wfh": 1.2, "q_max": 0.8})
+    g["W_finv"] = _power_law(w["W_finv"], p, {"S_wfv": 1.09})
+
+    # TPS and landing gear
+    W_ins = p["W_ins"]
+    g["W_tps"] = {"W_ins": p["HRSI_area"] + p["RCC_area"] + p["FRSI_area"],
+                  "HRSI_area": W_ins, "RCC_area": W_ins, "FRSI_area": W_ins}
+    g["W_land"] = {"W_gtot": np.ones_like(W_ins), "fuel_residual": p["W_prop"], "W_prop": -(1.0 - p["fuel_residual"])}
+    g["W_gear"] = _scaled(g["W_land"], 0.030)
+    g["W_str"] = _sum(g["W_f"], g["W_w"], g["W_finh"], g["W_finv"], g["W_tps"], g["W_gear"])
+
+    # Subsystems
+    g["W_sca"] = {"W_entry": np.full_like(W_ins, 0.0048)}
+    g["W_tavcs"] = _power_law(w["W_tavcs"], p, {"W_gtot": 0.361, "avionics_factor": 1.0})
+    g["W_eps"] = _power_law(w["W_eps"], p, {"W_gtot": 0.5, "L_f": 0.25})
+    g["W_sub"] = _sum(g["W_sca"], g["W_tavcs"], g["W_eps"])
+
+    # OMS
+    g["W_oms_eng"] = _power_law(w["W_oms_eng"], p, {"T_req_oms": 1.0, "R_oms": -1.0})
+    for system in ("oms", "rcs"):
+        P, V = p[f"P_{system}_press"], p[f"V_{system}_press"]
+        g[f"W_{system}_press"] = {
+            f"P_{system}_press": 0.0143 * V * (1 - p["TRF"]),
+            f"V_{system}_press": 0.0143 * P * (1 - p["TRF"]),
+            "TRF": -0.0143 * P * V,
+            f"V_{system}_ox": np.full_like(P, 0.617),
+            f"V_{system}_fuel": np.full_like(P, 0.617),
+        }
+    g["W_oms_install"] = _scaled(g["W_oms_eng"], 0.74)
+    g["W_oms"] = _sum(g["W_oms_eng"], g["W_oms_install"], g["W_oms_press"])
+
+    # RCS
+    for name, N, T, R in (("W_rcs_pf", "N_pf", "T_req_qp", "R_p"), ("W_rcs_vf", "N_vf", "T_req_qv", "R_v"),
+                          ("W_rcs_pa", "N_pa", "T_req_qp", "R_p"), ("W_rcs_va", "N_va", "T_req_qv", "R_v")):
+        g[name] = {N: p[T] / p[R], T: p[N] / p[R], R: -p[N] * p[T] / p[R] ** 2}
+    g_thrusters = _sum(g["W_rcs_pf"], g["W_rcs_vf"], g["W_rcs_pa"], g["W_rcs_va"])
+    g["W_rcs_install"] = _scaled(g_thrusters, 0.74)
+    g["W_rcs"] = _sum(g_thrusters, g["W_rcs_install"], g["W_rcs_press"])
+
+    # Engines, tanks and propulsion
+    g["W_eng"] = _sum(g["W_oms"], g["W_rcs"])
+    g["W_oms_tnk"] = {"P_oms_tnk": 0.01295 * p["V_oms_tnk"], "V_oms_tnk": 0.01295 * p["P_oms_tnk"]}
+    g["W_rcs_tnk"] = {"P_rcs_tnk": 0.01295 * p["V_rcs_tnk"], "V_rcs_tnk": 0.01295 * p["P_rcs_tnk"]}
+    g["W_tnk"] = _sum(g["W_oms_tnk"], g["W_rcs_tnk"])
+    g["W_pros"] = _sum(g["W_tnk"], g["W_eng"])
+
+    # Totals
+    g["W_gtot_without_payload"] = _sum(g["W_str"], g["W_pros"], g["W_sub"], {"W_prop": np.ones_like(W_ins)})
+    g["W_allow_payload"] = _sum({"W_gtot": np.ones_like(W_ins)}, _scaled(g["W_gtot_without_payload"], -1.0))
+
+    shape = w["W_allow_payload"].shape
+    partials = {out: {name: np.broadcast_to(d, shape) for name, d in g[out].items()} for out in OUTPUT_NAMES}
+    return w, partials
+
+
+def jacobian(inputs, outputs=OUTPUT_NAMES, wrt=INPUT_NAMES):
+    """
+    Dense Jacobian of the HASA outputs with respect to the inputs.
+
+    Parameters:
+    inputs : dict
+        HASA inputs (scalars or broadcast-compatible arrays).
+    outputs : tuple
+        Output names (rows), default: all outputs.
+    wrt : tuple
+        Input names (columns), default: all inputs.
+
+    Returns:
+    ndarray
+        Array of shape batch_shape + (len(outputs), len(wrt)); memory grows with the product
+        of the three, so restrict outputs/wrt for very large batches.
+    """
+    _, partials = weight_partials(inputs)
+    shape = partials["W_allow_payload"]["W_gtot"].shape
+    J = np.zeros(shape + (len(outputs), len(wrt)))
+    columns = {name: j for j, name in enumerate(wrt)}
+    for i, out in enumerate(outputs):
+        for name, d in partials[out].items():
+            if name in columns:
+                J[..., i, columns[name]] = d
+    return J
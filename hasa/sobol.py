@@ -0,0 +1,226 @@
+import argparse
+import os
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from hasa.uncertainty import X37B_UNCERTAINTY, sample_inputs
+from hasa.vectorized import weight_breakdown
+from hasa.x37b import x37b_inputs
+
+# Variance-based (Sobol) global sensitivity analysis of the HASA weight build-up.
+# Two independent sample matrices A and B of the uncertain inputs are drawn, and the model is
+# evaluated on A, on B and on every A_B^i (A with column i taken from B): N (d + 2) evaluations
+# for N base samples and d inputs. First-order and total indices use the Saltelli (2010) and
+# Jansen (1999) estimators
+#   S_i  = mean(f(B) (f(A_B^i) - f(A))) / V,   ST_i = mean((f(A) - f(A_B^i))^2) / (2 V),
+# with V the variance of f over A and B.
+#
+# As in hasa/uncertainty.py, samples are processed in chunks across a process pool and every chunk
+# is reduced to sums that are merged in the parent, so memory depends on the chunk size and not on
+# N or on the number of evaluations. Confidence intervals come from a Poisson bootstrap: each
+# replicate weights every base sample with a Poisson(1) count, which is accumulated chunk by chunk
+# like the sums themselves. Every chunk has its own child of np.random.SeedSequence(seed), so
+# results are reproducible and independent of the number of worker processes.
+# Usage: python -m hasa.sobol [--samples N] [--chunk-size N] [--workers N] [--bootstrap N] [--all-inputs]
+
+# Inputs with little confidence in the X-37B case: the X37B_UNCERTAINTY distributions plus the
+# structural design parameters and the avionics reduction factor (1.0 is the original HASA).
+X37B_SOBOL = {
+    **X37B_UNCERTAINTY,
+    "q_max": ("uniform", 250.0, 400.0),          # psf, typical RLV range
+    "ULF": ("uniform", 3.0, 4.5),                # ultimate load factor
+    "mf": ("uniform", 1.0, 1.25),                # mass factor
+    "eta_vol": ("uniform", 0.6, 0.8),            # usable fraction of the fuselage volume
+    "avionics_factor": ("uniform", 0.55, 1.0),   # advanced avionics reduction
+}
+
+# Outputs for which indices are computed by default
+DEFAULT_OUTPUTS = ("W_str", "W_sub", "W_allow_payload")
+
+BOOTSTRAP_BLOCK = 8192  # Samples per block of Poisson bootstrap weights
+
+
+def uniform_spread(base, names, spread=0.1):
+    """Uniform distributions of +/-spread (relative) around the base values of the given inputs."""
+    return {name: ("uniform", base[name] * (1 - spread), base[name] * (1 + spread)) for name in names}
+
+
+def _run_chunk(base, uncertainty, outputs, shifts, n, n_bootstrap, seed):
+    """
+    Evaluates one chunk of n base samples (n (d + 2) model evaluations) and reduces it to sums
+    (runs in a worker).
+
+    Returns:
+    dict
+        Per output, an array (1 + n_bootstrap, 5 + 2 d) of the sums of
+        [1, f(A), f(B), f(A)^2, f(B)^2, f(B) (f(A_B^i) - f(A)) ..., (f(A) - f(A_B^i))^2 ...];
+        row 0 has unit weights, the other rows Poisson bootstrap weights.
+    """
+    rng = np.random.default_rng(seed)
+    A = sample_inputs(uncertainty, n, rng)
+    B = sample_inputs(uncertainty, n, rng)
+    names = list(uncertainty)
+    d = len(names)
+
+    # Outputs shifted by their nominal value, which keeps the sums of squares well conditioned
+    wA, wB = weight_breakdown({**base, **A}), weight_breakdown({**base, **B})
+    fA = {name: wA[name] - shifts[name] for name in outputs}
+    fB = {name: wB[name] - shifts[name] for name in outputs}
+    del wA, wB
+    terms = {}
+    for name in outputs:
+        terms[name] = np.empty((n, 5 + 2 * d))
+        terms[name][:, 0] = 1.0
+        terms[name][:, 1], terms[name][:, 2] = fA[name], fB[name]
+        terms[name][:, 3], terms[name][:, 4] = fA[name] ** 2, fB[name] ** 2
+    for i, input_name in enumerate(names):
+        wAB = weight_breakdown({**base, **A, input_name: B[input_name]})
+        for name in outputs:
+            fAB = wAB[name] - shifts[name]
+            terms[name][:, 5 + i] = fB[name] * (fAB - fA[name])
+            terms[name][:, 5 + d + i] = (fA[name] - fAB) ** 2
+
+    sums = {name: np.zeros((1 + n_bootstrap, 5 + 2 * d)) for name in outputs}
+    for name in outputs:
+        sums[name][0] = terms[name].sum(axis=0)
+    for start in range(0, n, BOOTSTRAP_BLOCK):
+        stop = min(start + BOOTSTRAP_BLOCK, n)
+        weights = rng.poisson(1.0, (n_bootstrap, stop - start)).astype(np.float64)
+        for name in outputs:
+            sums[name][1:] += weights @ terms[name][start:stop]
+    return sums
+
+
+def indices(sums, d, confidence=0.95):
+    """
+    First-order and total Sobol indices from merged chunk sums (see _run_chunk).
+
+    Returns:
+    dict
+        "first", "total" (d,), their bootstrap percentile intervals "first_ci", "total_ci" (d, 2)
+        and the output "variance".
+    """
+    n = sums[:, 0]
+    mean = (sums[:, 1] + sums[:, 2]) / (2 * n)
+    variance = (sums[:, 3] + sums[:, 4]) / (2 * n) - mean ** 2
+    first = sums[:, 5:5 + d] / n[:, None] / variance[:, None]
+    total = sums[:, 5 + d:5 + 2 * d] / (2 * n[:, None]) / variance[:, None]
+
+    result = {"first": first[0], "total": total[0], "variance": variance[0]}
+    q = [(1 - confidence) / 2, (1 + confidence) / 2]
+    for key, values in (("first_ci", first), ("total_ci", total)):
+        result[key] = np.quantile(values[1:], q, axis=0).T if len(values) > 1 else np.full((d, 2), np.nan)
+    return result
+
+
+def sobol_indices(n_samples, base=None, uncertainty=X37B_SOBOL, outputs=DEFAULT_OUTPUTS, chunk_size=1 << 16,
+                  n_bootstrap=100, confidence=0.95, workers=None, seed=0):
+    """
+    Sobol indices of HASA outputs with respect to uncertain inputs.
+
+    Parameters:
+    n_samples : int
+        Number of base samples N; the model is evaluated N (d + 2) times for d uncertain inputs.
+    base : dict
+        Nominal HASA inputs (default: X-37B); the inputs in uncertainty are replaced by samples.
+    uncertainty : dict
+        Independent distributions of the uncertain inputs (see hasa.uncertainty.sample_inputs).
+    outputs : tuple
+        HASA outputs for which indices are computed.
+    chunk_size : int
+        Base samples per chunk; peak memory scales with chunk_size * (2 d + 5) * len(outputs) * workers.
+    n_bootstrap : int
+        Number of Poisson bootstrap replicates for the confidence intervals (0: no intervals).
+    confidence : float
+        Confidence level of the percentile intervals.
+    workers : int
+        Number of worker processes (default: os.cpu_count()); 1 runs in-process.
+    seed : int
+        Root seed; chunk i uses the i-th child of np.random.SeedSequence(seed).
+
+    Returns:
+    dict
+        Per output, the indices dict of indices() ("first", "total", "first_ci", "total_ci",
+        "variance"), indexed like list(uncertainty).
+    """
+    base = x37b_inputs() if base is None else base
+    workers = workers or os.cpu_count()
+    d = len(uncertainty)
+    n_chunks = -(-n_samples // chunk_size)
+    sizes = [min(chunk_size, n_samples - i * chunk_size) for i in range(n_chunks)]
+    seeds = np.random.SeedSequence(seed).spawn(n_chunks)
+
+    nominal = weight_breakdown(base)
+    shifts = {name: float(nominal[name]) for name in outputs}
+    total = {name: np.zeros((1 + n_bootstrap, 5 + 2 * d)) for name in outputs}
+
+    def merge(sums):
+        for name in outputs:
+            total[name] += sums[name]
+
+    tasks = [(base, uncertainty, outputs, shifts, size, n_bootstrap, s) for size, s in zip(sizes, seeds)]
+    if workers == 1:
+        for task in tasks:
+            merge(_run_chunk(*task))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Keep at most 2 chunks per worker in flight so memory stays flat
+            pending = []
+            for task in tasks:
+                pending.append(pool.submit(_run_chunk, *task))
+                if len(pending) >= 2 * workers:
+                    merge(pending.pop(0).result())
+            for future in pending:
+                merge(future.result())
+    return {name: indices(total[name], d, confidence) for name in outputs}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m hasa.sobol",
+                                     description="Sobol sensitivity indices of the X-37B HASA case.")
+    parser.add_argument("--samples", type=float, default=1e5, help="base samples N (default: 1e5)")
+    parser.add_argument("--chunk-size", type=float, default=2 ** 16, help="base samples per chunk (default: 65536)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--bootstrap", type=int, default=100, help="bootstrap replicates (default: 100)")
+    parser.add_argument("--all-inputs", action="store_true",
+                        help="also vary every other continuous input by +/-10%% (uniform)")
+    parser.add_argument("--output", action="append", help="HASA output (repeatable; default: W_allow_payload)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    uncertainty = dict(X37B_SOBOL)
+    if args.all_inputs:
+        # Thruster counts are integers and sweep_angle enters through cos(degrees(.)) (see
+        # benchmarks/hasa_vectorized_throughput.py); inputs equal to 0 have nothing to spread.
+        base = x37b_inputs()
+        others = [name for name, value in base.items()
+                  if name not in uncertainty and value and name not in ("N_pf", "N_vf", "N_pa", "N_va", "sweep_angle")]
+        uncertainty.update(uniform_spread(base, others))
+    outputs = tuple(args.output or ("W_allow_payload",))
+    n = int(args.samples)
+
+    start = time.perf_counter()
+    results = sobol_indices(n, uncertainty=uncertainty, outputs=outputs, chunk_size=int(args.chunk_size),
+                            n_bootstrap=args.bootstrap, workers=args.workers, seed=args.seed)
+    elapsed = time.perf_counter() - start
+
+    evaluations = n * (len(uncertainty) + 2)
+    print(f"{len(uncertainty)} inputs, {n} base samples, {evaluations} model evaluations in {elapsed:.1f} s "
+          f"({evaluations / elapsed:,.0f} evaluations/s)")
+    for name, result in results.items():
+        print(f"\n{name}: std {np.sqrt(result['variance']):.2f} lbs; 95% bootstrap intervals in brackets")
+        print(f"{'Input':<18}{'first order':>26}{'total':>26}")
+        for i in np.argsort(-result["total"]):
+            first, total = result["first"][i], result["total"][i]
+            (f_lo, f_hi), (t_lo, t_hi) = result["first_ci"][i], result["total_ci"][i]
+            print(f"{list(uncertainty)[i]:<18}{first:>8.4f} [{f_lo:>7.4f}, {f_hi:>7.4f}]"
+                  f"{total:>8.4f} [{t_lo:>7.4f}, {t_hi:>7.4f}]")
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    print(f"\nPeak resident memory of a single process: {peak / 1024:.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
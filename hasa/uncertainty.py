@@ -0,0 +1,222 @@
+import argparse
+import os
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from hasa.vectorized import weight_breakdown
+from hasa.x37b import x37b_inputs
+
+# Streaming Monte Carlo uncertainty propagation through the HASA weight build-up.
+# Uncertain inputs are sampled in chunks; each chunk is pushed through the vectorized model
+# and reduced to running statistics (count, mean, variance, min/max and a fixed-bin histogram
+# for quantiles), which are merged in the parent. Memory therefore depends on the chunk size,
+# not on the number of samples.
+#
+# Every chunk gets its own child of a single np.random.SeedSequence, so results are
+# reproducible and independent of the number of worker processes.
+# Usage: python -m hasa.uncertainty [--samples N] [--chunk-size N] [--workers N] [--seed N]
+
+# Uncertainty on the X-37B inputs that are estimated from the CAD model or guessed.
+# Each entry is (distribution, *parameters) with distribution one of
+# "uniform" (low, high), "normal" (mean, std) or "triangular" (low, mode, high).
+X37B_UNCERTAINTY = {
+    "S_wfh": ("uniform", 20.0, 30.0),           # guestimated horizontal tail area
+    "S_wfv": ("uniform", 20.0, 30.0),           # guestimated vertical tail area
+    "W_ins": ("triangular", 2.0, 3.0, 4.0),     # space shuttle average TPS unit weight
+    "fuel_residual": ("uniform", 0.1, 0.3),     # arbitrary 20% residual fuel
+    "HRSI_area": ("normal", 100.0, 10.0),       # TPS areas estimated from the CAD model
+    "RCC_area": ("normal", 20.0, 2.0),
+    "FRSI_area": ("normal", 119.0, 11.9),
+}
+
+# Outputs for which statistics are accumulated by default
+DEFAULT_OUTPUTS = ("W_tps", "W_str", "W_sub", "W_pros", "W_gtot_without_payload", "W_allow_payload")
+
+N_BINS = 8192  # Histogram bins used for the quantile estimates
+
+
+class RunningStats:
+    """
+    Mergeable running statistics of a stream of values.
+
+    Mean and variance use the parallel update of Chan et al.; quantiles are interpolated
+    from a fixed-bin histogram over [low, high] (values outside fall into under/overflow
+    counters and are still included in the mean, variance, min and max).
+    """
+
+    def __init__(self, low, high, n_bins=N_BINS):
+        self.low, self.high, self.n_bins = float(low), float(high), n_bins
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self.hist = np.zeros(n_bins + 2, dtype=np.int64)  # [underflow, bins..., overflow]
+        self.n_nonfinite = 0
+
+    def update(self, x):
+        """Adds a chunk of values."""
+        x = np.ravel(x)
+        finite = np.isfinite(x)
+        if not finite.all():
+            self.n_nonfinite += int(np.count_nonzero(~finite))
+            x = x[finite]
+        if x.size == 0:
+            return
+        chunk = RunningStats(self.low, self.high, self.n_bins)
+        chunk.count = x.size
+        chunk.mean = float(x.mean())
+        chunk.m2 = float(np.sum((x - chunk.mean) ** 2))
+        chunk.min, chunk.max = float(x.min()), float(x.max())
+        idx = np.floor((x - self.low) * (self.n_bins / (self.high - self.low))).astype(np.int64) + 1
+        np.clip(idx, 0, self.n_bins + 1, out=idx)
+        chunk.hist = np.bincount(idx, minlength=self.n_bins + 2)
+        self.merge(chunk)
+
+    def merge(self, other):
+        """Merges the statistics of another RunningStats over the same histogram range."""
+        self.n_nonfinite += other.n_nonfinite
+        if other.count == 0:
+            return
+        n = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / n
+        self.m2 += other.m2 + delta ** 2 * self.count * other.count / n
+        self.count = n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.hist += other.hist
+
+    @property
+    def variance(self):
+        """Sample variance."""
+        return self.m2 / (self.count - 1) if self.count > 1 else np.nan
+
+    @property
+    def std(self):
+        return np.sqrt(self.variance)
+
+    def quantile(self, q):
+        """Quantile(s) q in [0, 1], linearly interpolated within histogram bins."""
+        q = np.asarray(q, dtype=np.float64)
+        cdf = np.cumsum(self.hist) / self.count
+        edges = np.concatenate(([self.min], np.linspace(self.low, self.high, self.n_bins + 1), [self.max]))
+        # cdf[i] is the fraction of values below the upper edge of bin i (edges[i + 1])
+        cdf = np.concatenate(([0.0], cdf))
+        return np.interp(q, cdf, edges)
+
+
+def sample_inputs(uncertainty, n, rng):
+    """Draws n samples of each uncertain input."""
+    samples = {}
+    for name, (distribution, *params) in uncertainty.items():
+        if distribution == "uniform":
+            samples[name] = rng.uniform(*params, n)
+        elif distribution == "normal":
+            samples[name] = rng.normal(*params, n)
+        elif distribution == "triangular":
+            samples[name] = rng.triangular(*params, n)
+        else:
+            raise ValueError(f"Unknown distribution for {name}: {distribution}")
+    return samples
+
+
+def _run_chunk(base, uncertainty, outputs, ranges, n, seed):
+    """Evaluates one chunk of n samples and reduces it to RunningStats (runs in a worker)."""
+    rng = np.random.default_rng(seed)
+    w = weight_breakdown({**base, **sample_inputs(uncertainty, n, rng)})
+    stats = {}
+    for name in outputs:
+        stats[name] = RunningStats(*ranges[name])
+        stats[name].update(w[name])
+    return stats
+
+
+def propagate(n_samples, base=None, uncertainty=X37B_UNCERTAINTY, outputs=DEFAULT_OUTPUTS, chunk_size=1_000_000,
+              workers=None, seed=0):
+    """
+    Monte Carlo propagation of input uncertainty through the HASA weight build-up.
+
+    Parameters:
+    n_samples : int
+        Total number of samples.
+    base : dict
+        Nominal HASA inputs (default: X-37B); the inputs in uncertainty are replaced by samples.
+    uncertainty : dict
+        Distributions of the uncertain inputs (see X37B_UNCERTAINTY).
+    outputs : tuple
+        HASA outputs for which statistics are accumulated.
+    chunk_size : int
+        Samples per chunk; peak memory scales with chunk_size * workers.
+    workers : int
+        Number of worker processes (default: os.cpu_count()); 1 runs in-process.
+    seed : int
+        Root seed; chunk i uses the i-th child of np.random.SeedSequence(seed).
+
+    Returns:
+    dict
+        RunningStats per output.
+    """
+    base = x37b_inputs() if base is None else base
+    workers = workers or os.cpu_count()
+    n_chunks = -(-n_samples // chunk_size)
+    sizes = [min(chunk_size, n_samples - i * chunk_size) for i in range(n_chunks)]
+    seeds = np.random.SeedSequence(seed).spawn(n_chunks)
+
+    # Histogram ranges from a small pilot run, widened to leave room for the tails
+    pilot = weight_breakdown({**base, **sample_inputs(uncertainty, 10_000, np.random.default_rng(seeds[0]))})
+    ranges = {}
+    for name in outputs:
+        low, high = np.nanmin(pilot[name]), np.nanmax(pilot[name])
+        span = max(high - low, 1e-12 * max(abs(low), 1.0))
+        ranges[name] = (low - span, high + span)
+
+    total = {name: RunningStats(*ranges[name]) for name in outputs}
+    tasks = [(base, uncertainty, outputs, ranges, size, s) for size, s in zip(sizes, seeds)]
+    if workers == 1:
+        for task in tasks:
+            for name, stats in _run_chunk(*task).items():
+                total[name].merge(stats)
+        return total
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Keep at most 2 chunks per worker in flight so memory stays flat
+        pending = []
+        for task in tasks:
+            pending.append(pool.submit(_run_chunk, *task))
+            if len(pending) >= 2 * workers:
+                for name, stats in pending.pop(0).result().items():
+                    total[name].merge(stats)
+        for future in pending:
+            for name, stats in future.result().items():
+                total[name].merge(stats)
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m hasa.uncertainty",
+                                     description="Monte Carlo uncertainty propagation through the X-37B HASA case.")
+    parser.add_argument("--samples", type=float, default=1e7, help="number of samples (default: 1e7)")
+    parser.add_argument("--chunk-size", type=float, default=1e6, help="samples per chunk (default: 1e6)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = propagate(int(args.samples), chunk_size=int(args.chunk_size), workers=args.workers, seed=args.seed)
+    elapsed = time.perf_counter() - start
+
+    print(f"{int(args.samples)} samples in {elapsed:.1f} s ({args.samples / elapsed:,.0f} samples/s)")
+    print(f"{'Output':<24}{'mean':>12}{'std':>12}{'p5':>12}{'p50':>12}{'p95':>12}   (lbs)")
+    for name, stats in results.items():
+        p5, p50, p95 = stats.quantile([0.05, 0.5, 0.95])
+        print(f"{name:<24}{stats.mean:>12.2f}{stats.std:>12.2f}{p5:>12.2f}{p50:>12.2f}{p95:>12.2f}")
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    print(f"Peak resident memory of a single process: {peak / 1024:.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+import numpy as np
+
+from hasa.model import OUTPUT_NAMES, check_inputs
+
+# Vectorized (batched) version of the HASA weight build-up in hasa/model.py.
+# Every input is given as an array (or scalar) and every intermediate and total weight
+# is returned as an array, so a whole trade study is evaluated in a single NumPy pass
+# instead of one Python-level pass per candidate vehicle.
+#
+# The arithmetic mirrors the scalar functions in hasa/weights.py term by term so that the results
+# are bit-for-bit identical. np.float_power is used instead of ** / np.power because the
+# SIMD np.power kernels can differ from the libm pow used by Python floats in the last bit.
+
+
+def weight_breakdown(inputs):
+    """
+    Evaluate the full HASA weight build-up for a batch of design points.
+
+    Parameters:
+    inputs : dict
+        Struct-of-arrays of the HASA inputs, keyed by the names in hasa.model.INPUT_NAMES.
+        Values may be scalars or arrays of any broadcast-compatible shape, e.g. a
+        million-element array for the swept inputs and scalars for the fixed ones.
+        Inputs with a default value are optional (see hasa.model.DEFAULT_INPUTS).
+
+    Returns:
+    dict
+        Every intermediate and total weight in OUTPUT_NAMES as a float64 array of the
+        broadcast shape of the inputs (read-only views for outputs that only depend
+        on scalar inputs).
+    """
+    p = {name: np.asarray(value, dtype=np.float64) for name, value in check_inputs(inputs).items()}
+    out = build_up(p)
+    shape = np.broadcast_shapes(*(value.shape for value in p.values()))
+    return {name: np.broadcast_to(out[name], shape) for name in OUTPUT_NAMES}
+
+
+def build_up(p, xp=np, power=np.float_power, published_sweep_term=False):
+    """
+    HASA weight build-up on any NumPy-like array module.
+
+    Parameters:
+    p : dict
+        All HASA inputs (defaults already filled in, see hasa.model.check_inputs).
+    xp : module
+        Array module providing sqrt, abs, cos, degrees, radians and pi, e.g. numpy or
+        aerosandbox.numpy (which also traces CasADi expressions for asb.Opti).
+    power : function
+        Power function; np.float_power keeps the results bit-identical to the scalar functions.
+    published_sweep_term : bool
+        If True, the wing sweep term is 0.3 + 0.7 / cos(radians(sweep_angle)) as in the published
+        HASA relation. By default it is cos(degrees(sweep_angle)) as in wing_weight_func, which
+        oscillates with a period of about 0.11 deg in sweep_angle.
+
+    Returns:
+    dict
+        Every intermediate and total weight in OUTPUT_NAMES (not broadcast to a common shape).
+    """
+    pw = power
+    out = {}
+
+    # Fuselage weight (fuselage_weight_func)
+    out["D_be"] = xp.sqrt((4 * p["V_tot"]) / (xp.pi * p["L_f"] * p["eta_vol"]))
+    sigma = xp.abs(pw(p["L_f"] * p["ULF"] / out["D_be"], 0.15) * pw(p["q_max"], 0.16)
+                   * pw(p["S_btot"], 1.05))
+    out["W_f"] = 0.341 * p["mf"] * pw(sigma, 1.0)
+
+    # Main wing weight (wing_weight_func)
+    # Note: the scalar function takes cos(degrees(sweep_angle)); kept as-is so both agree.
+    # Where that cosine is negative, the scalar function returns a complex number and
+    # the vectorized engine returns NaN.
+    W_emp = p["W_gtot"] - p["W_prop"]
+    term1 = pw(W_emp * p["ULF"] / 1000, 0.52)
+    term2 = pw(p["S_ref"], 0.7) * pw(p["AR"], 0.47)
+    term3 = pw((1 + p["taper_ratio"]) / p["t_c"], 0.4)
+    if published_sweep_term:
+        term4 = 0.3 + (0.7 / xp.cos(xp.radians(p["sweep_angle"])))
+    else:
+        term4 = 0.3 + (0.7 / xp.cos(xp.degrees(p["sweep_angle"])))
+    out["W_w"] = 0.2958 * p["mf"] * pw(term1 * term2 * term3 * term4, 1.017)
+
+    # Tail weights (horizontal/vertical_stabilizer_weight_func)
+    Lambda = pw(p["W_gtot"] / p["S_ref"], 0.6) * pw(p["S_wfh"], 1.2) * pw(p["q_max"], 0.8)
+    out["W_finh"] = 0.0035 * Lambda
+    out["W_finv"] = 5.0 * pw(p["S_wfv"], 1.09)
+
+    # TPS and landing gear weights (tps_weight_func, landing_gear_weight_func)
+    out["W_tps"] = p["W_ins"] * (p["HRSI_area"] + p["RCC_area"] + p["FRSI_area"])
+    out["W_land"] = p["W_gtot"] - ((1.0 - p["fuel_residual"]) * p["W_prop"])
+    out["W_gear"] = 0.030 * out["W_land"]
+
+    # Total structure weight (structure_weight_func)
+    out["W_str"] = (out["W_f"] + out["W_w"] + out["W_finh"] + out["W_finv"]
+                    + out["W_tps"] + out["W_gear"])
+
+    # Subsystems (surface_control_actuators, avionics, electrical_weight_func)
+    out["W_sca"] = 0.0048 * p["W_entry"]
+    out["W_tavcs"] = p["avionics_factor"] * 66.37 * pw(p["W_gtot"], 0.361)
+    phi = xp.abs(pw(p["W_gtot"], 0.5) * pw(p["L_f"], 0.25))
+    out["W_eps"] = 1.167 * pw(phi, 1.0)
+    out["W_sub"] = out["W_sca"] + out["W_tavcs"] + out["W_eps"]
+
+    # OMS (oms_engine/pressurization/installation, total_oms_weight_func)
+    out["W_oms_eng"] = p["T_req_oms"] / p["R_oms"]
+    out["W_oms_press"] = (0.0143 * p["P_oms_press"] * p["V_oms_press"] * (1 - p["TRF"])
+                          + 0.617 * (p["V_oms_ox"] + p["V_oms_fuel"]))
+    out["W_oms_install"] = 0.74 * out["W_oms_eng"]
+    out["W_oms"] = out["W_oms_eng"] + out["W_oms_install"] + out["W_oms_press"]
+
+    # RCS (rcs_thruster/pressurization/installation, total_rcs_weight_func)
+    out["W_rcs_pf"] = p["N_pf"] * p["T_req_qp"] / p["R_p"]
+    out["W_rcs_vf"] = p["N_vf"] * p["T_req_qv"] / p["R_v"]
+    out["W_rcs_pa"] = p["N_pa"] * p["T_req_qp"] / p["R_p"]
+    out["W_rcs_va"] = p["N_va"] * p["T_req_qv"] / p["R_v"]
+    # Same summation order as sum() over [pf, vf, pa, va]
+    W_rcs_thrusters = out["W_rcs_pf"] + out["W_rcs_vf"] + out["W_rcs_pa"] + out["W_rcs_va"]
+    out["W_rcs_press"] = (0.0143 * p["P_rcs_press"] * p["V_rcs_press"] * (1 - p["TRF"])
+                          + 0.617 * (p["V_rcs_ox"] + p["V_rcs_fuel"]))
+    out["W_rcs_install"] = 0.74 * W_rcs_thrusters
+    out["W_rcs"] = W_rcs_thrusters + out["W_rcs_install"] + out["W_rcs_press"]
+
+    # Engines, tanks and propulsion (total_engine/tank/propulsion_weight_func)
+    out["W_eng"] = out["W_oms"] + out["W_rcs"]
+    out["W_oms_tnk"] = 0.01295 * p["P_oms_tnk"] * p["V_oms_tnk"]
+    out["W_rcs_tnk"] = 0.01295 * p["P_rcs_tnk"] * p["V_rcs_tnk"]
+    out["W_tnk"] = out["W_oms_tnk"] + out["W_rcs_tnk"]
+    out["W_pros"] = out["W_tnk"] + out["W_eng"]
+
+    # Total weight without payload and allowable payload
+    out["W_gtot_without_payload"] = out["W_str"] + out["W_pros"] + out["W_sub"] + p["W_prop"]
+    out["W_allow_payload"] = p["W_gtot"] - out["W_gtot_without_payload"]
+    return out
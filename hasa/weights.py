@@ -0,0 +1,186 @@
+import math
+
+# Modified HASA weight model (scalar functions).
+# Importing this module only defines the functions; the X-37B case lives in hasa/x37b.py
+# and is run with `python -m hasa`. None of the functions print anything.
+
+###########################
+# HASA MODEL (INCOMPLETE) #
+###########################
+
+
+# Note that all outputs for functions are in imperial units
+# Fuselage weight
+def fuselage_weight_func(L_f, ULF, q_max, S_btot, V_tot, mf, eta_vol=0.7):
+    # Note that eta_vol is typically 0.7 and the HASA model isn't sensitive to it
+    # Equation for body equivalent diameter (D_be)
+    D_be = math.sqrt((4 * V_tot) / (math.pi * L_f * eta_vol))
+    
+    # Equation for sigma (σ) in imperial units
+    sigma = abs(((L_f * ULF / D_be) ** 0.15) * (q_max ** 0.16) * (S_btot ** 1.05))
+    
+    # Equation for fuselage weight (W_f)
+    W_f = 0.341 * mf * (sigma ** 1.0)  # Result will be in pounds (lb)
+    return W_f
+
+# Main wing weight
+def wing_weight_func(W_gtot, W_prop, ULF, S_ref, AR, taper_ratio, t_c, sweep_angle, mf):
+    # Calculate empty weight (W_emp)
+    W_emp = W_gtot - W_prop
+
+    # Equation for wing weight (W_w)
+    term1 = ((W_emp * ULF / 1000) ** 0.52)
+    term2 = (S_ref ** 0.7) * (AR ** 0.47)
+    term3 = ((1 + taper_ratio) / t_c) ** 0.4
+    term4 = (0.3 + (0.7 / math.cos(math.degrees(sweep_angle))))
+    
+    W_w = 0.2958 * mf * (term1 * term2 * term3 * term4) ** 1.017
+    
+    return W_w
+
+# Horizontal stabilizer weight
+def horizontal_stabilizer_weight_func(W_gtot, S_ref, S_wfh, q_max):
+    # Calculate the Λ term
+    Lambda = ((W_gtot / S_ref) ** 0.6) * (S_wfh ** 1.2) * (q_max ** 0.8)
+    
+    # Equation for horizontal stabilizer weight (W_finh)
+    W_finh = 0.0035 * Lambda
+    
+    return W_finh
+
+# Vertical stabilizer weight
+def vertical_stabilizer_weight_func(S_wfv):
+    # Equation for vertical stabilizer weight (W_finv)
+    W_finv = 5.0 * (S_wfv ** 1.09)
+    
+    return W_finv
+
+#TPS weight
+def tps_weight_func(W_ins, HRSI_area, RCC_area, FRSI_area):
+    W_tps = W_ins * (HRSI_area + RCC_area + FRSI_area)
+    return W_tps
+
+#Landing gear weight
+def landing_gear_weight_func(W_gtot, fuel_residual, W_prop):
+    W_land = W_gtot - ((1.0-fuel_residual)*W_prop)
+    W_gear = 0.030 * W_land
+    return W_gear
+
+#Total STRUCTURE weight
+def structure_weight_func(W_f, W_w, W_hor, W_vert, W_tps, W_gear):
+    W_str = W_f+W_w+W_hor+W_vert+W_tps+W_gear
+    return W_str
+
+
+
+###### INCOMPLETE STUFF ######
+
+####Engine Weight (From MERS by GATech)
+# OMS Engine Weight Calculation
+def oms_engine_weight_func(T_req_oms, R_oms=22): #R_oms chosen as 22; includes mounts, supports, igniters, etc. (MERS by GATech)
+    """Calculates the OMS engine weight."""
+    W_oms_eng = T_req_oms / R_oms
+    return W_oms_eng
+
+# OMS Pressurization System Weight Calculation
+def oms_pressurization_weight_func(P_oms_press, V_oms_press, V_oms_ox, V_oms_fuel, TRF=0.0):
+    """Calculates the OMS pressurization system weight."""
+    W_oms_press = (0.0143 * P_oms_press * V_oms_press * (1 - TRF) +
+                   0.617 * (V_oms_ox + V_oms_fuel))
+    return W_oms_press
+
+# OMS Installation Weight Calculation
+def oms_installation_weight_func(W_oms_eng):
+    """Calculates the OMS installation weight."""
+    W_oms_install = 0.74 * W_oms_eng
+    return W_oms_install
+
+# Total OMS Weight Calculation
+def total_oms_weight_func(W_oms_eng, W_oms_install, W_oms_press):
+    """Calculates the total OMS weight."""
+    W_oms = W_oms_eng + W_oms_install + W_oms_press
+    return W_oms
+
+# RCS Thruster Weight Calculations
+def rcs_thruster_weight_func(N, T_req, R):
+    """Calculates the weight of RCS thrusters."""
+    return N * T_req / R
+
+# RCS Pressurization System Weight Calculation
+def rcs_pressurization_weight_func(P_rcs_press, V_rcs_press, V_rcs_ox, V_rcs_fuel, TRF=0.0):
+    """Calculates the RCS pressurization system weight."""
+    W_rcs_press = (0.0143 * P_rcs_press * V_rcs_press * (1 - TRF) +
+                   0.617 * (V_rcs_ox + V_rcs_fuel))
+    return W_rcs_press
+
+# RCS Installation Weight Calculation
+def rcs_installation_weight_func(W_rcs_thrusters):
+    """Calculates the RCS installation weight."""
+    W_rcs_install = 0.74 * sum(W_rcs_thrusters)
+    return W_rcs_install
+
+# Total RCS Weight Calculation
+def total_rcs_weight_func(W_rcs_thrusters, W_rcs_install, W_rcs_press):
+    """Calculates the total RCS weight."""
+    W_rcs = sum(W_rcs_thrusters) + W_rcs_install + W_rcs_press
+    return W_rcs
+
+# Total Engine Weight Calculation
+def total_engine_weight_func(W_oms, W_rcs):
+    """Calculates the total engine weight."""
+    W_eng = W_oms + W_rcs
+    return W_eng
+
+# Tank Weight Calculation for OMS and RCS
+def tank_weight_func(P_tnk, V_tnk):
+    """Calculates the weight of the tank."""
+    return 0.01295 * P_tnk * V_tnk
+
+# Total Tank Weight Calculation
+def total_tank_weight_func(P_oms_tnk, V_oms_tnk, P_rcs_tnk, V_rcs_tnk):
+    """Calculates the total weight of all tanks (OMS + RCS)."""
+    W_oms_tnk = tank_weight_func(P_oms_tnk, V_oms_tnk)
+    W_rcs_tnk = tank_weight_func(P_rcs_tnk, V_rcs_tnk)
+    W_tnk = W_oms_tnk + W_rcs_tnk
+    return W_oms_tnk, W_rcs_tnk, W_tnk
+
+# Total Propulsion Weight Calculation
+def total_propulsion_weight_func(W_tnk, W_eng):
+    """Calculates the total propulsion weight."""
+    return W_tnk + W_eng
+
+# # Hydraulics Weight is removed since X-37B uses electromechanical actuators instead.
+# def hydraulics_weight_func(S_ref, q_max, L_f, W_span):
+#     # Calculate the psi term
+#     psi = abs(((S_ref*q_max/1000)**0.334) * (L_f+W_span)**0.5)
+    
+#     # Equation for hydraulics weight (W_hydr)
+#     W_hydr = 2.64 * (psi ** 1.0)
+    
+#     return W_hydr
+
+# Electromechanical Actuators
+def surface_control_actuators_weight_func(W_entry):
+    W_sca = 0.0048*W_entry
+    return W_sca
+
+# Avionics Weight
+# This is MODIFIED HASA!!!
+# AVIONICS WEIGHT IS REDUCED TO 69% of ORINAL HASA!
+# This is due to advanced avionics
+def avionics_weight_func(W_gtot, avionics_factor=0.69):
+    W_tavcs = avionics_factor*66.37*(W_gtot**0.361)
+    return W_tavcs
+
+
+# Electrical System Weight
+def electrical_weight_func(W_gtot, L_f):
+    phi = abs((W_gtot**0.5) * (L_f**0.25))
+    W_eps = 1.167 * (phi**1.0)
+    return W_eps
+
+
+####Total weight without payload (W_no_payload)
+def total_weight_without_payload_func(W_str, W_pros, W_sub, W_prop):
+    W_gtot_no_payload = W_str + W_pros + W_sub + W_prop
+    return W_gtot_no_payload
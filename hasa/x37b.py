@@ -0,0 +1,100 @@
+# X-37B inputs for the modified HASA model.
+# X-37B dimensions are used; if certain dimensions aren't available online,
+# they are estimated from a fairly accurate CAD model.
+# Run the X-37B case with `python -m hasa`.
+
+
+# Inputs for fuselage length (L_f), ULF, q_max, S_btot, V_tot, and mf in imperial units
+L_f = 27.5  # ft (fuselage length) (X-37B)
+ULF = 3.75   # ultimate load factor (given in MERS by GATech)
+q_max = 300  # lb per ft^2 (psf) (maximum dynamic pressure) (Suitable number for RLVs like X-33, X-37, X-40, etc.)
+# source: "High-fidelity real-time trajectory optimization for reusable launch vehicles" by Bollino, Kevin P.
+S_btot = 926.66504777 # ft^2 (fuselage wetted surface area) (estimate from CAD model of X-37B)
+V_tot = 604.23394760467  # ft^3 (total volume) (estimate from CAD model of X-37B)
+mf = 1.12       # mass factor (mass factor of space shuttle)
+
+# Inputs for W_gtot, W_prop, ULF, S_ref, AR, taper_ratio, t/c, sweep_angle, and mf
+W_gtot = 11000  # total gross weight in lbs #X-37B: 11000lb 
+W_prop = 2865.13   # propellant weight in lbs #arbitrarily set from SNU paper (3306.934lbs)
+S_ref = 80   # reference wing area in square feet # estimate from CAD model (59.35220204 for wing interrupted by fuselage)
+W_span = 14.92782 #ft 
+AR = (W_span**2) / 59.35220204      # aspect ratio (wing_span^2 / wing_area) estimate from CAD model (14.92782**2 / 59.35220204)
+taper_ratio = 383/4059  # taper ratio (λ) (length_tip/length_root) estimate from CAD model (383/4059) 
+t_c = 154/3426      # thickness to chord ratio (t/c) estimate from CAD model (154/3426)
+sweep_angle = 50  # sweep angle (λ_1/2) in degrees (estimate from CAD model)
+# ULF = 3.75       # ultimate load factor (same as above)
+# mf = 1.12        # mass factor (same as above)
+
+# Inputs for tail weights
+# Unsure what to do with a V tail like the X-37B,
+# So just guestimated a vertical and horizontal planform area.
+# If I have more time, Maybe I'll do a projection to each plane and get the surface area
+S_wfh = 25.0  # planform area of horizontal stabilizer in square feet (estimate from CAD model)
+S_wfv = 25.0  # planform area of vertical stabilizer in square feet (estimate from CAD model)
+
+# TPS Surface Areas (estimate)
+# 100 ft^2 for HRSI (under wing, etc.) estimate from CAD model of X-37B
+# 20 ft^2 for RCC (nose and leading edge) estimate from CAD model of X-37B
+# 119 ft^2 for FRSI (top part of spacecraft) estimate from CAD model of X-37B
+HRSI_area = 100
+RCC_area = 20
+FRSI_area = 119
+
+## TPS UNIT WEIGHT PER UNIT AREA ARE UNKNOWN, 
+# SO WE USE THE AVERAGE OF 3.0 USED FOR THE SPACE SHUTTLE##
+W_ins = 3.0
+
+# Inputs for surface control actuators
+W_entry = 8800 #lbs (Note that the same is used in Propulsion Analysis)
+
+
+# Landing Gear Assumption
+# Assumes Residual Fuel is 20% (20% fuel is left)
+# The 20% residual fuel is arbitrary, 
+# so you can change this however you like.
+fuel_residual = 0.2
+
+# Inputs for OMS engine weight
+T_req_oms = 550.00  # Required OMS thrust in lbs (From Propulsion Analysis)
+P_oms_press = 3000  # OMS pressurization pressure in psia (from MERS by GATech)
+V_oms_ox = 31.77  # Volume of OMS oxygen in cubic feet (From Propulsion Analysis)
+V_oms_fuel = 85.44  # Volume of OMS fuel in cubic feet (From Propulsion Analysis)
+V_oms_press = 0.24 * (V_oms_ox + V_oms_fuel)  # OMS pressurization volume (From MERS by GATech)
+
+# Inputs for RCS engine weight
+N_pf, N_vf, N_pa, N_va = 14, 2, 24, 4  # Number of primary/vernier thrusters (front/aft) (Space Shuttle quantity)
+T_req_qp, T_req_qv = 10.01, 0.58  # Required primary and vernier thrust (lbs) (From Propulsion Analysis)
+R_p, R_v = 39.5, 9.4  # Thrust-to-weight ratios for primary/vernier thrusters (from MERS by GATech)
+P_rcs_press = 3000  # RCS pressurization pressure in psia (from MERS by GATech)
+V_rcs_ox = 2.82 # Volume of RCS oxygen(cubic feet) (From Propulsion Analysis)
+V_rcs_fuel = 7.58  # Volume of RCS fuel (cubic feet) (From Propulsion Analysis)
+V_rcs_press = 0.24 * (V_rcs_ox + V_rcs_fuel)  # RCS pressurization volume (From MERS by GATech)
+
+# Inputs for tank weight
+ullage_lox = 0.06 #LOX 6% value is from X-34 "Transient Analysis of X-34 Pressurization System"
+ullage_lh2 = 0.06 #No source for this, but MERS by GATech says typically ~4 to 5% so 6% should be a reasonable value
+P_oms_tnk = 195  # Pressure of OMS tank in psia (from MERS by GATech)
+V_oms_tnk = (V_oms_ox/(1-0.06) + V_oms_fuel/(1-0.06))  # Volume of OMS tank in cubic feet
+P_rcs_tnk = 195  # Pressure of RCS tank in psia (from MERS by GATech)
+V_rcs_tnk = (V_rcs_ox/(1-0.06) + V_rcs_fuel/(1-0.06))   # Volume of RCS tank in cubic feet
+
+# # Additional input for total weight (from propulsion analysis)
+# W_prop = 2865.13 #lbs (from Propulsion Analysis)
+
+
+def x37b_inputs():
+    """Returns the X-37B inputs as a dict keyed by the HASA input names (see hasa.model.INPUT_NAMES)."""
+    return {
+        "L_f": L_f, "ULF": ULF, "q_max": q_max, "S_btot": S_btot, "V_tot": V_tot, "mf": mf,
+        "W_gtot": W_gtot, "W_prop": W_prop, "S_ref": S_ref, "AR": AR, "taper_ratio": taper_ratio,
+        "t_c": t_c, "sweep_angle": sweep_angle,
+        "S_wfh": S_wfh, "S_wfv": S_wfv,
+        "W_ins": W_ins, "HRSI_area": HRSI_area, "RCC_area": RCC_area, "FRSI_area": FRSI_area,
+        "W_entry": W_entry, "fuel_residual": fuel_residual,
+        "T_req_oms": T_req_oms, "P_oms_press": P_oms_press, "V_oms_ox": V_oms_ox,
+        "V_oms_fuel": V_oms_fuel, "V_oms_press": V_oms_press,
+        "N_pf": N_pf, "N_vf": N_vf, "N_pa": N_pa, "N_va": N_va, "T_req_qp": T_req_qp,
+        "T_req_qv": T_req_qv, "R_p": R_p, "R_v": R_v, "P_rcs_press": P_rcs_press,
+        "V_rcs_ox": V_rcs_ox, "V_rcs_fuel": V_rcs_fuel, "V_rcs_press": V_rcs_press,
+        "P_oms_tnk": P_oms_tnk, "V_oms_tnk": V_oms_tnk, "P_rcs_tnk": P_rcs_tnk, "V_rcs_tnk": V_rcs_tnk,
+    }
@@ -1,86 +1,165 @@
-import scipy.stats as stats
-import numpy as np
-import matplotlib.pyplot as plt
-
-# Data for Vehicle A
-n_A = 391  # Total launches
-k_A = int(n_A * 0.9923)  # Successful launches
-p_hat_A = k_A / n_A  # Observed success rate
-
-# Data for Vehicle B
-n_B = 2  # Total launches
-k_B = 2  # Successful launches
-p_hat_B = k_B / n_B  # Observed success rate
-
-print(f"Vehicle A: {k_A} successes out of {n_A} launches ({p_hat_A*100:.2f}% success rate)")
-print(f"Vehicle B: {k_B} successes out of {n_B} launches ({p_hat_B*100:.2f}% success rate)")
-
-# 1. Confidence Intervals using the Clopper-Pearson method (Exact Binomial Confidence Interval)
-confidence_level = 0.95
-alpha = 1 - confidence_level
-
-# Confidence Interval for Vehicle A
-ci_A = stats.binom.interval(confidence_level, n_A, p_hat_A, loc=0)
-lower_ci_A = ci_A[0] / n_A
-upper_ci_A = ci_A[1] / n_A
-
-# Confidence Interval for Vehicle B
-ci_B = stats.binom.interval(confidence_level, n_B, p_hat_B, loc=0)
-lower_ci_B = ci_B[0] / n_B
-upper_ci_B = ci_B[1] / n_B
-
-print("\n95% Confidence Intervals (Clopper-Pearson Method):")
-print(f"Vehicle A: ({lower_ci_A*100:.2f}%, {upper_ci_A*100:.2f}%)")
-print(f"Vehicle B: ({lower_ci_B*100:.2f}%, {upper_ci_B*100:.2f}%)")
-
-# 2. Hypothesis Testing for Proportions
-# Null Hypothesis H0: p_A >= p_B
-# Alternative Hypothesis H1: p_A < p_B
-
-# Since n_B is small, we use Fisher's Exact Test
-from statsmodels.stats.proportion import proportions_ztest, proportion_confint, proportions_chisquare
-
-count = np.array([k_A, k_B])
-nobs = np.array([n_A, n_B])
-
-# Using normal approximation (Not suitable for small n, but included for completeness)
-stat, p_value = proportions_ztest(count, nobs, alternative='smaller')
-print("\nHypothesis Testing (Proportions Z-test):")
-print(f"Z-test statistic: {stat:.4f}")
-print(f"P-value: {p_value:.4f}")
-
-# 3. Bayesian Inference
-# Using Beta distribution as the conjugate prior for the binomial likelihood
-from scipy.stats import beta
-
-# Prior parameters (Assuming non-informative prior)
-alpha_prior = 1
-beta_prior = 1
-
-# Posterior for Vehicle A
-posterior_A = beta(alpha_prior + k_A, beta_prior + n_A - k_A)
-mean_A = posterior_A.mean()
-cred_interval_A = posterior_A.interval(confidence_level)
-
-# Posterior for Vehicle B
-posterior_B = beta(alpha_prior + k_B, beta_prior + n_B - k_B)
-mean_B = posterior_B.mean()
-cred_interval_B = posterior_B.interval(confidence_level)
-
-print("\nBayesian Inference Results:")
-print(f"Vehicle A Posterior Mean: {mean_A*100:.2f}%")
-print(f"Vehicle A 95% Credible Interval: ({cred_interval_A[0]*100:.2f}%, {cred_interval_A[1]*100:.2f}%)")
-print(f"Vehicle B Posterior Mean: {mean_B*100:.2f}%")
-print(f"Vehicle B 95% Credible Interval: ({cred_interval_B[0]*100:.2f}%, {cred_interval_B[1]*100:.2f}%)")
-
-# Plotting the posterior distributions
-x = np.linspace(0, 1, 1000)
-plt.figure(figsize=(10,6))
-plt.plot(x, posterior_A.pdf(x), label='Vehicle A Posterior', lw=2)
-plt.plot(x, posterior_B.pdf(x), label='Vehicle B Posterior', lw=2)
-plt.title('Posterior Distributions of Success Rates')
-plt.xlabel('Success Rate')
-plt.ylabel('Density')
-plt.legend()
-plt.grid(True)
-plt.show()
+import argparse
+import json
+import math
+
+from scipy.special import betaincinv
+
+from reliability import binomial_interval, prob_greater
+
+# Two-vehicle launch reliability comparison.
+# Only numpy and scipy.special are imported up front; matplotlib and scipy.stats are imported
+# when a plot is requested. Batch jobs run with --batch (no window) or --json (machine-readable
+# results on stdout) and write the plot off-screen with --plot FILE.
+# Usage: python launch_comparison.py [--batch] [--json] [--plot FILE]
+
+VEHICLES = {
+    # name: (total launches, successful launches)
+    "A": (391, int(391 * 0.9923)),
+    "B": (2, 2),
+}
+
+
+def proportions_ztest_smaller(k_1, n_1, k_2, n_2):
+    """
+    Pooled two-proportion z-test of H1: p_1 < p_2 (as statsmodels proportions_ztest with
+    alternative='smaller').
+
+    Returns:
+    tuple : (statistic, p_value)
+        (nan, nan) when the pooled rate is 0 or 1 (no variance to test against).
+    """
+    p_pool = (k_1 + k_2) / (n_1 + n_2)
+    se = math.sqrt(p_pool * (1 - p_pool) * (1 / n_1 + 1 / n_2))
+    if se == 0:
+        return math.nan, math.nan
+    z = (k_1 / n_1 - k_2 / n_2) / se
+    return z, 0.5 * math.erfc(-z / math.sqrt(2))
+
+
+def compare(vehicles=VEHICLES, confidence_level=0.95, prior=(1, 1)):
+    """
+    Confidence intervals, z-test and Beta posteriors of two vehicles.
+
+    Parameters:
+    vehicles : dict
+        {name: (total launches, successful launches)} of two vehicles.
+    confidence_level : float
+        Level of the confidence and credible intervals.
+    prior : tuple
+        (alpha_prior, beta_prior) of the Beta prior.
+
+    Returns:
+    dict
+        JSON-serializable results (the z-test statistic and p-value are None when undefined).
+    """
+    (name_A, (n_A, k_A)), (name_B, (n_B, k_B)) = vehicles.items()
+    alpha = 1 - confidence_level
+    alpha_prior, beta_prior = prior
+
+    # 1. Confidence Intervals using the Clopper-Pearson method (Exact Binomial Confidence Interval)
+    lower, upper = binomial_interval([k_A, k_B], [n_A, n_B], method="clopper-pearson", confidence=confidence_level)
+
+    results = {"confidence_level": confidence_level, "prior": list(prior), "vehicles": {}}
+    for i, (name, (n, k)) in enumerate(vehicles.items()):
+        # 3. Bayesian Inference: Beta(alpha_prior + k, beta_prior + n - k) posterior
+        a, b = alpha_prior + k, beta_prior + n - k
+        results["vehicles"][name] = {
+            "launches": n,
+            "successes": k,
+            "success_rate": k / n,
+            "confidence_interval": [float(lower[i]), float(upper[i])],
+            "posterior": [a, b],
+            "posterior_mean": a / (a + b),
+            "credible_interval": [float(betaincinv(a, b, alpha / 2)), float(betaincinv(a, b, 1 - alpha / 2))],
+        }
+
+    # 2. Hypothesis Testing for Proportions
+    # Null Hypothesis H0: p_A >= p_B
+    # Alternative Hypothesis H1: p_A < p_B
+    # Using normal approximation (Not suitable for small n, but included for completeness)
+    stat, p_value = proportions_ztest_smaller(k_A, n_A, k_B, n_B)
+    # (None when the test is undefined, as NaN is not valid JSON)
+    undefined = math.isnan(stat)
+    results["z_test"] = {"statistic": None if undefined else stat, "p_value": None if undefined else p_value,
+                         "alternative": f"p_{name_A} < p_{name_B}"}
+
+    # Posterior probability that the second vehicle is more reliable than the first
+    post_A, post_B = results["vehicles"][name_A]["posterior"], results["vehicles"][name_B]["posterior"]
+    results[f"P(p_{name_B} > p_{name_A})"] = float(prob_greater(*post_B, *post_A))
+    return results
+
+
+def print_report(results):
+    vehicles = results["vehicles"]
+    level = f"{results['confidence_level']*100:g}%"
+    for name, v in vehicles.items():
+        print(f"Vehicle {name}: {v['successes']} successes out of {v['launches']} launches "
+              f"({v['success_rate']*100:.2f}% success rate)")
+
+    print(f"\n{level} Confidence Intervals (Clopper-Pearson Method):")
+    for name, v in vehicles.items():
+        lower, upper = v["confidence_interval"]
+        print(f"Vehicle {name}: ({lower*100:.2f}%, {upper*100:.2f}%)")
+
+    print("\nHypothesis Testing (Proportions Z-test):")
+    if results["z_test"]["statistic"] is None:
+        print("Z-test statistic: undefined (pooled success rate of 0 or 1)")
+    else:
+        print(f"Z-test statistic: {results['z_test']['statistic']:.4f}")
+        print(f"P-value: {results['z_test']['p_value']:.4f}")
+
+    print("\nBayesian Inference Results:")
+    for name, v in vehicles.items():
+        lower, upper = v["credible_interval"]
+        print(f"Vehicle {name} Posterior Mean: {v['posterior_mean']*100:.2f}%")
+        print(f"Vehicle {name} {level} Credible Interval: ({lower*100:.2f}%, {upper*100:.2f}%)")
+    for key, value in results.items():
+        if key.startswith("P("):
+            print(f"{key}: {value*100:.2f}%")
+
+
+def plot_posteriors(results, path=None):
+    """Plots the posterior distributions; saved off-screen to path, or shown in a window."""
+    import matplotlib
+    if path is not None:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import numpy as np
+    from scipy.stats import beta
+
+    x = np.linspace(0, 1, 1000)
+    plt.figure(figsize=(10,6))
+    for name, v in results["vehicles"].items():
+        plt.plot(x, beta(*v["posterior"]).pdf(x), label=f'Vehicle {name} Posterior', lw=2)
+    plt.title('Posterior Distributions of Success Rates')
+    plt.xlabel('Success Rate')
+    plt.ylabel('Density')
+    plt.legend()
+    plt.grid(True)
+    if path is not None:
+        plt.savefig(path, dpi=150)
+        plt.close()
+    else:
+        plt.show()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Launch reliability comparison of two vehicles.")
+    parser.add_argument("--batch", action="store_true", help="headless: no plot window")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON (implies --batch)")
+    parser.add_argument("--plot", metavar="FILE", help="write the posterior plot to FILE (off-screen)")
+    args = parser.parse_args(argv)
+
+    results = compare()
+    if args.json:
+        print(json.dumps(results, indent=2, allow_nan=False))
+    else:
+        print_report(results)
+    if args.plot:
+        plot_posteriors(results, args.plot)
+    elif not (args.batch or args.json):
+        plot_posteriors(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,344 @@
+import argparse
+
+import numpy as np
+
+from propulsion_analysis_no_ascent import calculate_lox_lh2_volumes, density_lh2, density_lox, g, thrust_requirements
+
+# Multi-phase delta-V budget engine.
+# A mission is a table of phases in flight order, each with its own engine, delta-V, Isp and
+# reserve factor. Propellant is computed for all phases at once as a cumulative-mass chain
+# (each burn also has to accelerate the propellant of every later phase), backwards from the
+# mass after the last phase. Any phase field may be an array, so thousands of mission
+# variants are evaluated in one vectorized pass.
+#
+# The former propulsion_analysis.py (with ascent) and propulsion_analysis_no_ascent.py cases are
+# the ASCENT_MISSION and X37B_MISSION tables below; chain=False reproduces their phase-by-phase
+# sizing off the entry weight.
+#
+# The inverse direction (fixed tank volumes -> largest delta-V of a phase or longest mission) is
+# solved in closed form where possible: every engine's propellant is a ratio of two functions
+# linear in the mass ratio of any single phase. Missions where several phases grow with the
+# duration use a batched (Illinois) root-finder on the tank margins instead.
+# Usage: python mission.py [--mission x37b|ascent] [--independent] [--tanks]
+
+# Phase table columns
+PHASE_FIELDS = ("name", "engine", "deltaV", "Isp", "reserve")
+
+# X-37B one-year mission (former propulsion_analysis_no_ascent.py)
+X37B_MISSION = {
+    "W_final": 8800,  # mass after the last phase (entry weight) in lbs
+    "L_f": 27.5,      # fuselage length in ft (for the thrust requirements)
+    "phases": [
+        # name, engine, delta V (fps), Isp (s), reserve factor
+        ("orbit", "OMS", 2177.4934, 312, 1.1),     # one year of orbit keeping (paper says 50)
+        ("orbit", "RCS", 200, 312, 1.1),           # from Space Shuttle (mentioned in MERS by GATech)
+        ("de-orbit", "OMS", 293.0675853, 312, 1.1),  # calculated by 임태욱-GNC
+        ("entry", "RCS", 40, 312, 1.1),            # from Space Shuttle (mentioned in MERS by GATech)
+    ],
+}
+
+# Variant with an OMS ascent burn and lower Isp (former propulsion_analysis.py)
+ASCENT_MISSION = {
+    "W_final": 8500,
+    "L_f": 27.5,
+    "phases": [
+        ("ascent", "OMS", 650, 246, 1.1),
+        ("orbit", "OMS", 2177.4934, 246, 1.1),
+        ("orbit", "RCS", 200, 265, 1.1),
+        ("de-orbit", "OMS", 293.0675853, 246, 1.1),
+        ("entry", "RCS", 40, 265, 1.1),
+    ],
+}
+
+MISSIONS = {"x37b": X37B_MISSION, "ascent": ASCENT_MISSION}
+
+# Oxidizer mass fraction per engine (as total_propellant_weights)
+OX_FRACTION = {"OMS": 6 / 7, "RCS": 4 / 5}
+
+# Orbit-keeping delta-V per day in fps (2177.4934 fps for one year)
+ORBIT_KEEPING_RATE = 2177.4934 / 365
+
+
+def _phase_arrays(phases, W_final, shapes=()):
+    """
+    Phase table as (names, engines, deltaV, Isp, reserve, W_final), the arrays broadcast to
+    (n_phases, *batch); batch also covers the extra shapes (e.g. of the tank capacities).
+    """
+    names, engines, *columns = zip(*phases)
+    shape = np.broadcast_shapes(np.shape(W_final), *shapes,
+                                *(np.shape(value) for column in columns for value in column))
+    deltaV, Isp, reserve = (np.array([np.broadcast_to(value, shape) for value in column], dtype=np.float64)
+                            for column in columns)
+    return names, engines, deltaV, Isp, reserve, np.broadcast_to(np.asarray(W_final, dtype=np.float64), shape)
+
+
+def _chain(growth, reserve, chain=True):
+    """
+    Burned propellant per lb of mass after the last phase.
+
+    Returns (after, burned_per_lb, end_factor): the mass after each phase and the propellant burned
+    in it per lb of end mass, and the end mass (including carried reserves) per lb of W_final.
+    """
+    if not chain:
+        return None, growth - 1, np.ones_like(growth[0])
+    # Mass after phase k per lb of mass after the last phase: product of the later mass ratios
+    after = np.ones_like(growth)
+    after[:-1] = np.cumprod(growth[:0:-1], axis=0)[::-1]
+    burned_per_lb = after * (growth - 1)
+    # Reserves are carried to the end: M_end = W_final + sum((reserve - 1) * burned)
+    end_factor = 1 / (1 - np.sum((reserve - 1) * burned_per_lb, axis=0))
+    return after, burned_per_lb, end_factor
+
+
+def phase_propellant(phases, W_final, chain=True):
+    """
+    Propellant budget of a mission phase table.
+
+    Parameters:
+    phases : list of tuples
+        (name, engine, deltaV, Isp, reserve) per phase in flight order. deltaV (fps), Isp (s)
+        and reserve (factor on the burned propellant) may be floats or broadcast-compatible
+        arrays over mission variants.
+    W_final : float or array
+        Mass after the last phase in lbs (without the unused reserve propellant).
+    chain : bool
+        True: cumulative-mass chain; the reserve propellant is carried to the end of the mission.
+        False: every phase is sized independently off W_final (as the former propulsion scripts).
+
+    Returns:
+    dict
+        "burned" and "propellant" (burned plus reserve) per phase, shape (n_phases, *batch);
+        "mass_before" per phase (chain only); "engines" {engine: total propellant};
+        "W_prop" (total propellant) and "W_initial" (mass before the first phase).
+    """
+    names, engines, deltaV, Isp, reserve, W_final = _phase_arrays(phases, W_final)
+    growth = np.exp(deltaV / (Isp * g))  # mass ratio of each burn
+    after, burned_per_lb, end_factor = _chain(growth, reserve, chain)
+    M_end = W_final * end_factor
+    burned = M_end * burned_per_lb
+    mass_before = M_end * after * growth if chain else None
+    propellant = reserve * burned
+
+    result = {
+        "names": names,
+        "burned": burned,
+        "propellant": propellant,
+        "mass_before": mass_before,
+        "engines": {engine: propellant[[e == engine for e in engines]].sum(axis=0) for engine in dict.fromkeys(engines)},
+        "W_prop": propellant.sum(axis=0),
+    }
+    result["W_initial"] = W_final + result["W_prop"]
+    return result
+
+
+def tank_capacity(V_tnk, mixture_ratio=6.0, ullage_lox=0.06, ullage_lh2=0.06):
+    """
+    Propellant weight that fits into a LOX/LH2 tank volume (inverse of calculate_lox_lh2_volumes
+    followed by the ullage allowance of hasa/x37b.py).
+
+    Parameters:
+    V_tnk : float or array
+        Tank volume in ft³ (V_oms_tnk, V_rcs_tnk).
+    mixture_ratio : float or array
+        Oxidizer to fuel mass ratio (6 in calculate_lox_lh2_volumes).
+    ullage_lox, ullage_lh2 : float or array
+        Ullage fractions of the LOX and LH2 tanks.
+
+    Returns:
+    float or array
+        Propellant weight in lbs.
+    """
+    ox = mixture_ratio / (1 + mixture_ratio)
+    return V_tnk / (ox / (density_lox * (1 - ullage_lox)) + (1 - ox) / (density_lh2 * (1 - ullage_lh2)))
+
+
+def max_phase_deltaV(phases, phase, capacity, W_final, chain=True):
+    """
+    Largest delta-V of one phase that the tanks allow, with every other phase unchanged.
+
+    Parameters:
+    phases : list of tuples
+        Phase table as for phase_propellant; the delta-V of the solved phase is ignored.
+    phase : int
+        Index of the solved phase in the table.
+    capacity : dict
+        {engine: propellant weight in lbs its tanks hold (see tank_capacity)}, floats or arrays.
+        Engines without an entry are unconstrained.
+    W_final : float or array
+        Mass after the last phase in lbs.
+    chain : bool
+        Cumulative-mass chain (True) or independent phase sizing (False), as phase_propellant.
+
+    Returns:
+    ndarray
+        Largest delta-V in fps (NaN where the other phases alone do not fit into the tanks).
+    """
+    names, engines, deltaV, Isp, reserve, W_final = _phase_arrays(phases, W_final)
+    growth = np.exp(deltaV / (Isp * g))
+
+    # An engine's propellant is W_final * N(E) / D(E), with N and D linear in the mass ratio E of
+    # the solved phase; take both lines from E = 0 and E = 1
+    lines = []
+    for E in (0.0, 1.0):
+        growth[phase] = E
+        _, burned_per_lb, end_factor = _chain(growth, reserve, chain)
+        lines.append((reserve * burned_per_lb, 1 / end_factor))
+    (n0, D0), (n1, D1) = lines
+
+    E_max = np.full(W_final.shape, np.inf)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for engine, C in capacity.items():
+            mask = [e == engine for e in engines]
+            N0 = n0[mask].sum(axis=0)
+            N1 = n1[mask].sum(axis=0)
+            # W_final (N0 + (N1 - N0) E) = C (D0 + (D1 - D0) E)
+            num = C * D0 - W_final * N0
+            den = W_final * (N1 - N0) - C * (D1 - D0)
+            E_max = np.minimum(E_max, np.where(den > 0, num / den, np.where(num >= 0, np.inf, -np.inf)))
+        return np.where(E_max >= 1, Isp[phase] * g * np.log(E_max), np.nan)
+
+
+def max_duration(phases, rates, capacity, W_final, chain=True, tol=1e-10, max_iter=100):
+    """
+    Longest mission the tanks allow when the delta-V of some phases grows with the duration.
+
+    Parameters:
+    phases : list of tuples
+        Phase table as for phase_propellant.
+    rates : dict
+        {phase index: delta-V per day in fps}; these phases get deltaV = rate * days
+        (e.g. {0: ORBIT_KEEPING_RATE} for the orbit-keeping phase of X37B_MISSION).
+    capacity : dict
+        {engine: propellant weight in lbs its tanks hold}, as for max_phase_deltaV.
+    W_final : float or array
+        Mass after the last phase in lbs.
+    chain : bool
+        Cumulative-mass chain (True) or independent phase sizing (False).
+    tol : float
+        Tolerance on the relative tank margin (root-finding only).
+    max_iter : int
+        Maximum number of root-finding iterations.
+
+    Returns:
+    ndarray
+        Mission duration in days (NaN where even a zero-day mission does not fit).
+    """
+    if len(rates) == 1:
+        (phase, rate), = rates.items()
+        return max_phase_deltaV(phases, phase, capacity, W_final, chain) / rate
+
+    # Upper bound: the closed-form duration of each rated phase with the other rated phases at zero
+    zeroed = [(name, engine, 0.0 if k in rates else deltaV, Isp, reserve)
+              for k, (name, engine, deltaV, Isp, reserve) in enumerate(phases)]
+    bound = np.fmin.reduce([max_phase_deltaV(zeroed, k, capacity, W_final, chain) / rate for k, rate in rates.items()])
+
+    names, engines, deltaV, Isp, reserve, W_final = _phase_arrays(phases, W_final, map(np.shape, capacity.values()))
+    shape = W_final.shape
+    deltaV, Isp, reserve = (a.reshape(len(phases), -1) for a in (deltaV, Isp, reserve))
+    W_final = W_final.ravel()
+    capacity = {engine: np.broadcast_to(C, shape).ravel() for engine, C in capacity.items()}
+    rated = list(rates)
+    rate = np.array([rates[k] for k in rated], dtype=np.float64)[:, np.newaxis]
+
+    def margin(days, idx):
+        # Smallest relative tank margin of the variants idx for a mission of the given duration
+        dv = deltaV[:, idx].copy()
+        dv[rated] = rate * days
+        _, burned_per_lb, end_factor = _chain(np.exp(dv / (Isp[:, idx] * g)), reserve[:, idx], chain)
+        propellant = reserve[:, idx] * burned_per_lb * (W_final[idx] * end_factor)
+        propellant = np.where(end_factor > 0, propellant, np.inf)  # past the pole of the chain
+        return np.min([1 - propellant[[e == engine for e in engines]].sum(axis=0) / C[idx]
+                       for engine, C in capacity.items()], axis=0)
+
+    n = W_final.size
+    all_idx = np.arange(n)
+    days = np.full(n, np.nan)
+    lo, f_lo = np.zeros(n), margin(0.0, all_idx)
+    hi = np.broadcast_to(bound, shape).ravel().copy()
+    hi[~(hi > 0) | np.isinf(hi)] = 365.0
+    f_hi = margin(hi, all_idx)
+    # Bracket the root by doubling the duration where there is no finite bound
+    for _ in range(64):
+        grow = (f_lo >= 0) & (f_hi > 0)
+        if not grow.any():
+            break
+        lo[grow], f_lo[grow] = hi[grow], f_hi[grow]
+        hi[grow] *= 2
+        f_hi[grow] = margin(hi[grow], all_idx[grow])
+
+    # Illinois (modified regula falsi) iterations on the bracketed variants
+    active = np.flatnonzero((f_lo >= 0) & (f_hi <= 0))
+    days[(f_lo >= 0) & (f_hi > 0)] = np.inf
+    side = np.zeros(n, dtype=np.int8)
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+        a, b, fa, fb = lo[active], hi[active], f_lo[active], f_hi[active]
+        x = np.clip(b - fb * (b - a) / (fb - fa), a, b)
+        x = np.where(np.isfinite(x), x, 0.5 * (a + b))
+        fx = margin(x, active)
+        done = (np.abs(fx) <= tol) | (b - a <= tol * b)
+        days[active[done]] = x[done]
+
+        # Keep the bracket; halve the stale end point's value when the same side is kept twice
+        left = fx >= 0
+        lo[active[left]], f_lo[active[left]] = x[left], fx[left]
+        hi[active[~left]], f_hi[active[~left]] = x[~left], fx[~left]
+        stale_hi = left & (side[active] == 1)
+        stale_lo = ~left & (side[active] == -1)
+        f_hi[active[stale_hi]] *= 0.5
+        f_lo[active[stale_lo]] *= 0.5
+        side[active] = np.where(left, 1, -1)
+        active = active[~done]
+    return days.reshape(shape)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Multi-phase delta-V budget of a mission phase table.")
+    parser.add_argument("--mission", choices=MISSIONS, default="x37b")
+    parser.add_argument("--independent", action="store_true",
+                        help="size every phase off the entry weight (former propulsion scripts)")
+    parser.add_argument("--tanks", action="store_true",
+                        help="also report the orbit-keeping delta-V and days that the hasa/x37b.py tanks allow")
+    args = parser.parse_args(argv)
+    mission = MISSIONS[args.mission]
+
+    T_req_oms, T_req_qp, T_req_qv = thrust_requirements(mission["W_final"], mission["L_f"])
+    print(f"Required thrust for OMS: {T_req_oms:.2f} lbs")
+    print(f"Required thrust for primary RCS: {T_req_qp:.2f} lbs")
+    print(f"Required thrust for vernier RCS: {T_req_qv:.2f} lbs")
+
+    budget = phase_propellant(mission["phases"], mission["W_final"], chain=not args.independent)
+    for (name, engine, *_), burned in zip(mission["phases"], budget["burned"]):
+        print(f"{engine} Propellant weight for {name}: {burned:.2f} lbs")
+    for engine, total in budget["engines"].items():
+        print(f"Total {engine} Propellant weight (with reserve): {total:.2f} lbs")
+    W_ox = sum(OX_FRACTION[engine] * total for engine, total in budget["engines"].items())
+    print(f"Total propellant weight: {budget['W_prop']:.2f} lbs")
+    print(f"Total oxygen weight: {W_ox:.2f} lbs")
+    print(f"Total fuel weight: {budget['W_prop'] - W_ox:.2f} lbs")
+    print(f"Mass before the first phase: {budget['W_initial']:.2f} lbs")
+
+    for engine, total in budget["engines"].items():
+        V_ox, V_fuel = calculate_lox_lh2_volumes(total)
+        print(f"Volume of {engine} Oxygen (LOX): {V_ox:.2f} ft³")
+        print(f"Volume of {engine} Fuel (LH2): {V_fuel:.2f} ft³")
+    print(f"Total propellant weight in kg: {budget['W_prop']*0.45359237:.2f} kg")
+    print(f"Total oxygen weight in kg: {W_ox*0.45359237:.2f} kg")
+    print(f"Total fuel weight in kg: {(budget['W_prop'] - W_ox)*0.45359237:.2f} kg")
+
+    if args.tanks:
+        from hasa import x37b
+        capacity = {"OMS": tank_capacity(x37b.V_oms_tnk, 6, x37b.ullage_lox, x37b.ullage_lh2),
+                    "RCS": tank_capacity(x37b.V_rcs_tnk, 6, x37b.ullage_lox, x37b.ullage_lh2)}
+        orbit = [name for name, engine, *_ in mission["phases"]].index("orbit")
+        deltaV = max_phase_deltaV(mission["phases"], orbit, capacity, mission["W_final"], not args.independent)
+        print(f"Propellant capacity of the OMS/RCS tanks: {capacity['OMS']:.2f} / {capacity['RCS']:.2f} lbs")
+        if np.isnan(deltaV):
+            print("The other phases alone do not fit into the tanks")
+        else:
+            print(f"Maximum orbit-keeping delta V: {deltaV:.2f} fps ({deltaV / ORBIT_KEEPING_RATE:.1f} days)")
+
+
+if __name__ == "__main__":
+    main()
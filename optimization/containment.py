@@ -0,0 +1,304 @@
+import casadi
+import numpy as np
+from scipy.ndimage import distance_transform_edt
+
+# Containment of layout boxes in an arbitrary inner mold line (IML) through a signed distance field.
+#
+# The IML, given as a cross-section table (closed polygons at stations along z, lofted linearly) or
+# as a closed (watertight) triangle surface mesh, is sampled once into a signed distance grid (negative inside).
+# The layout constraint evaluates a CasADi interpolant of that grid ("linear": trilinear, or
+# "bspline": cubic, twice differentiable, but much slower to fit on large grids) at sample points of every box (by default its 8 corners),
+# so the cost per box is constant whatever the resolution of the table or mesh. Corners suffice for
+# shapes whose cross-sections are convex; sample more points per edge for concave ones.
+# Between stations the distance is measured in the section plane, which only differs from the
+# Euclidean distance away from the surface; the zero level set, which the constraint uses, is exact
+# up to the grid interpolation error (of the order of the grid spacing squared over the wall radius
+# of curvature, reduce spacing or use "bspline" for tightly curved walls).
+# The interpolants extrapolate past the grid (and trilinear cross terms quickly turn negative), so
+# points outside the grid are clamped to it and the distance to the grid box is added: the field stays
+# continuous and positive far from the shape. The layout solve also bounds the box centers so that
+# the boxes stay on the grid (center_bounds).
+# Usage:
+#   container = SignedDistanceGrid.from_sections(stations, sections, spacing=0.1)
+#   solve_layout(dimensions, None, None, init_centers, container=container)
+
+DEFAULT_PADDING = 3  # grid cells around the shape's bounding box
+BAND_CELLS = 3  # exact mesh distances up to this many grid spacings from the surface
+CROSSING_BLOCK = 1 << 18  # (grid line, triangle) pairs tested at once for the mesh inside test
+
+
+def superellipse_sections(half_widths, half_heights, exponent=2.0, n_vertices=64):
+    """
+    Cross-section polygons of a body with superelliptic sections |x/a|^e + |y/b|^e = 1.
+
+    Parameters:
+    half_widths, half_heights : array (m,)
+        Semi-axes a (x) and b (y) at each station.
+    exponent : float
+        2: ellipses; larger: boxier sections.
+
+    Returns:
+    array (m, n_vertices, 2)
+    """
+    theta = np.linspace(0, 2 * np.pi, n_vertices, endpoint=False)
+    c, s = np.cos(theta), np.sin(theta)
+    unit = np.column_stack([np.sign(c) * np.abs(c) ** (2 / exponent), np.sign(s) * np.abs(s) ** (2 / exponent)])
+    return unit * np.column_stack([half_widths, half_heights])[:, None, :]
+
+
+def polygon_distance(points, polygon):
+    """Signed distance (negative inside) of 2D points (N, 2) to a closed polygon (k, 2)."""
+    a, b = polygon, np.roll(polygon, -1, axis=0)
+    ab = b - a
+    ap = points[:, None, :] - a
+    t = np.clip(np.sum(ap * ab, axis=2) / np.sum(ab * ab, axis=1), 0, 1)
+    distance = np.sqrt(np.min(np.sum((ap - t[..., None] * ab) ** 2, axis=2), axis=1))
+    # Even-odd rule: crossings of a ray along +x
+    straddles = (a[:, 1] > points[:, 1:2]) != (b[:, 1] > points[:, 1:2])
+    x_cross = a[:, 0] + (points[:, 1:2] - a[:, 1]) * ab[:, 0] / np.where(ab[:, 1] == 0, 1, ab[:, 1])
+    inside = np.sum(straddles & (points[:, :1] < x_cross), axis=1) % 2 == 1
+    return np.where(inside, -distance, distance)
+
+
+def triangle_distance(points, triangles):
+    """Unsigned distance of points (N, 3) to a triangle soup (T, 3, 3)."""
+    a, b, c = triangles[:, 0], triangles[:, 1], triangles[:, 2]
+    ab, ac = b - a, c - a
+    normal = np.cross(ab, ac)
+    normal /= np.linalg.norm(normal, axis=1, keepdims=True)
+    ap = points[:, None, :] - a
+    # Projection on the plane, inside the triangle: distance to the plane
+    d_plane = np.sum(ap * normal, axis=2)
+    projected = ap - d_plane[..., None] * normal
+    d00, d01, d11 = np.sum(ab * ab, axis=1), np.sum(ab * ac, axis=1), np.sum(ac * ac, axis=1)
+    d20, d21 = np.sum(projected * ab, axis=2), np.sum(projected * ac, axis=2)
+    denominator = d00 * d11 - d01 ** 2
+    v = (d11 * d20 - d01 * d21) / denominator
+    w = (d00 * d21 - d01 * d20) / denominator
+    squared = np.where((v >= 0) & (w >= 0) & (v + w <= 1), d_plane ** 2, np.inf)
+    # Otherwise: distance to the closest edge
+    for p, q in ((a, b), (b, c), (c, a)):
+        pq = q - p
+        pp = points[:, None, :] - p
+        t = np.clip(np.sum(pp * pq, axis=2) / np.sum(pq * pq, axis=1), 0, 1)
+        squared = np.minimum(squared, np.sum((pp - t[..., None] * pq) ** 2, axis=2))
+    return np.sqrt(squared.min(axis=1))
+
+
+def vertical_crossings(x, y, triangles, block=CROSSING_BLOCK):
+    """
+    Heights z at which the vertical lines through the grid points (x_i, y_j) cross a triangle soup.
+
+    Every triangle is binned on the grid by its xy bounding box, so a line is only tested against the
+    triangles that can cover it; the (line, triangle) pairs are processed in chunks of at most block
+    pairs (one large triangle may exceed it).
+
+    Parameters:
+    x, y : array (nx,), (ny,)
+        Increasing grid coordinates of the lines.
+    triangles : array (T, 3, 3)
+
+    Returns:
+    list of len(x) * len(y) arrays
+        Sorted crossing heights per line, line (i, j) at index i * len(y) + j.
+    """
+    lower, upper = triangles[:, :, :2].min(axis=1), triangles[:, :, :2].max(axis=1)
+    i0, i1 = np.searchsorted(x, lower[:, 0]), np.searchsorted(x, upper[:, 0], side="right")
+    j0, j1 = np.searchsorted(y, lower[:, 1]), np.searchsorted(y, upper[:, 1], side="right")
+    nj = np.maximum(j1 - j0, 0)
+    counts = np.maximum(i1 - i0, 0) * nj
+    ends = np.cumsum(counts)
+    cross = lambda u, v: u[..., 0] * v[..., 1] - u[..., 1] * v[..., 0]
+    lines, heights = [], []
+    start = 0
+    while start < len(triangles):
+        first = ends[start] - counts[start]  # pairs before this chunk
+        stop = max(np.searchsorted(ends, first + block, side="right"), start + 1)
+        index = np.repeat(np.arange(start, stop), counts[start:stop])
+        offset = np.arange(first, ends[stop - 1]) - np.repeat(ends[start:stop] - counts[start:stop], counts[start:stop])
+        i, j = i0[index] + offset // nj[index], j0[index] + offset % nj[index]
+        t = triangles[index]
+        a, b, c = t[:, 0, :2], t[:, 1, :2], t[:, 2, :2]
+        p = np.column_stack([x[i], y[j]])
+        det = cross(b - a, c - a)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            v, w = cross(p - a, c - a) / det, cross(b - a, p - a) / det
+            z = t[:, 0, 2] + v * (t[:, 1, 2] - t[:, 0, 2]) + w * (t[:, 2, 2] - t[:, 0, 2])
+            hit = (det != 0) & (v >= 0) & (w >= 0) & (v + w <= 1)
+        lines.append((i * len(y) + j)[hit])
+        heights.append(z[hit])
+        start = stop
+    lines, heights = np.concatenate(lines or [[]]).astype(int), np.concatenate(heights or [[]])
+    order = np.lexsort((heights, lines))
+    bounds = np.searchsorted(lines[order], np.arange(len(x) * len(y) + 1))
+    return np.split(heights[order], bounds[1:-1])
+
+
+def _grid_axes(lower, upper, spacing, padding):
+    return [np.arange(lo - padding * spacing, hi + (padding + 1) * spacing, spacing) for lo, hi in zip(lower, upper)]
+
+
+class SignedDistanceGrid:
+    """
+    Signed distance field (negative inside) sampled on a regular grid, with CasADi interpolation.
+
+    Parameters:
+    axes : list of 3 arrays
+        Grid coordinates along x, y, z (increasing).
+    values : array (nx, ny, nz)
+        Signed distances at the grid points.
+    method : str
+        "linear" (trilinear) or "bspline" (cubic).
+    points_per_edge : int
+        Sample points per box edge constrained inside (2: the corners).
+    """
+
+    def __init__(self, axes, values, method="linear", points_per_edge=2):
+        self.axes = [np.asarray(axis, dtype=float) for axis in axes]
+        self.values = np.asarray(values, dtype=float)
+        self.method = method
+        self.points_per_edge = points_per_edge
+        self._function = None
+
+    @classmethod
+    def from_sections(cls, stations, sections, spacing, padding=DEFAULT_PADDING, **options):
+        """
+        From a cross-section table: closed polygons with corresponding vertices at stations along z.
+
+        Parameters:
+        stations : array (m,)
+            Increasing z of the sections.
+        sections : array (m, k, 2)
+            Section polygons (x, y); linearly interpolated between stations, closed by the end sections.
+        spacing : float
+            Grid spacing.
+        options
+            method, points_per_edge (see SignedDistanceGrid).
+        """
+        stations = np.asarray(stations, dtype=float)
+        sections = np.asarray(sections, dtype=float)
+        points = sections.reshape(-1, 2)
+        axes = _grid_axes([*points.min(axis=0), stations[0]], [*points.max(axis=0), stations[-1]], spacing, padding)
+        X, Y = np.meshgrid(axes[0], axes[1], indexing="ij")
+        plane = np.column_stack([X.ravel(), Y.ravel()])
+        values = np.empty([len(axis) for axis in axes])
+        for k, z in enumerate(axes[2]):
+            # In-plane distance to the interpolated section, combined with the distance to the end planes
+            s = np.clip(np.interp(z, stations, np.arange(len(stations))), 0, len(stations) - 1)
+            i = min(int(s), len(stations) - 2)
+            section = sections[i] + (s - i) * (sections[i + 1] - sections[i])
+            radial = polygon_distance(plane, section)
+            axial = max(stations[0] - z, z - stations[-1])
+            outside = np.hypot(np.maximum(radial, 0), max(axial, 0))
+            values[:, :, k] = (outside + np.minimum(np.maximum(radial, axial), 0)).reshape(X.shape)
+        return cls(axes, values, **options)
+
+    @classmethod
+    def from_mesh(cls, vertices, faces, spacing, padding=DEFAULT_PADDING, tile=8, **options):
+        """
+        From a closed triangle surface mesh.
+
+        Parameters:
+        vertices : array (V, 3)
+        faces : array (T, 3)
+            Vertex indices.
+        spacing : float
+            Grid spacing.
+        tile : int
+            Grid points per side of the blocks the band distances are computed for.
+        options
+            method, points_per_edge (see SignedDistanceGrid).
+        """
+        vertices = np.asarray(vertices, dtype=float)
+        triangles = vertices[np.asarray(faces)]
+        axes = _grid_axes(vertices.min(axis=0), vertices.max(axis=0), spacing, padding)
+        values = np.empty([len(axis) for axis in axes])
+
+        # Exact unsigned distance in a band around the surface, per block of grid points against the
+        # triangles whose bounding box is within the band of the block
+        band = BAND_CELLS * spacing
+        lower, upper = triangles.min(axis=1), triangles.max(axis=1)
+        for i, j, k in np.ndindex(*[-(-len(axis) // tile) for axis in axes]):
+            block = [axis[n * tile:(n + 1) * tile] for axis, n in zip(axes, (i, j, k))]
+            lo, hi = np.array([b[0] for b in block]), np.array([b[-1] for b in block])
+            near = np.linalg.norm(np.maximum(np.maximum(lower - hi, lo - upper), 0), axis=1) <= band
+            points = np.stack(np.meshgrid(*block, indexing="ij"), axis=-1)
+            distance = np.full(points.shape[:3], np.nan)
+            if near.any():
+                distance = triangle_distance(points.reshape(-1, 3), triangles[near]).reshape(distance.shape)
+                distance[distance > band] = np.nan
+            values[i * tile:(i + 1) * tile, j * tile:(j + 1) * tile, k * tile:(k + 1) * tile] = distance
+        # Elsewhere: through the closest band point b, |p - b| + d(b) (an upper bound, within about a
+        # grid spacing of the distance)
+        far = np.isnan(values)
+        offset, index = distance_transform_edt(far, sampling=spacing, return_indices=True)
+        values[far] = (values[tuple(index)] + offset)[far]
+
+        # Sign: parity of the surface crossings below each point along its vertical grid line (the
+        # lines are shifted by a tiny irrational offset so they do not run through mesh edges)
+        shift = 1e-7 * spacing * np.array([np.sqrt(2), np.sqrt(3)])
+        crossings = vertical_crossings(axes[0] + shift[0], axes[1] + shift[1], triangles)
+        inside = np.array([np.searchsorted(z, axes[2]) % 2 == 1 for z in crossings]).reshape(values.shape)
+        values[inside] *= -1
+        return cls(axes, values, **options)
+
+    @property
+    def function(self):
+        """CasADi interpolant (3, N) -> (1, N) of the signed distance (built on first use)."""
+        if self._function is None:
+            self._function = casadi.interpolant("sdf", self.method, self.axes, self.values.ravel(order="F"))
+        return self._function
+
+    def __getstate__(self):  # (the CasADi function is rebuilt after unpickling, e.g. in worker processes)
+        return {**self.__dict__, "_function": None}
+
+    def __call__(self, points):
+        """Signed distance at points (N, 3)."""
+        points = np.asarray(points, dtype=float)
+        lower, upper = [axis[0] for axis in self.axes], [axis[-1] for axis in self.axes]
+        clamped = np.clip(points, lower, upper)
+        return np.asarray(self.function(clamped.T)).ravel() + np.linalg.norm(points - clamped, axis=1)
+
+    def _symbolic(self, points):
+        """Signed distance at CasADi points (3, N), clamped to the grid as __call__."""
+        n = points.shape[1]
+        lower = casadi.repmat(casadi.DM([axis[0] for axis in self.axes]), 1, n)
+        upper = casadi.repmat(casadi.DM([axis[-1] for axis in self.axes]), 1, n)
+        clamped = casadi.fmin(casadi.fmax(points, lower), upper)
+        # sqrt(r^2 + h^2) - h (h: grid spacing) for the distance r to the grid box: positive outside
+        # and twice differentiable at the grid boundary, where r^2 has a kink in its second derivative
+        h = min(axis[1] - axis[0] for axis in self.axes)
+        return self.function(clamped) + casadi.sqrt(casadi.sum1((points - clamped) ** 2) + h ** 2) - h
+
+    def sample_offsets(self):
+        """Sample points of the unit box centered on the origin: a lattice over its surface (2: the corners)."""
+        u = np.linspace(-0.5, 0.5, self.points_per_edge)
+        lattice = np.stack(np.meshgrid(u, u, u, indexing="ij"), axis=-1).reshape(-1, 3)
+        return lattice[np.any(np.abs(lattice) == 0.5, axis=1)]
+
+    def box_distances(self, x, y, z, dimensions):
+        """
+        Signed distance at the sample points of every box, for centers given as arrays or CasADi expressions.
+
+        Returns:
+        (1, n * s) row (CasADi) or array (n * s,) (numpy), s = sample points per box.
+        """
+        offsets = self.sample_offsets()
+        if isinstance(x, np.ndarray):
+            centers = np.column_stack([x, y, z])
+            return self((centers[:, None, :] + offsets * dimensions[:, None, :]).reshape(-1, 3))
+        coordinates = [casadi.vertcat(*[c + dimensions[:, axis] * o for o in offsets[:, axis]])
+                       for axis, c in enumerate((x, y, z))]
+        return self._symbolic(casadi.horzcat(*coordinates).T)
+
+    def center_bounds(self, dimensions):
+        """Bounds (lower, upper), arrays (n, 3), on box centers that keep the whole boxes on the grid."""
+        half = np.asarray(dimensions, dtype=float) / 2
+        return (np.array([axis[0] for axis in self.axes]) + half, np.array([axis[-1] for axis in self.axes]) - half)
+
+    def violation(self, centers, dimensions):
+        """Largest containment violation (>= 0) of boxes, as layout.containment_violation."""
+        centers = np.asarray(centers, dtype=float)
+        distances = self.box_distances(centers[:, 0], centers[:, 1], centers[:, 2],
+                                       np.asarray(dimensions, dtype=float))
+        return float(max(0.0, distances.max()))
@@ -0,0 +1,278 @@
+import time
+
+import aerosandbox as asb
+import aerosandbox.numpy as np
+import numpy as onp
+
+# Box layout optimization inside a cylinder (the problem of layout_optimization_test.py as a
+# library). The box centers are three asb.Opti vectors x, y, z; containment and non-overlap are
+# vectorized constraints over index arrays, so the problem size does not grow the Python loop.
+#
+# Non-overlap ("axes", as the original script): |c_i - c_j| >= (d_i + d_j) / 2 on every axis.
+# That is stricter than needed (boxes only have to be separated along one axis) and non-smooth.
+# The disjunctive modes use the smooth normalized gap g_a = (D_a^2 - s_a^2) / (D_a^2 + s_a^2) in
+# [-1, 1) per axis (D: center distance, s: separation), which is >= 0 where the pair is apart:
+#  - "softmax": the log-sum-exp of k * g_a, minus log(3) so it never exceeds max_a g_a, is >= 0
+#    (conservative by a small gap, about 3% of s for k = SOFTMAX_SHARPNESS);
+#  - "complementarity": sum_a w_a * g_a >= 0 with weights w_a >= 0 summing to one (three
+#    variables per pair), exact since the weights can pick the separating axis.
+# With broad_phase=True only the pairs whose bounding boxes, grown by a margin, touch at the
+# current iterate get these constraints (sweep-and-prune on x, then y/z overlap tests). After each
+# solve the contacts are recomputed around the new iterate; if any box still overlaps another,
+# the new candidate pairs are added lazily and the problem is re-solved from the last solution.
+#
+# Objectives: "pairwise" sums |c_i - c_j| over all pairs (the original, O(n^2) terms);
+# "dispersion" sums |c_i - mean(c)|^2 (n times the sum of squared pairwise distances, O(n) terms);
+# "anchor" sums |c_i - c_i,init|^2 (legalizes a drafted layout with the least displacement).
+# With a container (a SignedDistanceGrid of containment.py) the boxes are kept inside an arbitrary
+# inner mold line instead of the cylinder.
+# Usage: see layout_optimization_test.py and benchmarks/layout_broad_phase.py
+
+OBJECTIVES = ("pairwise", "dispersion", "anchor")
+SEPARATIONS = ("axes", "softmax", "complementarity")
+SOFTMAX_SHARPNESS = 40.0
+FEASIBILITY_TOL = 1e-5  # overlap / containment violation accepted in a solution (IPOPT tolerance)
+
+
+def all_pairs(n):
+    """Index arrays (I, J) of every pair i < j."""
+    return onp.triu_indices(n, k=1)
+
+
+def candidate_pairs(centers, dimensions, margin=0.0):
+    """
+    Broad phase: pairs whose axis-aligned boxes, each grown by margin, overlap (sweep-and-prune).
+
+    Parameters:
+    centers : array (n, 3)
+        Box centers.
+    dimensions : array (n, 3)
+        Box dimensions (width, length, height).
+    margin : float
+        Growth of every half-dimension; a negative margin finds boxes overlapping by more than -margin.
+
+    Returns:
+    tuple : (I, J)
+        Index arrays with I < J.
+    """
+    centers = onp.asarray(centers, dtype=float)
+    half = onp.asarray(dimensions, dtype=float) / 2 + margin
+    lo, hi = centers - half, centers + half
+
+    # Sweep along x: after sorting by the lower bound, box order[a] can only touch the boxes
+    # order[a + 1 .. end[a] - 1] whose lower x bound is below its upper x bound
+    order = onp.argsort(lo[:, 0], kind="stable")
+    lo_sorted = lo[order, 0]
+    end = onp.searchsorted(lo_sorted, hi[order, 0], side="right")
+    counts = onp.maximum(end - onp.arange(1, len(order) + 1), 0)
+    a = onp.repeat(onp.arange(len(order)), counts)
+    b = a + 1 + onp.arange(counts.sum()) - onp.repeat(onp.cumsum(counts) - counts, counts)
+    I, J = order[a], order[b]
+
+    # Narrow the candidates with the y and z intervals
+    touching = onp.all((lo[I, 1:] < hi[J, 1:]) & (lo[J, 1:] < hi[I, 1:]), axis=1)
+    I, J = I[touching], J[touching]
+    return onp.minimum(I, J), onp.maximum(I, J)
+
+
+def overlapping_pairs(centers, dimensions, tol=FEASIBILITY_TOL):
+    """Pairs of boxes that overlap by more than tol."""
+    return candidate_pairs(centers, dimensions, margin=-tol)
+
+
+def containment_violation(centers, dimensions, R_cyl, H_cyl):
+    """Largest violation (>= 0) of the cylinder containment constraints."""
+    centers = onp.asarray(centers, dtype=float)
+    half = onp.asarray(dimensions, dtype=float) / 2
+    radial = onp.hypot(centers[:, 0], centers[:, 1]) - (R_cyl - onp.maximum(half[:, 0], half[:, 1]))
+    axial = onp.abs(centers[:, 2]) - (H_cyl / 2 - half[:, 2])
+    return float(max(0.0, radial.max(), axial.max()))
+
+
+class LayoutProblem:
+    """
+    asb.Opti layout problem to which non-overlap constraints can be added between solves.
+
+    Example:
+        problem = LayoutProblem(dimensions, R_cyl=5, H_cyl=20, init_centers=centers)
+        problem.add_pairs(*candidate_pairs(centers, dimensions, margin=0.5))
+        centers = problem.solve()
+    """
+
+    def __init__(self, dimensions, R_cyl, H_cyl, init_centers, objective="dispersion", separation="axes",
+                 container=None):
+        if objective not in OBJECTIVES:
+            raise ValueError(f"Unknown objective: {objective} (one of {OBJECTIVES})")
+        if separation not in SEPARATIONS:
+            raise ValueError(f"Unknown separation: {separation} (one of {SEPARATIONS})")
+        self.dimensions = onp.asarray(dimensions, dtype=float)
+        self.R_cyl, self.H_cyl = R_cyl, H_cyl
+        self.separation = separation
+        self.container = container
+        self.n = len(self.dimensions)
+        self.pairs = set()
+        self.iterations = []  # IPOPT iterations per solve
+        self.timings = []  # wall time splits per solve
+        half = self.dimensions / 2
+        init_centers = onp.asarray(init_centers, dtype=float)
+        self.guess = init_centers  # current initial guess
+
+        opti = self.opti = asb.Opti()
+        if container is not None:
+            # Bounds keep the boxes on the grid of the signed distance field
+            lower, upper = container.center_bounds(self.dimensions)
+            self.x, self.y, self.z = (opti.variable(init_guess=init_centers[:, axis], lower_bound=lower[:, axis],
+                                                    upper_bound=upper[:, axis]) for axis in range(3))
+            # Sample points of every box (its corners by default) inside the signed distance field
+            opti.subject_to(container.box_distances(self.x, self.y, self.z, self.dimensions) <= 0)
+        else:
+            self.x = opti.variable(init_guess=init_centers[:, 0])
+            self.y = opti.variable(init_guess=init_centers[:, 1])
+            # Height constraint along the z-axis, considering the half-height of the box
+            self.z = opti.variable(init_guess=init_centers[:, 2], lower_bound=-H_cyl / 2 + half[:, 2],
+                                   upper_bound=H_cyl / 2 - half[:, 2])
+            # Radial distance constraint in the xy-plane, considering the half-widths of the box
+            max_allowed_distance = R_cyl - onp.maximum(half[:, 0], half[:, 1])
+            opti.subject_to(self.x ** 2 + self.y ** 2 <= max_allowed_distance ** 2)
+
+        if objective == "pairwise":
+            I, J = all_pairs(self.n)
+            self.objective = np.sum(((self.x[I] - self.x[J]) ** 2 + (self.y[I] - self.y[J]) ** 2
+                                     + (self.z[I] - self.z[J]) ** 2) ** 0.5)
+        elif objective == "anchor":
+            self.objective = np.sum((self.x - init_centers[:, 0]) ** 2 + (self.y - init_centers[:, 1]) ** 2
+                                    + (self.z - init_centers[:, 2]) ** 2)
+        else:
+            self.objective = np.sum((self.x - np.mean(self.x)) ** 2 + (self.y - np.mean(self.y)) ** 2
+                                    + (self.z - np.mean(self.z)) ** 2)
+        opti.minimize(self.objective)
+
+    def add_pairs(self, I, J):
+        """Adds non-overlap constraints for the pairs (I[k], J[k]) not constrained yet; returns how many."""
+        new = [(i, j) for i, j in zip(onp.asarray(I).tolist(), onp.asarray(J).tolist()) if (i, j) not in self.pairs]
+        if not new:
+            return 0
+        self.pairs.update(new)
+        I, J = onp.array(new).T
+        sep = (self.dimensions[I] + self.dimensions[J]) / 2
+        axes = (self.x, self.y, self.z)
+        if self.separation == "axes":
+            # Constraint to prevent overlap along each axis
+            for axis, c in enumerate(axes):
+                self.opti.subject_to(np.fabs(c[I] - c[J]) >= sep[:, axis])
+            return len(new)
+
+        gaps = [((c[I] - c[J]) ** 2 - sep[:, axis] ** 2) / ((c[I] - c[J]) ** 2 + sep[:, axis] ** 2)
+                for axis, c in enumerate(axes)]
+        if self.separation == "softmax":
+            k = SOFTMAX_SHARPNESS
+            self.opti.subject_to(np.log(sum(np.exp(k * g) for g in gaps)) >= np.log(3.0))
+        else:
+            # Initial weights: a soft choice of the most separated axis at the initial guess
+            D = self.guess[I] - self.guess[J]
+            g0 = (D ** 2 - sep ** 2) / (D ** 2 + sep ** 2)
+            w0 = onp.exp(5 * (g0 - g0.max(axis=1, keepdims=True)))
+            w0 /= w0.sum(axis=1, keepdims=True)
+            weights = [self.opti.variable(init_guess=w0[:, axis], lower_bound=0, upper_bound=1) for axis in range(3)]
+            self.opti.subject_to([sum(weights) == 1, sum(w * g for w, g in zip(weights, gaps)) >= 0])
+        return len(new)
+
+    def solve(self, max_iter=1000, verbose=False, callback=None):
+        """Solves from the current initial guess (the last solution after the first solve)."""
+        start = time.perf_counter()
+        sol = self.opti.solve(max_iter=max_iter, verbose=verbose, callback=callback, behavior_on_failure="return_last")
+        stats = sol.stats()
+        self.iterations.append(stats["iter_count"])
+        self.success = stats["success"]
+        # Measured wall time of the solve ("wall"), IPOPT's own ("total") and of the IPOPT callbacks
+        # into CasADi (nlp_f, nlp_jac_g, ...)
+        self.timings.append({"wall": time.perf_counter() - start,
+                             **{k[len("t_wall_"):]: v for k, v in stats.items() if k.startswith("t_wall_")}})
+        centers = onp.column_stack([sol.value(self.x), sol.value(self.y), sol.value(self.z)])
+        self.objective_value = float(sol.value(self.objective))
+        for var, values in zip((self.x, self.y, self.z), centers.T):
+            self.opti.set_initial(var, values)
+        self.guess = centers
+        return centers
+
+
+def solve_layout(dimensions, R_cyl, H_cyl, init_centers, broad_phase=True, margin=None, objective="dispersion",
+                 separation="axes", max_rounds=20, max_iter=1000, verbose=False, callback=None, telemetry=None,
+                 constraints=None, container=None):
+    """
+    Packs boxes into the cylinder, adding non-overlap constraints lazily with a broad phase.
+
+    Parameters:
+    dimensions : array (n, 3)
+        Box dimensions (width, length, height).
+    R_cyl, H_cyl : float
+        Cylinder radius and height (centered on the origin, axis along z); unused with a container.
+    init_centers : array (n, 3)
+        Initial guess of the box centers.
+    broad_phase : bool
+        False: constrain every pair up front (as layout_optimization_test.py).
+    margin : float
+        Growth of the half-dimensions for the broad phase (default: the mean box dimension).
+    objective, separation : str
+        See OBJECTIVES and SEPARATIONS.
+    max_rounds : int
+        Maximum number of solves.
+    max_iter : int
+        IPOPT iterations per solve.
+    verbose : bool
+        IPOPT output.
+    callback : callable
+        Passed to opti.solve.
+    telemetry : SolverTelemetry
+        Attached to the problem and used as the callback (see telemetry.py); any object whose
+        attach(problem) returns a callback works.
+    constraints : callable
+        Called with the LayoutProblem before the first solve to add problem-specific constraints,
+        e.g. lambda problem: constrain_cg(problem, masses, upper=(None, None, 0)) (mass_properties.py).
+    container : SignedDistanceGrid
+        Arbitrary container shape instead of the cylinder (see containment.py).
+
+    Returns:
+    dict
+        "centers", "objective", "feasible" (no overlaps and contained), "rounds" (solves),
+        "iterations" (IPOPT iterations in total), "n_pairs" (constrained pairs), "wall_time" (s)
+        and "problem" (the LayoutProblem).
+    """
+    start = time.perf_counter()
+    dimensions = onp.asarray(dimensions, dtype=float)
+    init_centers = onp.asarray(init_centers, dtype=float)
+    margin = float(dimensions.mean()) if margin is None else margin
+    problem = LayoutProblem(dimensions, R_cyl, H_cyl, init_centers, objective, separation, container)
+    if telemetry is not None:
+        callback = telemetry.attach(problem)
+    if constraints is not None:
+        constraints(problem)
+
+    if broad_phase:
+        problem.add_pairs(*candidate_pairs(init_centers, dimensions, margin))
+    else:
+        problem.add_pairs(*all_pairs(len(dimensions)))
+
+    for _ in range(max_rounds):
+        centers = problem.solve(max_iter, verbose, callback)
+        if not broad_phase or overlapping_pairs(centers, dimensions)[0].size == 0:
+            break
+        # New contacts: constrain the pairs around the current iterate and re-solve from it
+        if problem.add_pairs(*candidate_pairs(centers, dimensions, margin)) == 0:
+            break
+
+    if container is not None:
+        violation = container.violation(centers, dimensions)
+    else:
+        violation = containment_violation(centers, dimensions, R_cyl, H_cyl)
+    feasible = problem.success and overlapping_pairs(centers, dimensions)[0].size == 0 and violation <= FEASIBILITY_TOL
+    return {
+        "centers": centers,
+        "objective": problem.objective_value,
+        "feasible": bool(feasible),
+        "rounds": len(problem.iterations),
+        "iterations": int(sum(problem.iterations)),
+        "n_pairs": len(problem.pairs),
+        "wall_time": time.perf_counter() - start,
+        "problem": problem,
+    }
@@ -0,0 +1,120 @@
+import aerosandbox.numpy as np
+import numpy as onp
+
+from hasa.vectorized import weight_breakdown
+from hasa.x37b import x37b_inputs
+
+# Mass properties (total mass, center of gravity and inertia tensor about the CG) of a packed
+# layout of uniform solid boxes, with component masses from the HASA weight build-up.
+#
+# Everything is computed from mass-weighted sums over the boxes, O(n) in one vectorized pass:
+#   M = sum m_i,  CG = sum m_i c_i / M,
+#   I = sum [I_box,i + m_i (|c_i|^2 E - c_i c_i^T)] - M (|CG|^2 E - CG CG^T),
+# with I_box = m / 12 diag(l^2 + h^2, w^2 + h^2, w^2 + l^2) for a box of width w (x), length l (y)
+# and height h (z). mass_properties takes centers of any leading batch shape (n layouts at once);
+# mass_properties_opti builds the same quantities as asb.Opti expressions of a LayoutProblem, so
+# CG limits can be constraints of the layout solve (constrain_cg).
+# Units follow the inputs: lb and ft give lb ft^2.
+
+# Packable components of the HASA build-up: name -> HASA outputs summed into its mass
+HASA_COMPONENTS = {
+    "oms_tank": ("W_oms_tnk",),
+    "rcs_tank": ("W_rcs_tnk",),
+    "oms_engine": ("W_oms_eng", "W_oms_install"),
+    "oms_pressurization": ("W_oms_press",),
+    "rcs_pressurization": ("W_rcs_press",),
+    "avionics": ("W_tavcs",),
+    "electrical": ("W_eps",),
+    "surface_control_actuators": ("W_sca",),
+}
+
+
+def hasa_component_masses(inputs=None, components=HASA_COMPONENTS):
+    """Masses (lb) of the packable components, from the HASA build-up (default: X-37B inputs)."""
+    weights = weight_breakdown(x37b_inputs() if inputs is None else inputs)
+    return {name: sum(weights[output] for output in outputs) for name, outputs in components.items()}
+
+
+def _properties(x, y, z, dimensions, masses, sum_):
+    """Mass properties from the center coordinates (arrays or CasADi expressions)."""
+    w, l, h = (dimensions[:, axis] for axis in range(3))
+    M = onp.sum(masses)
+    cg = [sum_(c * masses) / M for c in (x, y, z)]  # (expression first: CasADi, not numpy, multiplies)
+    # Inertia of the boxes about their own centers plus the parallel-axis terms about the origin
+    Sxx, Syy, Szz = (sum_(c * c * masses) for c in (x, y, z))
+    Sxy, Syz, Sxz = sum_(x * y * masses), sum_(y * z * masses), sum_(x * z * masses)
+    own = [onp.sum(masses * (b ** 2 + c ** 2)) / 12 for b, c in ((l, h), (w, h), (w, l))]
+    inertia = {
+        "Ixx": own[0] + Syy + Szz - M * (cg[1] ** 2 + cg[2] ** 2),
+        "Iyy": own[1] + Sxx + Szz - M * (cg[0] ** 2 + cg[2] ** 2),
+        "Izz": own[2] + Sxx + Syy - M * (cg[0] ** 2 + cg[1] ** 2),
+        "Ixy": -(Sxy - M * cg[0] * cg[1]),
+        "Iyz": -(Syz - M * cg[1] * cg[2]),
+        "Ixz": -(Sxz - M * cg[0] * cg[2]),
+    }
+    return M, cg, inertia
+
+
+def mass_properties(centers, dimensions, masses):
+    """
+    Mass, CG and inertia tensor of layouts of uniform solid boxes.
+
+    Parameters:
+    centers : array (..., n, 3)
+        Box centers; leading dimensions are a batch of layouts.
+    dimensions : array (n, 3)
+        Box dimensions (width, length, height).
+    masses : array (n,)
+        Box masses.
+
+    Returns:
+    dict
+        "mass" (float), "cg" (..., 3) and "inertia" (..., 3, 3) about the CG.
+    """
+    centers = onp.asarray(centers, dtype=float)
+    dimensions = onp.asarray(dimensions, dtype=float)
+    masses = onp.asarray(masses, dtype=float)
+    M, cg, I = _properties(centers[..., 0], centers[..., 1], centers[..., 2], dimensions, masses,
+                           lambda a: onp.sum(a, axis=-1))
+    inertia = onp.stack([onp.stack([I["Ixx"], I["Ixy"], I["Ixz"]], axis=-1),
+                         onp.stack([I["Ixy"], I["Iyy"], I["Iyz"]], axis=-1),
+                         onp.stack([I["Ixz"], I["Iyz"], I["Izz"]], axis=-1)], axis=-2)
+    return {"mass": float(M), "cg": onp.stack(cg, axis=-1), "inertia": inertia}
+
+
+def mass_properties_opti(problem, masses):
+    """
+    Mass properties of a LayoutProblem as asb.Opti expressions of its box centers.
+
+    Returns:
+    dict
+        "mass" (float), "cg" (list of 3 expressions) and "inertia" (dict Ixx, Iyy, Izz, Ixy, Iyz, Ixz).
+    """
+    M, cg, inertia = _properties(problem.x, problem.y, problem.z, problem.dimensions,
+                                 onp.asarray(masses, dtype=float), np.sum)
+    return {"mass": float(M), "cg": cg, "inertia": inertia}
+
+
+def constrain_cg(problem, masses, lower=None, upper=None):
+    """
+    Adds CG limits to a LayoutProblem.
+
+    Parameters:
+    problem : LayoutProblem
+    masses : array (n,)
+        Box masses.
+    lower, upper : array (3,)
+        Bounds on the CG coordinates (None or NaN entries are not constrained).
+
+    Returns:
+    dict
+        The mass properties expressions (see mass_properties_opti).
+    """
+    properties = mass_properties_opti(problem, masses)
+    for bounds, sign in ((lower, 1), (upper, -1)):
+        if bounds is None:
+            continue
+        for cg, bound in zip(properties["cg"], bounds):
+            if bound is not None and not onp.isnan(bound):
+                problem.opti.subject_to(sign * (cg - bound) >= 0)
+    return properties
@@ -0,0 +1,80 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from optimization.layout import solve_layout
+
+# Multi-start layout optimization. One solve finds one local optimum, which depends on the
+# initial guess; here K random layouts inside the cylinder are solved concurrently in a process
+# pool (every worker builds its own asb.Opti problem) and the best feasible packing is kept.
+#
+# Start k draws its layout from the k-th child of np.random.SeedSequence(seed), so results are
+# reproducible and independent of the number of worker processes.
+# Usage: see benchmarks/layout_multistart.py
+
+
+def random_layout(dimensions, R_cyl, H_cyl, rng):
+    """Box centers drawn uniformly inside the region each box can occupy (may overlap)."""
+    half = np.asarray(dimensions, dtype=float) / 2
+    n = len(half)
+    r = (R_cyl - np.maximum(half[:, 0], half[:, 1])) * np.sqrt(rng.uniform(0, 1, n))
+    theta = rng.uniform(0, 2 * np.pi, n)
+    z = rng.uniform(-1, 1, n) * (H_cyl / 2 - half[:, 2])
+    return np.column_stack([r * np.cos(theta), r * np.sin(theta), z])
+
+
+def _run_start(k, dimensions, R_cyl, H_cyl, init_centers, seed, options):
+    if init_centers is None:
+        init_centers = random_layout(dimensions, R_cyl, H_cyl, np.random.default_rng(seed))
+    result = solve_layout(dimensions, R_cyl, H_cyl, init_centers, **options)
+    del result["problem"]  # not picklable
+    result["start"] = k
+    return result
+
+
+def multistart_layout(dimensions, R_cyl, H_cyl, n_starts=16, init_centers=None, workers=None, seed=0, **options):
+    """
+    Solves the layout problem from n_starts initial layouts in parallel.
+
+    Parameters:
+    dimensions : array (n, 3)
+        Box dimensions (width, length, height).
+    R_cyl, H_cyl : float
+        Cylinder radius and height.
+    n_starts : int
+        Number of starts.
+    init_centers : array (n, 3)
+        Optional hand-picked initial guess, used as start 0 (the others are random).
+    workers : int
+        Number of worker processes (default: os.cpu_count()); 1 runs in-process.
+    seed : int
+        Root seed; start k uses the k-th child of np.random.SeedSequence(seed).
+    **options
+        Passed to solve_layout (objective, separation, broad_phase, ...).
+
+    Returns:
+    dict
+        "best" (result of solve_layout with the lowest objective among the feasible starts,
+        None if no start is feasible), "starts" (per-start results in start order, without
+        the problem) and "wall_time" (s).
+    """
+    start = time.perf_counter()
+    workers = workers or os.cpu_count()
+    seeds = np.random.SeedSequence(seed).spawn(n_starts)
+    tasks = [(k, dimensions, R_cyl, H_cyl, init_centers if k == 0 else None, seeds[k], options)
+             for k in range(n_starts)]
+
+    if workers == 1:
+        starts = [_run_start(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, n_starts)) as pool:
+            starts = list(pool.map(_run_start, *zip(*tasks)))
+
+    feasible = [result for result in starts if result["feasible"]]
+    return {
+        "best": min(feasible, key=lambda result: result["objective"]) if feasible else None,
+        "starts": starts,
+        "wall_time": time.perf_counter() - start,
+    }
@@ -0,0 +1,114 @@
+import time
+
+import aerosandbox as asb
+import aerosandbox.numpy as np
+
+from hasa.model import check_inputs
+from hasa.vectorized import build_up
+from hasa.x37b import x37b_inputs
+from sizing import fixed_inputs, propulsion_inputs
+
+# Gradient-based maximization of the allowable payload over the vehicle geometry.
+# The HASA build-up (hasa.vectorized.build_up) and the propulsion relations
+# (propulsion_analysis_no_ascent.py via sizing.propulsion_inputs) are evaluated with
+# aerosandbox.numpy (passed as xp), so asb.Opti traces them and IPOPT gets exact derivatives.
+#
+# The gross weight is held at the X-37B value; the propulsion inputs follow from it and from L_f.
+# The fuselage is scaled photographically with L_f (S_btot ~ L_f^2, V_tot ~ L_f^3) and has to
+# keep room for the OMS/RCS tanks plus the payload bay volume of the X-37B baseline.
+#
+# Note: wing_weight_func takes cos(degrees(sweep_angle)), which oscillates with a period of
+# about 0.11 deg, so the sweep term of the published HASA relation (cos of the sweep in radians)
+# is used here instead (build_up(..., published_sweep_term=True)).
+# Usage: python -m optimization.payload_optimization
+
+# Design variables: name -> (initial guess (X-37B), lower bound, upper bound)
+DESIGN_VARIABLES = {
+    "L_f": (27.5, 20.0, 35.0),                 # ft
+    "S_ref": (80.0, 60.0, 100.0),              # ft^2
+    "AR": (14.92782 ** 2 / 59.35220204, 2.5, 5.0),
+    "taper_ratio": (383 / 4059, 0.05, 0.4),
+    "t_c": (154 / 3426, 0.03, 0.10),
+    "sweep_angle": (50.0, 30.0, 65.0),         # deg
+}
+
+
+def payload_bay_volume(base):
+    """Usable fuselage volume left for the payload bay in the baseline vehicle (ft^3)."""
+    tanks = propulsion_inputs(base["W_gtot"], base["L_f"])
+    eta_vol = base.get("eta_vol", 0.7)
+    return eta_vol * base["V_tot"] - tanks["V_oms_tnk"] - tanks["V_rcs_tnk"]
+
+
+def payload_model(design, base=None, xp=np):
+    """
+    HASA + propulsion weight build-up for a geometry.
+
+    Parameters:
+    design : dict
+        Values of the DESIGN_VARIABLES (floats, arrays or asb.Opti variables).
+    base : dict
+        Baseline HASA inputs (default: X-37B); W_gtot is held fixed.
+    xp : module
+        Array module, aerosandbox.numpy (default) or numpy.
+
+    Returns:
+    dict
+        Every HASA output plus "volume_margin", the usable fuselage volume (ft^3) left after the
+        tanks and the baseline payload bay (must be >= 0).
+    """
+    base = x37b_inputs() if base is None else base
+    scale = design["L_f"] / base["L_f"]
+    p = fixed_inputs(base)
+    p.update(design)
+    p["S_btot"] = base["S_btot"] * scale ** 2
+    p["V_tot"] = base["V_tot"] * scale ** 3
+    p.update(propulsion_inputs(base["W_gtot"], design["L_f"], xp=xp))
+    p = check_inputs(p)
+
+    w = build_up(p, xp=xp, power=xp.power, published_sweep_term=True)
+    w["volume_margin"] = (p["eta_vol"] * p["V_tot"] - p["V_oms_tnk"] - p["V_rcs_tnk"]
+                          - payload_bay_volume(base))
+    return w
+
+
+def optimize_payload(base=None, verbose=False):
+    """
+    Maximizes the allowable payload over the DESIGN_VARIABLES with asb.Opti (IPOPT).
+
+    Returns:
+    dict
+        "design" (optimal values), "W_allow_payload" (lbs), "iterations" (IPOPT iterations),
+        "evaluations" (objective evaluations) and "wall_time" (s).
+    """
+    start = time.perf_counter()
+    opti = asb.Opti()
+    design = {
+        name: opti.variable(init_guess=init, lower_bound=lower, upper_bound=upper, scale=init)
+        for name, (init, lower, upper) in DESIGN_VARIABLES.items()
+    }
+    w = payload_model(design, base)
+    opti.subject_to(w["volume_margin"] >= 0)
+    opti.maximize(w["W_allow_payload"] / 1000)
+
+    sol = opti.solve(verbose=verbose)
+    stats = sol.stats()
+    return {
+        "design": {name: float(sol.value(var)) for name, var in design.items()},
+        "W_allow_payload": float(sol.value(w["W_allow_payload"])),
+        "iterations": stats["iter_count"],
+        "evaluations": stats["n_call_nlp_f"],
+        "wall_time": time.perf_counter() - start,
+    }
+
+
+if __name__ == "__main__":
+    baseline = payload_model({name: init for name, (init, _, _) in DESIGN_VARIABLES.items()})
+    result = optimize_payload()
+    print(f"Baseline (X-37B) allowable payload: {float(baseline['W_allow_payload']):.2f} lbs")
+    print(f"Optimized allowable payload: {result['W_allow_payload']:.2f} lbs "
+          f"({result['iterations']} IPOPT iterations, {result['evaluations']} objective evaluations, "
+          f"{result['wall_time']:.2f} s)")
+    for name, value in result["design"].items():
+        init, lower, upper = DESIGN_VARIABLES[name]
+        print(f"  {name:<12} {value:10.4f}   (X-37B {init:.4f}, bounds [{lower}, {upper}])")
@@ -0,0 +1,92 @@
+import numpy as np
+
+# Greedy pre-packer for the layout problem: a feasible, non-overlapping starting layout of the
+# boxes inside the cylinder, to warm-start the NLP instead of overlapping guesses.
+#
+# Layered first-fit decreasing: the boxes, sorted by height, are stacked in layers along z
+# (a layer is as tall as its first box). Inside a layer they are placed side by side in rows
+# along x; a row is as deep (in y) as its first box. Each box goes into the first layer and row
+# where it fits, else opens a new row in the first layer with room left, else a new layer.
+# A box fits where its corners are inside the cylinder section and where it meets the
+# containment constraint of the NLP (center distance + larger half-width <= R_cyl).
+# The boxes are packed grown by a relative clearance, so the layout is also strictly feasible
+# for the conservative "softmax" separation of layout.py (the "axes" separation, which needs
+# every pair apart along all axes, is generally not met by any dense packing).
+# Usage: centers = prepack(dimensions, R_cyl, H_cyl)
+
+
+def _x_limit(R, y_bottom, w, l, m):
+    """Largest |x| of the center of a box (width w, depth l) whose lower edge is at y_bottom."""
+    chord = R ** 2 - max(abs(y_bottom), abs(y_bottom + l)) ** 2
+    radial = (R - m) ** 2 - (y_bottom + l / 2) ** 2
+    if min(chord, radial) < -1e-9 * R ** 2:  # (tolerance for rounding at the bounds of y_bottom)
+        return -1.0
+    return min(np.sqrt(max(chord, 0)) - w / 2, np.sqrt(max(radial, 0)))
+
+
+def prepack(dimensions, R_cyl, H_cyl, clearance=0.05):
+    """
+    Feasible, non-overlapping box centers inside the cylinder.
+
+    Parameters:
+    dimensions : array (n, 3)
+        Box dimensions (width, length, height).
+    R_cyl, H_cyl : float
+        Cylinder radius and height (centered on the origin, axis along z).
+    clearance : float
+        Gap left between boxes and to the cylinder, as a fraction of the box dimensions.
+
+    Returns:
+    array (n, 3)
+        Box centers.
+
+    Raises:
+    ValueError
+        If the greedy packing does not fit in the cylinder.
+    """
+    dimensions = np.asarray(dimensions, dtype=float)
+    # Boxes grown by the clearance
+    w, l, h = (dimensions * (1 + clearance)).T
+    m = np.maximum(w, l) / 2
+    R = R_cyl
+    centers = np.empty((len(dimensions), 3))
+
+    layers = []  # {"z", "height", "y_next", "rows": [[y_bottom, depth, x_next], ...]}
+    z_top = 0.0
+    for i in np.lexsort((-l, -h)):
+        for layer in ([layer for layer in layers if h[i] <= layer["height"]] + [None]):
+            if layer is None:
+                if z_top + h[i] > H_cyl:
+                    raise ValueError(f"Greedy packing of {len(dimensions)} boxes does not fit in the cylinder "
+                                     f"(R_cyl={R_cyl}, H_cyl={H_cyl})")
+                layer = {"z": z_top, "height": h[i], "y_next": -R, "rows": []}
+                layers.append(layer)
+                z_top += h[i]
+
+            # First row where the box fits, to the right of the boxes already in it
+            for row in layer["rows"]:
+                if l[i] <= row[1]:
+                    limit = _x_limit(R, row[0], w[i], l[i], m[i])
+                    x = max(row[2] + w[i] / 2, -limit)
+                    if x <= limit:
+                        break
+            else:
+                # New row, at the first y where the box fits in the section
+                y_bottom = max(layer["y_next"], -np.sqrt(max(R ** 2 - (w[i] / 2) ** 2, 0)), -(R - m[i]) - l[i] / 2)
+                limit = _x_limit(R, y_bottom, w[i], l[i], m[i])
+                if limit < -1e-9 * R:
+                    if not layer["rows"]:
+                        raise ValueError(f"Box {i} ({dimensions[i]}) does not fit in the cylinder section")
+                    continue
+                row = [y_bottom, l[i], -np.inf]
+                layer["rows"].append(row)
+                layer["y_next"] = y_bottom + l[i]
+                x = -max(limit, 0)
+
+            centers[i] = x, row[0] + l[i] / 2, layer["z"] + h[i] / 2
+            row[2] = x + w[i] / 2
+            break
+
+    # Center the stack along z
+    centers[:, 2] -= z_top / 2
+    return centers
@@ -0,0 +1,127 @@
+import numpy as np
+
+# Batched rendering of box layouts in a cylinder.
+# All box edges are built as one (12 n, 2, 3) segment array and drawn as a single
+# Line3DCollection (faces, optionally, as one Poly3DCollection); the cylinder is a wireframe
+# of two circles and a few generators instead of a surface mesh. So a plot has a handful of
+# artists whatever the number of boxes. matplotlib is imported on use; with a path the figure
+# is rendered off-screen to the file on its own Agg canvas (pyplot and its backend are not touched),
+# so this runs on headless machines and inside interactive sessions.
+# Usage: render_layout(centers, dimensions, R_cyl, H_cyl, path="layout.png")
+
+# Corners of the unit box: bit 0 -> x, bit 1 -> y, bit 2 -> z
+CORNERS = np.array([[(k >> axis & 1) - 0.5 for axis in range(3)] for k in range(8)])
+# Corner pairs differing along one axis
+EDGES = np.array([(a, b) for a in range(8) for b in range(a + 1, 8) if bin(a ^ b).count("1") == 1])
+# Corners of the faces, in order around each face
+FACES = np.array([[0, 1 << u, 1 << u | 1 << v, 1 << v] for u, v in ((0, 1), (1, 2), (2, 0))])
+FACES = np.concatenate([FACES, FACES + [[1 << w] for w in (2, 0, 1)]])  # and the opposite faces
+
+
+def box_corners(centers, dimensions):
+    """Corners (n, 8, 3) of axis-aligned boxes."""
+    return np.asarray(centers, dtype=float)[:, None, :] + CORNERS * np.asarray(dimensions, dtype=float)[:, None, :]
+
+
+def box_edges(centers, dimensions):
+    """Edge segments (12 n, 2, 3) of axis-aligned boxes."""
+    return box_corners(centers, dimensions)[:, EDGES].reshape(-1, 2, 3)
+
+
+def box_faces(centers, dimensions):
+    """Face quadrilaterals (6 n, 4, 3) of axis-aligned boxes."""
+    return box_corners(centers, dimensions)[:, FACES].reshape(-1, 4, 3)
+
+
+def cylinder_edges(R_cyl, H_cyl, n_theta=64, n_generators=8):
+    """Wireframe segments of the cylinder: top and bottom circles and vertical generators."""
+    theta = np.linspace(0, 2 * np.pi, n_theta + 1)
+    circle = np.column_stack([R_cyl * np.cos(theta), R_cyl * np.sin(theta), np.zeros_like(theta)])
+    segments = []
+    for z in (-H_cyl / 2, H_cyl / 2):
+        points = circle + [0, 0, z]
+        segments.append(np.stack([points[:-1], points[1:]], axis=1))
+    phi = np.linspace(0, 2 * np.pi, n_generators, endpoint=False)
+    bottom = np.column_stack([R_cyl * np.cos(phi), R_cyl * np.sin(phi), np.full_like(phi, -H_cyl / 2)])
+    segments.append(np.stack([bottom, bottom + [0, 0, H_cyl]], axis=1))
+    return np.concatenate(segments)
+
+
+def plot_boxes(ax, centers, dimensions, color="b", alpha=0.5, faces=False):
+    """Adds all boxes to a 3D axis as one Line3DCollection (and one Poly3DCollection with faces)."""
+    from mpl_toolkits.mplot3d.art3d import Line3DCollection, Poly3DCollection
+
+    if faces:
+        ax.add_collection3d(Poly3DCollection(box_faces(centers, dimensions), facecolor=color, alpha=alpha * 0.3,
+                                             edgecolor="none"))
+    ax.add_collection3d(Line3DCollection(box_edges(centers, dimensions), colors=color, alpha=alpha, linewidths=0.8))
+
+
+def render_layout(centers, dimensions, R_cyl, H_cyl, initial_centers=None, objective_values=None, path=None,
+                  faces=False, dpi=150):
+    """
+    Plots a layout: optimized boxes in blue, initial boxes in red, the cylinder wireframe and
+    optionally the objective history.
+
+    Parameters:
+    centers : array (n, 3)
+        Optimized box centers.
+    dimensions : array (n, 3)
+        Box dimensions.
+    R_cyl, H_cyl : float
+        Cylinder radius and height.
+    initial_centers : array (n, 3)
+        Initial box centers (optional).
+    objective_values : array
+        Objective per iteration (optional; adds a convergence subplot).
+    path : str
+        Saved off-screen to path if given, else shown in a window.
+    faces : bool
+        Also draw translucent box faces.
+
+    Returns:
+    Figure
+        The figure (not registered with pyplot when saved to path).
+    """
+    from mpl_toolkits.mplot3d.art3d import Line3DCollection
+
+    figsize = (14, 6) if objective_values is not None else (7, 6)
+    if path is not None:
+        # Off-screen: a Figure on its own Agg canvas, leaving pyplot and the global backend alone
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+    else:
+        import matplotlib.pyplot as plt
+        fig = plt.figure(figsize=figsize)
+
+    if objective_values is not None:
+        ax1 = fig.add_subplot(121)
+        ax1.plot(objective_values, marker='o')
+        ax1.set_xlabel("Iteration")
+        ax1.set_ylabel("Objective")
+        ax1.set_title("Convergence of Objective Function")
+        ax = fig.add_subplot(122, projection='3d')
+    else:
+        ax = fig.add_subplot(111, projection='3d')
+
+    ax.add_collection3d(Line3DCollection(cylinder_edges(R_cyl, H_cyl), colors="gray", alpha=0.4, linewidths=0.6))
+    if initial_centers is not None:
+        plot_boxes(ax, initial_centers, dimensions, color="red", alpha=0.3, faces=faces)
+    plot_boxes(ax, centers, dimensions, color="blue", alpha=0.6, faces=faces)
+
+    ax.set_xlim([-R_cyl, R_cyl])
+    ax.set_ylim([-R_cyl, R_cyl])
+    ax.set_zlim([-H_cyl / 2, H_cyl / 2])
+    ax.set_xlabel("X")
+    ax.set_ylabel("Y")
+    ax.set_zlabel("Z")
+    ax.set_title("Initial (Red) and Optimized (Blue) Positions of Boxes within Cylinder")
+    fig.tight_layout()
+
+    if path is not None:
+        fig.savefig(path, dpi=dpi)
+    else:
+        plt.show()
+    return fig
@@ -0,0 +1,144 @@
+import json
+import time
+
+import casadi
+import numpy as np
+
+# Low-overhead solver telemetry for the layout problem (replaces per-iteration opti.debug.value
+# logging into growing Python lists).
+#
+# Every k-th IPOPT iteration, the objective and all box centers are fetched with a single
+# opti.debug.value call on one stacked expression and written into a preallocated ring buffer
+# (the last `capacity` samples stay in memory). With a path, the samples are also streamed to
+# disk in blocks as raw float64 rows, described by a JSON sidecar (path + ".json"); read them
+# back with load_telemetry. timing_splits tells where the solve time went: CasADi function
+# evaluations (objective, constraints, derivatives), the callback, IPOPT itself, and the setup
+# around the IPOPT call (building the solver, copying the solution back).
+# Usage:
+#   telemetry = SolverTelemetry(every=10, path="layout.telemetry")
+#   result = solve_layout(..., telemetry=telemetry)     # or problem.solve(callback=telemetry.attach(problem))
+#   telemetry.close(); telemetry.samples()["objective"]; timing_splits(result["problem"])
+
+FIXED_COLUMNS = ("solve", "iteration", "objective")
+
+
+class SolverTelemetry:
+    """
+    Ring buffer of sampled solver states, used as the opti.solve callback.
+
+    Parameters:
+    capacity : int
+        Samples kept in memory.
+    every : int
+        Sample every k-th iteration (iteration 0 is always sampled).
+    path : str
+        Optional file the samples are streamed to.
+    flush_rows : int
+        Samples written to the file at once (at most capacity).
+    """
+
+    def __init__(self, capacity=1024, every=1, path=None, flush_rows=256):
+        self.capacity = capacity
+        self.every = every
+        self.path = path
+        self.flush_rows = min(flush_rows, capacity)
+        self.problem = None
+        self.count = 0      # samples taken
+        self.flushed = 0    # samples written to the file
+        self.solve = -1     # index of the current solve (iterations restart at 0)
+        self.callback_time = 0.0
+        self._file = None
+
+    def attach(self, problem):
+        """Binds the telemetry to a LayoutProblem and returns the callback."""
+        self.problem = problem
+        self.n = problem.n
+        self.columns = FIXED_COLUMNS + tuple(f"{axis}{i}" for axis in "xyz" for i in range(self.n))
+        self.buffer = np.empty((self.capacity, len(self.columns)))
+        self._expression = casadi.vertcat(problem.objective, problem.x, problem.y, problem.z)
+        if self.path is not None:
+            self._file = open(self.path, "wb")
+            with open(self.path + ".json", "w") as f:
+                json.dump({"n_boxes": self.n, "columns": list(self.columns), "dtype": "float64"}, f)
+        return self
+
+    def __call__(self, iteration):
+        if iteration == 0:
+            self.solve += 1
+        if iteration % self.every:
+            return
+        start = time.perf_counter()
+        row = self.buffer[self.count % self.capacity]
+        row[0], row[1] = self.solve, iteration
+        row[2:] = self.problem.opti.debug.value(self._expression)
+        self.count += 1
+        if self._file is not None and self.count - self.flushed >= self.flush_rows:
+            self.flush()
+        self.callback_time += time.perf_counter() - start
+
+    def _rows(self, first):
+        """Samples first .. count - 1 (those still in the ring buffer) in order."""
+        first = max(first, self.count - self.capacity)
+        index = np.arange(first, self.count) % self.capacity
+        return self.buffer[index]
+
+    def flush(self):
+        """Writes the samples not yet on disk."""
+        if self.count - self.flushed > self.capacity:
+            raise RuntimeError("Telemetry samples were overwritten before being written; lower flush_rows")
+        self._file.write(self._rows(self.flushed).tobytes())
+        self._file.flush()
+        self.flushed = self.count
+
+    def close(self):
+        """Writes the remaining samples and closes the file."""
+        if self._file is not None:
+            self.flush()
+            self._file.close()
+            self._file = None
+
+    def samples(self):
+        """The samples in memory: "solve", "iteration", "objective" (m,) and "centers" (m, n, 3)."""
+        return _unpack(self._rows(0), self.n)
+
+
+def _unpack(rows, n):
+    return {
+        "solve": rows[:, 0].astype(int),
+        "iteration": rows[:, 1].astype(int),
+        "objective": rows[:, 2],
+        "centers": rows[:, 3:].reshape(len(rows), 3, n).transpose(0, 2, 1),
+    }
+
+
+def load_telemetry(path):
+    """Reads samples streamed by SolverTelemetry (same dict as SolverTelemetry.samples)."""
+    with open(path + ".json") as f:
+        meta = json.load(f)
+    rows = np.fromfile(path, dtype=meta["dtype"]).reshape(-1, len(meta["columns"]))
+    return _unpack(rows, meta["n_boxes"])
+
+
+def timing_splits(problem):
+    """
+    Wall time (s) of all solves of a LayoutProblem, split by where it was spent.
+
+    Returns:
+    dict
+        "total" (measured wall time), the CasADi evaluations ("nlp_f", "nlp_g", "nlp_grad_f",
+        "nlp_jac_g", "nlp_hess_l"), "callback_fun", "ipopt" (the rest of the IPOPT call: linear
+        algebra, line search, ...) and, when IPOPT reports its own wall time, "setup" (outside the
+        IPOPT call: building the solver, fetching the solution; otherwise included in "ipopt").
+    """
+    splits = {}
+    for timing in problem.timings:
+        for name, value in timing.items():
+            splits[name] = splits.get(name, 0.0) + value
+    splits.pop("nlp_grad", None)
+    wall = splits.pop("wall")
+    solver = splits.pop("total", None)  # IPOPT's own wall time (not reported by every CasADi version)
+    splits["ipopt"] = (wall if solver is None else solver) - sum(splits.values())
+    if solver is not None:
+        splits["setup"] = wall - solver
+    splits["total"] = wall
+    return splits
@@ -0,0 +1,223 @@
+import hashlib
+import inspect
+import json
+import os
+import time
+
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+
+from optimization.layout import solve_layout
+
+# Persistent warm-start cache for the layout problem. Design iteration re-solves nearly the
+# same packing (one box resized, added or removed); the cache keeps solved layouts on disk and
+# starts a new problem from the nearest one.
+#
+# Key: SHA-256 of the box dimensions in canonical order (sorted, rounded to SIGNATURE_DECIMALS),
+# the cylinder and the options that change the optimum, so the order of the boxes does not
+# matter. A container (SignedDistanceGrid) enters the key through a hash of its grid; extra
+# constraints (a callable) cannot be hashed, so they must come with a constraints_tag naming them
+# (e.g. "cg z <= 0"), and LayoutCache.solve bypasses the cache when the tag is missing. Every entry is an .npz file (canonical dimensions and centers); index.json holds the
+# keys, the last use of each entry (LRU eviction beyond max_entries) and the hit counters.
+# Nearest entry: among the entries with the same cylinder and options, the one whose boxes match
+# the new boxes best (optimal assignment of dimensions; unmatched boxes cost their size). The
+# matched boxes start at their cached centers, the others at the caller's initial guess.
+# Usage: see benchmarks/layout_warmstart.py
+
+SIGNATURE_DECIMALS = 9
+# solve_layout options that change the optimum (constraints enter through constraints_tag)
+CACHE_OPTIONS = ("objective", "separation", "broad_phase", "margin", "container")
+_DEFAULTS = {name: parameter.default for name, parameter in inspect.signature(solve_layout).parameters.items()}
+
+
+def _canonical(dimensions):
+    """Rounded dimensions and the order that sorts them."""
+    dimensions = np.round(np.asarray(dimensions, dtype=float), SIGNATURE_DECIMALS)
+    order = np.lexsort(dimensions.T[::-1])
+    return dimensions[order], order
+
+
+def _container_key(container):
+    """Hash of a SignedDistanceGrid (grid, values and sampling of the boxes)."""
+    digest = hashlib.sha256(json.dumps([container.method, container.points_per_edge]).encode())
+    for array in (*container.axes, container.values):
+        digest.update(np.ascontiguousarray(array, dtype=float).tobytes())
+    return digest.hexdigest()
+
+
+def _geometry_key(R_cyl, H_cyl, options):
+    if options.get("constraints") is not None and options.get("constraints_tag") is None:
+        raise ValueError("Layouts solved with constraints are only cached with a constraints_tag naming them")
+    values = []
+    for name in CACHE_OPTIONS:
+        value = options.get(name, _DEFAULTS[name])
+        if name == "container":
+            value = None if value is None else _container_key(value)
+        elif isinstance(value, float):
+            value = round(value, SIGNATURE_DECIMALS)
+        values.append(value)
+    cylinder = [None if v is None else round(float(v), SIGNATURE_DECIMALS) for v in (R_cyl, H_cyl)]
+    return json.dumps([*cylinder, values, options.get("constraints_tag")])
+
+
+def problem_signature(dimensions, R_cyl, H_cyl, **options):
+    """
+    Canonical hash of a layout problem (independent of the order of the boxes).
+
+    options are those of solve_layout (see CACHE_OPTIONS), plus constraints_tag, which names the
+    constraints callable and is required with it.
+    """
+    dimensions, _ = _canonical(dimensions)
+    digest = hashlib.sha256(_geometry_key(R_cyl, H_cyl, options).encode())
+    digest.update(np.ascontiguousarray(dimensions).tobytes())
+    return digest.hexdigest()
+
+
+class LayoutCache:
+    """
+    On-disk LRU cache of solved layouts.
+
+    Example:
+        cache = LayoutCache("layout_cache")
+        result = cache.solve(dimensions, R_cyl, H_cyl, init_centers, separation="softmax")
+        cache.stats()["hit_rate"]
+    """
+
+    def __init__(self, path, max_entries=256):
+        self.path = path
+        self.max_entries = max_entries
+        os.makedirs(path, exist_ok=True)
+        index = os.path.join(path, "index.json")
+        if os.path.exists(index):
+            with open(index) as f:
+                state = json.load(f)
+        else:
+            state = {"entries": {}, "counters": {}}
+        self.entries = state["entries"]  # key -> {"geometry", "n", "last_used"}
+        self.counters = {"exact": 0, "nearest": 0, "miss": 0, "iterations_warm": 0, "solves_warm": 0,
+                         "iterations_cold": 0, "solves_cold": 0, **state["counters"]}
+
+    def _save_index(self):
+        tmp = os.path.join(self.path, "index.json.tmp")
+        with open(tmp, "w") as f:
+            json.dump({"entries": self.entries, "counters": self.counters}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, os.path.join(self.path, "index.json"))
+
+    def _load(self, key):
+        """Canonical dimensions, centers and objective value (NaN if not stored) of an entry."""
+        with np.load(os.path.join(self.path, key + ".npz")) as data:
+            objective_value = float(data["objective_value"]) if "objective_value" in data else np.nan
+            return data["dimensions"], data["centers"], objective_value
+
+    def lookup(self, dimensions, R_cyl, H_cyl, **options):
+        """
+        Cached warm start of a problem.
+
+        Returns:
+        tuple : (kind, centers, matched)
+            kind is "exact", "nearest" or "miss"; centers (n, 3) in the order of dimensions
+            (None for a miss); matched is a boolean mask of the boxes that got a cached center.
+        """
+        dimensions = np.asarray(dimensions, dtype=float)
+        key = problem_signature(dimensions, R_cyl, H_cyl, **options)
+        canonical, order = _canonical(dimensions)
+        if key in self.entries:
+            centers = np.empty((len(dimensions), 3))
+            centers[order] = self._load(key)[1]
+            self._touch(key)
+            return "exact", centers, np.ones(len(dimensions), dtype=bool)
+
+        geometry = _geometry_key(R_cyl, H_cyl, options)
+        best = None
+        for other, entry in self.entries.items():
+            if entry["geometry"] != geometry:
+                continue
+            cached_dimensions, cached_centers, _ = self._load(other)
+            cost = np.abs(dimensions[:, None, :] - cached_dimensions[None, :, :]).sum(axis=2)
+            rows, cols = linear_sum_assignment(cost)
+            # Unmatched boxes (added or removed) cost their size
+            unmatched = np.delete(dimensions, rows, axis=0).sum() + np.delete(cached_dimensions, cols, axis=0).sum()
+            distance = cost[rows, cols].sum() + unmatched
+            if best is None or distance < best[0]:
+                best = (distance, other, rows, cached_centers[cols])
+        if best is None:
+            return "miss", None, np.zeros(len(dimensions), dtype=bool)
+
+        _, other, rows, cached_centers = best
+        centers = np.full((len(dimensions), 3), np.nan)
+        centers[rows] = cached_centers
+        self._touch(other)
+        return "nearest", centers, ~np.isnan(centers[:, 0])
+
+    def _touch(self, key):
+        self.entries[key]["last_used"] = time.time()
+
+    def store(self, dimensions, R_cyl, H_cyl, centers, objective_value=np.nan, **options):
+        """Adds a solved layout (and its objective value), evicting the least recently used entries beyond max_entries."""
+        key = problem_signature(dimensions, R_cyl, H_cyl, **options)
+        canonical, order = _canonical(dimensions)
+        tmp = os.path.join(self.path, key + ".tmp.npz")
+        np.savez(tmp, dimensions=canonical, centers=np.asarray(centers, dtype=float)[order],
+                 objective_value=objective_value)
+        os.replace(tmp, os.path.join(self.path, key + ".npz"))
+        self.entries[key] = {"geometry": _geometry_key(R_cyl, H_cyl, options), "n": len(canonical),
+                             "last_used": time.time()}
+        while len(self.entries) > self.max_entries:
+            oldest = min(self.entries, key=lambda k: self.entries[k]["last_used"])
+            del self.entries[oldest]
+            os.remove(os.path.join(self.path, oldest + ".npz"))
+        self._save_index()
+        return key
+
+    def solve(self, dimensions, R_cyl, H_cyl, init_centers, **options):
+        """
+        solve_layout with a cached warm start; the solution is stored if feasible.
+
+        An exact hit returns the cached layout without solving ("iterations" 0, "problem" None).
+        Otherwise the boxes matched to the nearest entry start at its centers and the others at
+        init_centers. With constraints but no constraints_tag the cache is bypassed (a cold solve,
+        not stored). The result gets "cache" ("exact", "nearest", "miss" or "bypass").
+        """
+        tag = options.pop("constraints_tag", None)
+        if options.get("constraints") is not None and tag is None:
+            result = solve_layout(dimensions, R_cyl, H_cyl, init_centers, **options)
+            result["cache"] = "bypass"
+            return result
+
+        wall_start = time.perf_counter()
+        kind, centers, matched = self.lookup(dimensions, R_cyl, H_cyl, constraints_tag=tag, **options)
+        self.counters[kind] += 1
+        if kind == "exact":
+            self._save_index()
+            objective_value = self._load(problem_signature(dimensions, R_cyl, H_cyl, constraints_tag=tag, **options))[2]
+            return {"centers": centers, "objective": objective_value, "feasible": True, "rounds": 0, "iterations": 0,
+                    "n_pairs": 0, "wall_time": time.perf_counter() - wall_start, "problem": None, "cache": kind}
+
+        start = np.array(init_centers, dtype=float)
+        if kind == "nearest":
+            start[matched] = centers[matched]
+        result = solve_layout(dimensions, R_cyl, H_cyl, start, **options)
+        result["cache"] = kind
+        warm = "warm" if kind == "nearest" else "cold"
+        self.counters["iterations_" + warm] += result["iterations"]
+        self.counters["solves_" + warm] += 1
+        if result["feasible"]:
+            self.store(dimensions, R_cyl, H_cyl, result["centers"], result["objective"], constraints_tag=tag,
+                       **options)
+        else:
+            self._save_index()
+        return result
+
+    def stats(self):
+        """Hit counters, hit rate (exact or nearest) and mean IPOPT iterations of warm and cold solves."""
+        c = self.counters
+        lookups = c["exact"] + c["nearest"] + c["miss"]
+        return {
+            **{name: c[name] for name in ("exact", "nearest", "miss")},
+            "entries": len(self.entries),
+            "hit_rate": (c["exact"] + c["nearest"]) / lookups if lookups else 0.0,
+            "mean_iterations_warm": c["iterations_warm"] / c["solves_warm"] if c["solves_warm"] else None,
+            "mean_iterations_cold": c["iterations_cold"] / c["solves_cold"] if c["solves_cold"] else None,
+        }
@@ -1,4 +1,4 @@
-import math
+import numpy as np
 
 # Propulsion Analysis is done using Mass Estimating Relationship (MERs) Database by Reuben R. Rohrschneider at Georgia Institute of Technology. 
 # "Development of a Mass Estimating Relationship Database for Launch Vehicle Conceptual Design"
@@ -29,26 +29,27 @@ def thrust_requirements(W_entry, L_f):
     return T_req_oms, T_req_qp, T_req_qv
 
 # Define the function to calculate the OMS propellant weight for different phases
-def oms_propellant_weight(W_entry, deltaV, Isp_oms):
-    return W_entry * (math.exp(deltaV / (Isp_oms * g)) - 1)
+# (xp: array module, e.g. aerosandbox.numpy to trace the relations with asb.Opti)
+def oms_propellant_weight(W_entry, deltaV, Isp_oms, xp=np):
+    return W_entry * (xp.exp(deltaV / (Isp_oms * g)) - 1)
 
 # Define the function to calculate total OMS propellant weight with a 10% reserve
-def total_oms_propellant(W_entry, deltaV_orbit, deltaV_deorbit, Isp_oms):
-    W_oms_prop_orbit = oms_propellant_weight(W_entry, deltaV_orbit, Isp_oms)
-    W_oms_prop_deorbit = oms_propellant_weight(W_entry, deltaV_deorbit, Isp_oms)
+def total_oms_propellant(W_entry, deltaV_orbit, deltaV_deorbit, Isp_oms, xp=np):
+    W_oms_prop_orbit = oms_propellant_weight(W_entry, deltaV_orbit, Isp_oms, xp)
+    W_oms_prop_deorbit = oms_propellant_weight(W_entry, deltaV_deorbit, Isp_oms, xp)
     
     # Add 10% reserve propellant
     W_oms_prop_total = 1.1 * (W_oms_prop_orbit + W_oms_prop_deorbit)
     return W_oms_prop_orbit, W_oms_prop_deorbit, W_oms_prop_total
 
 # Define the function to calculate RCS propellant weight
-def rcs_propellant_weight(W_entry, deltaV, Isp_rcs):
-    return W_entry * (math.exp(deltaV / (Isp_rcs * g)) - 1)
+def rcs_propellant_weight(W_entry, deltaV, Isp_rcs, xp=np):
+    return W_entry * (xp.exp(deltaV / (Isp_rcs * g)) - 1)
 
 # Define the function to calculate total RCS propellant weight with a 10% reserve
-def total_rcs_propellant(W_entry, deltaV_entry, deltaV_orbit, Isp_rcs):
-    W_rcs_prop_entry = rcs_propellant_weight(W_entry, deltaV_entry, Isp_rcs)
-    W_rcs_prop_orbit = rcs_propellant_weight(W_entry, deltaV_orbit, Isp_rcs)
+def total_rcs_propellant(W_entry, deltaV_entry, deltaV_orbit, Isp_rcs, xp=np):
+    W_rcs_prop_entry = rcs_propellant_weight(W_entry, deltaV_entry, Isp_rcs, xp)
+    W_rcs_prop_orbit = rcs_propellant_weight(W_entry, deltaV_orbit, Isp_rcs, xp)
     
     # Add 10% reserve propellant
     W_rcs_prop_total = 1.1 * (W_rcs_prop_entry + W_rcs_prop_orbit)
@@ -88,44 +89,48 @@ def calculate_lox_lh2_volumes(W_prop):
 
     return V_ox, V_fuel
 
-# Calculate thrust requirements
-T_req_oms, T_req_qp, T_req_qv = thrust_requirements(W_entry, L_f)
-print(f"Required thrust for OMS: {T_req_oms:.2f} lbs")
-print(f"Required thrust for primary RCS: {T_req_qp:.2f} lbs")
-print(f"Required thrust for vernier RCS: {T_req_qv:.2f} lbs")
-
-# Calculate OMS propellant weights
-W_oms_prop_orbit, W_oms_prop_deorbit, W_oms_prop_total = total_oms_propellant(
-    W_entry, deltaV_oms_orbit, deltaV_oms_deorbit, Isp_oms)
-print(f"OMS Propellant weight for orbit: {W_oms_prop_orbit:.2f} lbs")
-print(f"OMS Propellant weight for de-orbit: {W_oms_prop_deorbit:.2f} lbs")
-print(f"Total OMS Propellant weight (with reserve): {W_oms_prop_total:.2f} lbs")
-
-# Calculate RCS propellant weights
-W_rcs_prop_entry, W_rcs_prop_orbit, W_rcs_prop_total = total_rcs_propellant(
-    W_entry, deltaV_rcs_entry, deltaV_rcs_orbit, Isp_rcs)
-print(f"RCS Propellant weight for entry: {W_rcs_prop_entry:.2f} lbs")
-print(f"RCS Propellant weight for orbit: {W_rcs_prop_orbit:.2f} lbs")
-print(f"Total RCS Propellant weight (with reserve): {W_rcs_prop_total:.2f} lbs")
-
-# Calculate total propellant, oxygen, and fuel weights
-W_prop_total, W_ox_total, W_fuel_total = total_propellant_weights(W_oms_prop_total, W_rcs_prop_total)
-print(f"Total propellant weight: {W_prop_total:.2f} lbs")
-print(f"Total oxygen weight: {W_ox_total:.2f} lbs")
-print(f"Total fuel weight: {W_fuel_total:.2f} lbs")
-
-# Calculate volume of oxygen and volume of fuel
-V_oms_ox, V_oms_fuel = calculate_lox_lh2_volumes(W_oms_prop_total)
-print(f"Volume of OMS Oxygen (LOX): {V_oms_ox:.2f} ft³")
-print(f"Volume of OMS Fuel (LH2): {V_oms_fuel:.2f} ft³")
-
-V_rcs_ox, V_rcs_fuel = calculate_lox_lh2_volumes(W_rcs_prop_total)
-print(f"Volume of RCS Oxygen (LOX): {V_rcs_ox:.2f} ft³")
-print(f"Volume of RCS Fuel (LH2): {V_rcs_fuel:.2f} ft³")
-
-W_prop_total_metric = W_prop_total*0.45359237
-W_ox_total_metric = W_ox_total*0.45359237
-W_fuel_total_metric = W_fuel_total*0.45359237
-print(f"Total propellant weight in kg: {W_prop_total_metric:.2f} kg")
-print(f"Total oxygen weight in kg: {W_ox_total_metric:.2f} kg")
-print(f"Total fuel weight in kg: {W_fuel_total_metric:.2f} kg")
+# Run the analysis when executed as a script (the functions above work on scalars and NumPy
+# arrays, and on asb.Opti variables with xp=aerosandbox.numpy, so the module can be imported,
+# e.g. by sizing.py)
+if __name__ == "__main__":
+    # Calculate thrust requirements
+    T_req_oms, T_req_qp, T_req_qv = thrust_requirements(W_entry, L_f)
+    print(f"Required thrust for OMS: {T_req_oms:.2f} lbs")
+    print(f"Required thrust for primary RCS: {T_req_qp:.2f} lbs")
+    print(f"Required thrust for vernier RCS: {T_req_qv:.2f} lbs")
+
+    # Calculate OMS propellant weights
+    W_oms_prop_orbit, W_oms_prop_deorbit, W_oms_prop_total = total_oms_propellant(
+        W_entry, deltaV_oms_orbit, deltaV_oms_deorbit, Isp_oms)
+    print(f"OMS Propellant weight for orbit: {W_oms_prop_orbit:.2f} lbs")
+    print(f"OMS Propellant weight for de-orbit: {W_oms_prop_deorbit:.2f} lbs")
+    print(f"Total OMS Propellant weight (with reserve): {W_oms_prop_total:.2f} lbs")
+
+    # Calculate RCS propellant weights
+    W_rcs_prop_entry, W_rcs_prop_orbit, W_rcs_prop_total = total_rcs_propellant(
+        W_entry, deltaV_rcs_entry, deltaV_rcs_orbit, Isp_rcs)
+    print(f"RCS Propellant weight for entry: {W_rcs_prop_entry:.2f} lbs")
+    print(f"RCS Propellant weight for orbit: {W_rcs_prop_orbit:.2f} lbs")
+    print(f"Total RCS Propellant weight (with reserve): {W_rcs_prop_total:.2f} lbs")
+
+    # Calculate total propellant, oxygen, and fuel weights
+    W_prop_total, W_ox_total, W_fuel_total = total_propellant_weights(W_oms_prop_total, W_rcs_prop_total)
+    print(f"Total propellant weight: {W_prop_total:.2f} lbs")
+    print(f"Total oxygen weight: {W_ox_total:.2f} lbs")
+    print(f"Total fuel weight: {W_fuel_total:.2f} lbs")
+
+    # Calculate volume of oxygen and volume of fuel
+    V_oms_ox, V_oms_fuel = calculate_lox_lh2_volumes(W_oms_prop_total)
+    print(f"Volume of OMS Oxygen (LOX): {V_oms_ox:.2f} ft³")
+    print(f"Volume of OMS Fuel (LH2): {V_oms_fuel:.2f} ft³")
+
+    V_rcs_ox, V_rcs_fuel = calculate_lox_lh2_volumes(W_rcs_prop_total)
+    print(f"Volume of RCS Oxygen (LOX): {V_rcs_ox:.2f} ft³")
+    print(f"Volume of RCS Fuel (LH2): {V_rcs_fuel:.2f} ft³")
+
+    W_prop_total_metric = W_prop_total*0.45359237
+    W_ox_total_metric = W_ox_total*0.45359237
+    W_fuel_total_metric = W_fuel_total*0.45359237
+    print(f"Total propellant weight in kg: {W_prop_total_metric:.2f} kg")
+    print(f"Total oxygen weight in kg: {W_ox_total_metric:.2f} kg")
+    print(f"Total fuel weight in kg: {W_fuel_total_metric:.2f} kg")
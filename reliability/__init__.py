@@ -0,0 +1,6 @@
+# Launch-vehicle reliability statistics (batched over many vehicles / launch records).
+# launch_comparison.py is the two-vehicle report built on top of this package.
+
+from reliability.intervals import METHODS, IntervalCache, binomial_interval
+from reliability.superiority import posterior_params, prob_greater, superiority_matrix
+from reliability.stream import ReliabilityTracker
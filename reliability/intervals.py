@@ -0,0 +1,113 @@
+import numpy as np
+from scipy.special import betaincinv, ndtri
+
+# Batched binomial confidence intervals for launch success rates.
+# k successes out of n launches per record (arrays); every method works on all records at once:
+#   "clopper-pearson"  exact interval from beta quantiles (conservative)
+#   "jeffreys"         equal-tailed interval of the Beta(k + 1/2, n - k + 1/2) posterior
+#   "wilson"           score interval (closed form)
+# Beta quantiles come from the scipy.special.betaincinv ufunc, i.e. one vectorized call per
+# bound. Records are deduplicated on (n, k) before evaluation, and IntervalCache keeps the
+# results of earlier calls so a refreshed launch database only evaluates new (n, k) pairs.
+
+METHODS = ("clopper-pearson", "jeffreys", "wilson")
+
+
+def _pair_keys(k, n):
+    """Packs (n, k) pairs into one int64 key per record."""
+    k = np.asarray(k, dtype=np.int64)
+    n = np.asarray(n, dtype=np.int64)
+    if np.any((k < 0) | (k > n)):
+        raise ValueError("Successes k must satisfy 0 <= k <= n")
+    return (n << 32) | k
+
+
+def _compute(k, n, method, confidence):
+    """Interval bounds of unique records (float64 arrays k, n)."""
+    alpha = 1 - confidence
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if method == "clopper-pearson":
+            lower = np.where(k > 0, betaincinv(k, n - k + 1, alpha / 2), 0.0)
+            upper = np.where(k < n, betaincinv(k + 1, n - k, 1 - alpha / 2), 1.0)
+        elif method == "jeffreys":
+            lower = np.where(k > 0, betaincinv(k + 0.5, n - k + 0.5, alpha / 2), 0.0)
+            upper = np.where(k < n, betaincinv(k + 0.5, n - k + 0.5, 1 - alpha / 2), 1.0)
+        elif method == "wilson":
+            z = ndtri(1 - alpha / 2)
+            p_hat = k / n
+            center = (p_hat + z ** 2 / (2 * n)) / (1 + z ** 2 / n)
+            half = z / (1 + z ** 2 / n) * np.sqrt(p_hat * (1 - p_hat) / n + z ** 2 / (4 * n ** 2))
+            lower, upper = np.clip(center - half, 0, 1), np.clip(center + half, 0, 1)
+        else:
+            raise ValueError(f"Unknown interval method: {method} (one of {METHODS})")
+    return lower, upper
+
+
+def binomial_interval(k, n, method="clopper-pearson", confidence=0.95):
+    """
+    Confidence intervals of binomial success probabilities.
+
+    Parameters:
+    k : int or array
+        Successful launches.
+    n : int or array
+        Total launches (n > 0).
+    method : str
+        "clopper-pearson", "jeffreys" or "wilson".
+    confidence : float
+        Confidence level, e.g. 0.95.
+
+    Returns:
+    tuple : (lower, upper)
+        Bounds on the success probability, arrays of the broadcast shape of k and n.
+    """
+    keys, inverse = np.unique(_pair_keys(k, n), return_inverse=True)
+    lower, upper = _compute((keys & 0xFFFFFFFF).astype(np.float64), (keys >> 32).astype(np.float64),
+                            method, confidence)
+    shape = np.broadcast_shapes(np.shape(k), np.shape(n))
+    return lower[inverse].reshape(shape), upper[inverse].reshape(shape)
+
+
+class IntervalCache:
+    """
+    Interval results kept across calls, per (method, confidence).
+
+    Example:
+        cache = IntervalCache()
+        lower, upper = cache.interval(k, n)     # evaluates every unique (n, k)
+        lower, upper = cache.interval(k2, n2)   # evaluates only the pairs not seen before
+        cache.hits, cache.misses                # unique pairs found / computed so far
+    """
+
+    def __init__(self):
+        # (method, confidence) -> (sorted keys, lower, upper)
+        self.tables = {}
+        self.hits = 0
+        self.misses = 0
+
+    def interval(self, k, n, method="clopper-pearson", confidence=0.95):
+        """Same as binomial_interval, reusing earlier results."""
+        keys, inverse = np.unique(_pair_keys(k, n), return_inverse=True)
+        table_keys, table_lower, table_upper = self.tables.get(
+            (method, confidence), (np.empty(0, np.int64), np.empty(0), np.empty(0)))
+
+        pos = np.searchsorted(table_keys, keys)
+        found = pos < table_keys.size
+        found[found] = table_keys[pos[found]] == keys[found]
+        new = keys[~found]
+        self.hits += int(found.sum())
+        self.misses += new.size
+        if new.size:
+            new_lower, new_upper = _compute((new & 0xFFFFFFFF).astype(np.float64), (new >> 32).astype(np.float64),
+                                            method, confidence)
+            # Merge the new pairs into the sorted table
+            table_keys = np.concatenate([table_keys, new])
+            order = np.argsort(table_keys, kind="stable")
+            table_keys = table_keys[order]
+            table_lower = np.concatenate([table_lower, new_lower])[order]
+            table_upper = np.concatenate([table_upper, new_upper])[order]
+            self.tables[method, confidence] = (table_keys, table_lower, table_upper)
+            pos = np.searchsorted(table_keys, keys)
+
+        shape = np.broadcast_shapes(np.shape(k), np.shape(n))
+        return table_lower[pos][inverse].reshape(shape), table_upper[pos][inverse].reshape(shape)
@@ -0,0 +1,253 @@
+import argparse
+import csv
+import json
+import os
+import time
+import warnings
+
+import numpy as np
+from scipy.special import betaincinv
+
+from reliability.intervals import binomial_interval
+
+# Streaming reliability statistics from an append-only launch log.
+# Each log record is one launch: JSON lines ({"vehicle": "A", "success": true}) or CSV with a
+# header row containing "vehicle" and "success" columns. The tracker keeps only the per-vehicle
+# counts (n, k), so an update is O(1) per record and memory depends on the number of vehicles,
+# not on the log length. The log is read from the last byte offset in bounded chunks, and only
+# complete lines are consumed, so a record being written is picked up on the next poll. Each block
+# is parsed before any of it is counted, and the counts and the offset then advance together;
+# malformed records are skipped (counted in `skipped`, with a warning) instead of aborting the block.
+#
+# Intervals are recomputed lazily for the vehicles that changed since the last summary, in one
+# batched binomial_interval call (not cached: a cache would grow with every distinct (n, k) seen).
+# The counts, log offset and CSV header are checkpointed atomically to a JSON file so a restart
+# resumes where it stopped.
+# Usage: python -m reliability.stream LOG [--checkpoint FILE] [--follow] [--poll S]
+
+READ_CHUNK = 1 << 20  # bytes read from the log at once
+SUCCESS_VALUES = {"1": True, "true": True, "success": True, "0": False, "false": False, "failure": False}
+
+
+class ReliabilityTracker:
+    """
+    Conjugate Beta posteriors of the success rates of the vehicles in a launch log.
+
+    Example:
+        tracker = ReliabilityTracker.load("launches.ckpt.json")   # or ReliabilityTracker()
+        tracker.read("launches.jsonl")                           # new records only
+        tracker.summary()["A"]["upper"]
+        tracker.save("launches.ckpt.json")
+    """
+
+    def __init__(self, prior=(1.0, 1.0), confidence=0.95, method="clopper-pearson"):
+        self.prior = tuple(map(float, prior))
+        self.confidence = confidence
+        self.method = method
+        self.counts = {}   # vehicle -> [n, k]
+        self.offset = 0    # bytes of the log already consumed
+        self.header = None  # CSV column names
+        self.records = 0
+        self.skipped = 0   # malformed records
+        self._summary = {}
+        self._dirty = set()
+
+    def update(self, vehicle, success):
+        """Adds one launch."""
+        counts = self.counts.get(vehicle)
+        if counts is None:
+            counts = self.counts[vehicle] = [0, 0]
+        counts[0] += 1
+        counts[1] += bool(success)
+        self.records += 1
+        self._dirty.add(vehicle)
+
+    def posterior(self, vehicle):
+        """Beta posterior parameters (alpha_prior + k, beta_prior + n - k)."""
+        n, k = self.counts[vehicle]
+        return self.prior[0] + k, self.prior[1] + n - k
+
+    def summary(self):
+        """{vehicle: {n, k, p_hat, lower, upper, mean, cred_lower, cred_upper}}."""
+        if self._dirty:
+            vehicles = list(self._dirty)
+            n, k = np.array([self.counts[v] for v in vehicles], dtype=np.int64).T
+            lower, upper = binomial_interval(k, n, self.method, self.confidence)
+            a, b = self.prior[0] + k, self.prior[1] + n - k
+            alpha = 1 - self.confidence
+            cred_lower, cred_upper = betaincinv(a, b, alpha / 2), betaincinv(a, b, 1 - alpha / 2)
+            for i, vehicle in enumerate(vehicles):
+                self._summary[vehicle] = {
+                    "n": int(n[i]), "k": int(k[i]), "p_hat": k[i] / n[i],
+                    "lower": float(lower[i]), "upper": float(upper[i]),
+                    "mean": a[i] / (a[i] + b[i]), "cred_lower": float(cred_lower[i]), "cred_upper": float(cred_upper[i]),
+                }
+            self._dirty.clear()
+        return self._summary
+
+    def _parse(self, line):
+        """(vehicle, success) of one log line, or None for blank lines and the CSV header."""
+        line = line.strip()
+        if not line:
+            return None
+        if line.startswith("{"):
+            record = json.loads(line)
+        else:
+            row = next(csv.reader([line]))
+            if self.header is None:
+                self.header = row
+                return None
+            record = dict(zip(self.header, row))
+        success = record["success"]
+        if not isinstance(success, bool):
+            success = SUCCESS_VALUES[str(success).strip().lower()]
+        if not isinstance(record["vehicle"], str):
+            raise ValueError(f"vehicle is not a string: {record['vehicle']!r}")
+        return record["vehicle"], success
+
+    def _parse_block(self, block):
+        """(vehicle, success) records of a block of complete lines, and the number of malformed lines skipped."""
+        records, skipped = [], 0
+        start = 0
+        for line in block.splitlines(keepends=True):
+            try:
+                record = self._parse(line.decode())
+            except (ValueError, KeyError, IndexError) as error:  # (JSON and decoding errors are ValueErrors)
+                skipped += 1
+                warnings.warn(f"Skipped malformed launch record at byte {self.offset + start}: {error!r}")
+                record = None
+            if record is not None:
+                records.append(record)
+            start += len(line)
+        return records, skipped
+
+    def read(self, path, max_bytes=None):
+        """
+        Consumes the complete records appended to the log since the last read.
+
+        Parameters:
+        path : str
+            Launch log (JSON lines or CSV).
+        max_bytes : int
+            Stop after about this many bytes (default: read to the end).
+
+        Returns:
+        int
+            Records added.
+        """
+        size = os.path.getsize(path)
+        if size < self.offset:
+            raise ValueError(f"{path} is shorter than the checkpointed offset; the log must be append-only")
+        before = self.records
+        with open(path, "rb") as f:
+            f.seek(self.offset)
+            remaining = size - self.offset if max_bytes is None else min(max_bytes, size - self.offset)
+            tail = b""
+            while remaining > 0:
+                block = f.read(min(READ_CHUNK, remaining))
+                if not block:
+                    break
+                remaining -= len(block)
+                block = tail + block
+                end = block.rfind(b"\n") + 1  # only complete lines
+                records, skipped = self._parse_block(block[:end])
+                for record in records:
+                    self.update(*record)
+                self.skipped += skipped
+                self.offset += end
+                tail = block[end:]
+        return self.records - before
+
+    def follow(self, path, checkpoint=None, poll=1.0, checkpoint_every=10.0):
+        """
+        Tails the log forever, yielding the summary whenever new records arrived.
+
+        The state is saved to checkpoint (if given) at most every checkpoint_every seconds
+        and when the generator is closed, but not when an exception (e.g. KeyboardInterrupt)
+        stops it, since the state may then be half updated: the next run resumes from the
+        last checkpoint instead.
+        """
+        last_save = time.monotonic()
+        try:
+            while True:
+                if self.read(path):
+                    yield self.summary()
+                if checkpoint and time.monotonic() - last_save >= checkpoint_every:
+                    self.save(checkpoint)
+                    last_save = time.monotonic()
+                time.sleep(poll)
+        except GeneratorExit:
+            if checkpoint:
+                self.save(checkpoint)
+            raise
+
+    def save(self, path):
+        """Writes the state atomically (temporary file + rename)."""
+        state = {"prior": self.prior, "confidence": self.confidence, "method": self.method,
+                 "counts": self.counts, "offset": self.offset, "header": self.header, "records": self.records,
+                 "skipped": self.skipped}
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        """Restores a tracker saved with save()."""
+        with open(path) as f:
+            state = json.load(f)
+        tracker = cls(state["prior"], state["confidence"], state["method"])
+        tracker.counts = state["counts"]
+        tracker.offset = state["offset"]
+        tracker.header = state["header"]
+        tracker.records = state["records"]
+        tracker.skipped = state.get("skipped", 0)
+        tracker._dirty = set(tracker.counts)
+        return tracker
+
+
+def print_summary(summary, confidence=0.95):
+    level = f"{confidence*100:g}%"
+    print(f"{'Vehicle':<16}{'k/n':>12}{'rate':>9}   {level + ' CI':<20}{'post. mean':>11}   {level + ' credible':<20}")
+    for vehicle, s in sorted(summary.items()):
+        print(f"{vehicle:<16}{s['k']:>6}/{s['n']:<5}{s['p_hat']*100:>8.2f}%   "
+              f"({s['lower']*100:6.2f}%, {s['upper']*100:6.2f}%){s['mean']*100:>10.2f}%   "
+              f"({s['cred_lower']*100:6.2f}%, {s['cred_upper']*100:6.2f}%)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m reliability.stream",
+                                     description="Reliability statistics from an append-only launch log.")
+    parser.add_argument("log", help="launch log (.jsonl or .csv)")
+    parser.add_argument("--checkpoint", help="state file; resumed from if it exists")
+    parser.add_argument("--follow", action="store_true", help="keep tailing the log")
+    parser.add_argument("--poll", type=float, default=1.0, help="seconds between polls with --follow")
+    args = parser.parse_args(argv)
+
+    if args.checkpoint and os.path.exists(args.checkpoint):
+        tracker = ReliabilityTracker.load(args.checkpoint)
+    else:
+        tracker = ReliabilityTracker()
+
+    if args.follow:
+        try:
+            for summary in tracker.follow(args.log, args.checkpoint, args.poll):
+                print(f"\n{tracker.records} launches (offset {tracker.offset} bytes)")
+                print_summary(summary, tracker.confidence)
+        except KeyboardInterrupt:
+            pass
+    else:
+        start = time.perf_counter()
+        added = tracker.read(args.log)
+        elapsed = time.perf_counter() - start
+        print(f"{added} new launches in {elapsed*1e3:.1f} ms ({tracker.records} in total, "
+              f"{tracker.skipped} malformed records skipped)")
+        print_summary(tracker.summary(), tracker.confidence)
+        if args.checkpoint:
+            tracker.save(args.checkpoint)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+import numpy as np
+from scipy.special import betainc, betaincinv, betaln
+
+# All-pairs Bayesian superiority of launch vehicles.
+# With Beta(a, b) posteriors on the success rates, P(p_1 > p_2) has an exact finite sum when a_1
+# (or, mirroring p -> 1 - p, b_2) is an integer:
+#
+#     P(p_1 > p_2) = sum_{i=0}^{a_1 - 1} B(a_2 + i, b_1 + b_2) / ((b_1 + i) B(1 + i, b_1) B(a_2, b_2))
+#
+# whose terms follow t_{i+1} = t_i (a_2 + i)(b_1 + i) / ((a_2 + b_1 + b_2 + i)(1 + i)), so each
+# pair costs min(a_1, b_2) multiply-adds (few for launch data, where failures are rare).
+# Non-integer parameters (e.g. a Jeffreys prior) use Gauss-Legendre quadrature over the quantiles
+# of the narrower posterior. Posteriors are deduplicated before the pairs are formed, optionally
+# merging near-identical ones, and every pair is evaluated once (P(p_2 > p_1) = 1 - P(p_1 > p_2)).
+
+PAIR_BLOCK = 1 << 20  # pairs evaluated at once
+
+
+def posterior_params(k, n, prior=(1.0, 1.0)):
+    """Beta posterior (alpha_prior + k, beta_prior + n - k) of k successes in n launches."""
+    k = np.asarray(k, dtype=np.float64)
+    n = np.asarray(n, dtype=np.float64)
+    return prior[0] + k, prior[1] + n - k
+
+
+def _exact(a1, b1, a2, b2):
+    """P(X1 > X2) by the finite sum; a1 or b2 must be a positive integer (b2 is used when a1 is not, or when shorter)."""
+    integer_b2 = b2 == np.round(b2)
+    mirror = integer_b2 & ((b2 < a1) | (a1 != np.round(a1)))
+    a1, b1, a2, b2 = (np.where(mirror, b2, a1), np.where(mirror, a2, b1),
+                      np.where(mirror, b1, a2), np.where(mirror, a1, b2))
+    # Longest sums first, so the pairs still summing at term i are a prefix
+    order = np.argsort(-a1, kind="stable")
+    a1, b1, a2, b2 = a1[order], b1[order], a2[order], b2[order]
+    n_terms = a1.astype(np.int64)
+    # Summed in log space: the first terms can underflow for large posteriors
+    log_t = betaln(a2, b1 + b2) - betaln(a2, b2)
+    total = np.exp(log_t)
+    for i in range(1, n_terms[0] if n_terms.size else 0):
+        m = np.searchsorted(-n_terms, -i, side="left")  # pairs with more than i terms
+        log_t = log_t[:m] + np.log((a2[:m] + i - 1) * (b1[:m] + i - 1) / ((a2[:m] + b1[:m] + b2[:m] + i - 1) * i))
+        total[:m] += np.exp(log_t)
+    total[order] = total.copy()
+    return np.clip(total, 0.0, 1.0)
+
+
+def _quadrature(a1, b1, a2, b2, n_nodes):
+    """P(X1 > X2) by Gauss-Legendre quadrature over the quantiles of the narrower posterior."""
+    u, w = np.polynomial.legendre.leggauss(n_nodes)
+    u, w = 0.5 * (u + 1), 0.5 * w
+    # Var(Beta) ~ a b / (a + b)^3
+    narrow2 = a2 * b2 / (a2 + b2) ** 3 <= a1 * b1 / (a1 + b1) ** 3
+    an, bn = np.where(narrow2, a2, a1), np.where(narrow2, b2, b1)
+    aw, bw = np.where(narrow2, a1, a2), np.where(narrow2, b1, b2)
+    x = betaincinv(an[:, np.newaxis], bn[:, np.newaxis], u)
+    # E_narrow[P(wide > x)]
+    p_wide_greater = (1 - betainc(aw[:, np.newaxis], bw[:, np.newaxis], x)) @ w
+    return np.where(narrow2, p_wide_greater, 1 - p_wide_greater)
+
+
+def prob_greater(a1, b1, a2, b2, method="auto", n_nodes=64):
+    """
+    P(p_1 > p_2) for independent p_1 ~ Beta(a1, b1) and p_2 ~ Beta(a2, b2).
+
+    Parameters:
+    a1, b1, a2, b2 : float or array
+        Beta parameters (broadcast together).
+    method : str
+        "exact" (integer a1 or b2 required), "quadrature" or "auto" (exact where possible).
+    n_nodes : int
+        Quadrature nodes.
+
+    Returns:
+    ndarray
+        Probabilities of the broadcast shape.
+    """
+    shape = np.broadcast_shapes(*(np.shape(v) for v in (a1, b1, a2, b2)))
+    a1, b1, a2, b2 = (np.asarray(v, dtype=np.float64).ravel() for v in np.broadcast_arrays(a1, b1, a2, b2))
+    integer = (a1 == np.round(a1)) | (b2 == np.round(b2))
+    if method == "exact" and not integer.all():
+        raise ValueError("The exact sum needs integer a1 or b2 for every pair")
+    if method not in ("exact", "quadrature", "auto"):
+        raise ValueError(f"Unknown method: {method}")
+    use_exact = integer if method != "quadrature" else np.zeros_like(integer)
+
+    p = np.empty(a1.size)
+    if use_exact.any():
+        p[use_exact] = _exact(a1[use_exact], b1[use_exact], a2[use_exact], b2[use_exact])
+    if not use_exact.all():
+        rest = ~use_exact
+        p[rest] = _quadrature(a1[rest], b1[rest], a2[rest], b2[rest], n_nodes)
+    return p.reshape(shape)
+
+
+def _unique_posteriors(a, b, tol):
+    """Representative posteriors and the index of each input's representative."""
+    if tol > 0:
+        # Near-identical: a + b within a relative tol and means within about tol posterior
+        # standard deviations (arcsin(sqrt(p)) has a standard deviation of ~1 / (2 sqrt(a + b)))
+        n = a + b
+        n_class = np.round(np.log(n) / tol)
+        scale = 2 * np.sqrt(np.exp(n_class * tol))
+        keys = np.column_stack([n_class, np.round(scale * np.arcsin(np.sqrt(a / n)) / tol)])
+    else:
+        keys = np.column_stack([a, b])
+    _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    return a[first], b[first], inverse.ravel()
+
+
+def superiority_matrix(a, b, tol=0.0, method="auto", n_nodes=64, block=PAIR_BLOCK):
+    """
+    All-pairs posterior superiority probabilities of N vehicles.
+
+    Parameters:
+    a, b : array
+        Beta posterior parameters of the N vehicles (see posterior_params).
+    tol : float
+        Posteriors with a + b within a relative tol and means within about tol posterior standard
+        deviations share one representative (0: merge only identical posteriors). Merging changes
+        the probabilities by roughly tol / 2 at most.
+    method, n_nodes :
+        As for prob_greater.
+    block : int
+        Pairs evaluated at once (bounds the working memory).
+
+    Returns:
+    ndarray
+        P of shape (N, N) with P[i, j] = P(p_j > p_i); P[i, i] = 0.5.
+    """
+    a, b = (np.asarray(v, dtype=np.float64).ravel() for v in np.broadcast_arrays(a, b))
+    ua, ub, inverse = _unique_posteriors(a, b, tol)
+    U = ua.size
+
+    P = np.full((U, U), 0.5)
+    i, j = np.triu_indices(U, k=1)
+    for start in range(0, i.size, block):
+        bi, bj = i[start:start + block], j[start:start + block]
+        p = prob_greater(ua[bj], ub[bj], ua[bi], ub[bi], method, n_nodes)
+        P[bi, bj] = p
+        P[bj, bi] = 1 - p
+    return P[np.ix_(inverse, inverse)]
@@ -0,0 +1,218 @@
+import argparse
+import time
+
+import numpy as np
+
+import propulsion_analysis_no_ascent as prop
+from hasa import x37b
+from hasa.model import weight_breakdown as scalar_weight_breakdown
+from hasa.vectorized import weight_breakdown
+
+# Closed-loop gross-weight sizing coupling the propulsion analysis and HASA.
+# Instead of copying W_gtot, W_prop, W_entry, T_req_oms and the OMS/RCS volumes by hand from
+# propulsion_analysis_no_ascent.py into hasa/x37b.py, the gross weight is found such that
+#
+#     W_gtot = W_gtot_without_payload(W_gtot) + W_payload
+#
+# where every propulsion-derived HASA input is recomputed from W_gtot on each iteration.
+# The entry weight is W_entry = W_gtot - W_prop (all propellant is used before entry). Since the
+# MER propellant weights are proportional to W_entry, this inner loop has the closed-form
+# solution W_entry = W_gtot / (1 + W_prop(W_entry=1)).
+#
+# The outer loop is solved for a whole batch of vehicles at once with a vectorized secant
+# (Anderson-1) accelerated fixed-point iteration; converged vehicles drop out of the batch.
+# Usage: python sizing.py [--payload LBS]
+
+# Mission inputs (from propulsion_analysis_no_ascent.py) and tank ullage (from hasa/x37b.py)
+X37B_MISSION = {
+    "Isp_oms": prop.Isp_oms,
+    "Isp_rcs": prop.Isp_rcs,
+    "deltaV_oms_orbit": prop.deltaV_oms_orbit,
+    "deltaV_oms_deorbit": prop.deltaV_oms_deorbit,
+    "deltaV_rcs_entry": prop.deltaV_rcs_entry,
+    "deltaV_rcs_orbit": prop.deltaV_rcs_orbit,
+    "ullage_lox": x37b.ullage_lox,
+    "ullage_lh2": x37b.ullage_lh2,
+}
+
+# HASA inputs that are computed by the sizing loop
+SIZED_INPUTS = (
+    "W_gtot", "W_prop", "W_entry", "T_req_oms", "T_req_qp", "T_req_qv",
+    "V_oms_ox", "V_oms_fuel", "V_oms_press", "V_rcs_ox", "V_rcs_fuel", "V_rcs_press",
+    "V_oms_tnk", "V_rcs_tnk",
+)
+
+
+def fixed_inputs(inputs):
+    """Drops the HASA inputs that are computed by the sizing loop."""
+    return {name: value for name, value in inputs.items() if name not in SIZED_INPUTS}
+
+
+def propellant_fraction(mission=X37B_MISSION, xp=np):
+    """Total (OMS + RCS, with reserve) propellant weight per lb of entry weight."""
+    m = mission
+    _, _, W_oms_prop = prop.total_oms_propellant(1.0, m["deltaV_oms_orbit"], m["deltaV_oms_deorbit"], m["Isp_oms"], xp)
+    _, _, W_rcs_prop = prop.total_rcs_propellant(1.0, m["deltaV_rcs_entry"], m["deltaV_rcs_orbit"], m["Isp_rcs"], xp)
+    return W_oms_prop + W_rcs_prop
+
+
+def propulsion_inputs(W_gtot, L_f, mission=X37B_MISSION, xp=np):
+    """
+    Computes the propulsion-derived HASA inputs for a given gross weight.
+
+    Parameters:
+    W_gtot : float or array
+        Gross weight in lbs.
+    L_f : float or array
+        Fuselage length in ft.
+    mission : dict
+        Isp, delta-V and ullage inputs (see X37B_MISSION).
+    xp : module
+        Array module of the propulsion relations (aerosandbox.numpy to trace them with asb.Opti).
+
+    Returns:
+    dict
+        The HASA inputs in SIZED_INPUTS.
+    """
+    m = mission
+    W_entry = W_gtot / (1 + propellant_fraction(m, xp))
+    T_req_oms, T_req_qp, T_req_qv = prop.thrust_requirements(W_entry, L_f)
+    _, _, W_oms_prop = prop.total_oms_propellant(W_entry, m["deltaV_oms_orbit"], m["deltaV_oms_deorbit"],
+                                                 m["Isp_oms"], xp)
+    _, _, W_rcs_prop = prop.total_rcs_propellant(W_entry, m["deltaV_rcs_entry"], m["deltaV_rcs_orbit"],
+                                                 m["Isp_rcs"], xp)
+    V_oms_ox, V_oms_fuel = prop.calculate_lox_lh2_volumes(W_oms_prop)
+    V_rcs_ox, V_rcs_fuel = prop.calculate_lox_lh2_volumes(W_rcs_prop)
+    return {
+        "W_gtot": W_gtot,
+        "W_prop": W_oms_prop + W_rcs_prop,
+        "W_entry": W_entry,
+        "T_req_oms": T_req_oms,
+        "T_req_qp": T_req_qp,
+        "T_req_qv": T_req_qv,
+        "V_oms_ox": V_oms_ox,
+        "V_oms_fuel": V_oms_fuel,
+        "V_oms_press": 0.24 * (V_oms_ox + V_oms_fuel),
+        "V_rcs_ox": V_rcs_ox,
+        "V_rcs_fuel": V_rcs_fuel,
+        "V_rcs_press": 0.24 * (V_rcs_ox + V_rcs_fuel),
+        "V_oms_tnk": V_oms_ox / (1 - m["ullage_lox"]) + V_oms_fuel / (1 - m["ullage_lh2"]),
+        "V_rcs_tnk": V_rcs_ox / (1 - m["ullage_lox"]) + V_rcs_fuel / (1 - m["ullage_lh2"]),
+    }
+
+
+def _take(inputs, idx):
+    """Selects the vehicles idx from a dict of scalars and 1-D arrays."""
+    return {name: value if np.ndim(value) == 0 else value[idx] for name, value in inputs.items()}
+
+
+def size_vehicles(inputs, W_payload, mission=X37B_MISSION, W_gtot_guess=11000.0, method="secant", tol=1e-10,
+                  max_iter=200):
+    """
+    Finds the gross weight of a batch of vehicles carrying a given payload.
+
+    Parameters:
+    inputs : dict
+        HASA inputs (scalars or 1-D arrays over the vehicles). Inputs in SIZED_INPUTS are ignored.
+    W_payload : float or array
+        Required payload in lbs.
+    mission : dict
+        Isp, delta-V and ullage inputs (see X37B_MISSION).
+    W_gtot_guess : float or array
+        Initial guess for the gross weight in lbs.
+    method : str
+        "secant" (accelerated) or "substitution" (naive fixed-point iteration).
+    tol : float
+        Convergence tolerance on |W_gtot_new - W_gtot| / W_gtot.
+    max_iter : int
+        Maximum number of iterations.
+
+    Returns:
+    tuple : (result, stats)
+        result holds the sized HASA inputs and every HASA output (arrays over the vehicles) plus
+        "iterations" (model evaluations per vehicle) and "converged" (bool).
+        stats holds "iterations" (max over the batch), "evaluations" (vehicle-evaluations in
+        total) and "wall_time" in seconds.
+    """
+    if method not in ("secant", "substitution"):
+        raise ValueError(f"Unknown sizing method: {method}")
+    start = time.perf_counter()
+    fixed = {name: np.asarray(value, dtype=np.float64) for name, value in fixed_inputs(inputs).items()}
+    n = np.broadcast_shapes(*(np.shape(v) for v in fixed.values()), np.shape(W_payload), np.shape(W_gtot_guess))
+    n = n[0] if n else 1
+    fixed = {name: value if value.ndim == 0 else np.broadcast_to(value, (n,)) for name, value in fixed.items()}
+    W_payload = np.broadcast_to(np.asarray(W_payload, dtype=np.float64), (n,))
+
+    def g(W, idx):
+        """Fixed-point map W -> W_gtot_without_payload(W) + W_payload for the vehicles idx."""
+        sub = _take(fixed, idx)
+        w = weight_breakdown({**sub, **propulsion_inputs(W, sub["L_f"], mission)})
+        return w["W_gtot_without_payload"] + W_payload[idx]
+
+    W = np.broadcast_to(np.asarray(W_gtot_guess, dtype=np.float64), (n,)).copy()
+    iterations = np.zeros(n, dtype=np.int64)
+    converged = np.zeros(n, dtype=bool)
+    active = np.arange(n)
+    W_prev = r_prev = None
+    evaluations = 0
+
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+        W_act = W[active]
+        r = g(W_act, active) - W_act
+        iterations[active] += 1
+        evaluations += active.size
+
+        done = np.abs(r) <= tol * np.abs(W_act)
+        failed = ~np.isfinite(r)
+        converged[active[done]] = True
+
+        # Next iterate: secant step on the residual, falling back to substitution
+        W_next = W_act + r
+        if method == "secant" and W_prev is not None:
+            dr = r - r_prev
+            ok = (dr != 0) & np.isfinite(dr)
+            W_next[ok] = W_act[ok] - r[ok] * (W_act[ok] - W_prev[ok]) / dr[ok]
+
+        keep = ~(done | failed)
+        W[active[keep]] = W_next[keep]
+        W_prev, r_prev = W_act[keep], r[keep]
+        active = active[keep]
+
+    result = {name: np.broadcast_to(value, (n,)) for name, value in fixed.items()}
+    result.update(propulsion_inputs(W, fixed["L_f"], mission))
+    result.update(weight_breakdown(result))
+    result["iterations"] = iterations
+    result["converged"] = converged
+    stats = {"iterations": int(iterations.max()), "evaluations": evaluations,
+             "wall_time": time.perf_counter() - start}
+    return result, stats
+
+
+def main(argv=None):
+    base = x37b.x37b_inputs()
+    hand_entered = scalar_weight_breakdown(base)
+    parser = argparse.ArgumentParser(description="Closed-loop HASA + propulsion gross-weight sizing of the X-37B.")
+    parser.add_argument("--payload", type=float, default=hand_entered["W_allow_payload"],
+                        help="required payload in lbs (default: allowable payload of the hand-entered X-37B case)")
+    args = parser.parse_args(argv)
+
+    print(f"Required payload: {args.payload:.2f} lbs")
+    print(f"Hand-entered case: W_gtot = {base['W_gtot']:.2f} lbs, W_prop = {base['W_prop']:.2f} lbs, "
+          f"W_entry = {base['W_entry']:.2f} lbs")
+    print("")
+    for method in ("substitution", "secant"):
+        result, stats = size_vehicles(base, args.payload, method=method)
+        print(f"{method}: {stats['iterations']} iterations, {stats['wall_time']*1e3:.2f} ms, "
+              f"converged: {bool(result['converged'][0])}")
+    print("")
+    for name in ("W_gtot", "W_prop", "W_entry", "T_req_oms", "T_req_qp", "T_req_qv",
+                 "V_oms_ox", "V_oms_fuel", "V_rcs_ox", "V_rcs_fuel"):
+        unit = "ft³" if name.startswith("V_") else "lbs"
+        print(f"{name}: {result[name][0]:.2f} {unit}")
+    print(f"Allowable payload at closure: {result['W_allow_payload'][0]:.2f} lbs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+
+from hasa.x37b import x37b_inputs
+from sweep import DEFAULT_OUTPUTS, LatinHypercube, evaluate_points
+from sizing import X37B_MISSION
+
+# Precomputed surrogate of the HASA + propulsion chain for interactive queries.
+# The coupled model (sweep.evaluate_points) is sampled on a tensor-product Chebyshev grid over a
+# bounded box of the dominant inputs (the others stay at their base values) and interpolated by a
+# Chebyshev series in the log of the inputs, where the power-law MERs are nearly linear. Most
+# high-order mixed terms are negligible, so the series is kept sparse: the smallest coefficients
+# are dropped as long as their absolute sum (a bound on the error it adds, |T_k| <= 1) stays within
+# half the tolerance. The degree is raised until the error on a Latin hypercube of validation
+# points, against the exact model, is within tol of each output's range; the measured errors and
+# truncation bounds are stored with the surrogate (the validation error is empirical: a maximum
+# over the validation points).
+#
+# The terms (Chebyshev orders and coefficients) are saved as a .npy file, memory-mapped on load,
+# with a JSON sidecar (path + ".json") holding the bounds, base inputs and errors. A query inside
+# the box costs one product of basis values per term; points outside it, and outputs that missed
+# tol, are evaluated exactly.
+# Dominant inputs, as the example sweep of sweep.py: gross weight, geometry and OMS Isp within +/-15%
+DEFAULT_INPUTS = ("W_gtot", "L_f", "S_ref", "S_btot", "V_tot", "Isp_oms")
+TRUNCATION_SHARE = 0.5  # share of tol the dropped terms may add to the error
+BLOCK_ELEMENTS = 1 << 22  # size of the intermediate array of evaluate (points are evaluated in blocks)
+
+
+def default_bounds(base=None, names=DEFAULT_INPUTS, spread=0.15):
+    """Bounds (1 -/+ spread) * value around the X-37B inputs (or base) and mission inputs."""
+    values = {**X37B_MISSION, **(x37b_inputs() if base is None else base)}
+    return {name: ((1 - spread) * values[name], (1 + spread) * values[name]) for name in names}
+
+
+def chebyshev_nodes(degree):
+    """Chebyshev points of the first kind on [-1, 1] (degree + 1 of them)."""
+    return np.cos(np.pi * (np.arange(degree + 1) + 0.5) / (degree + 1))
+
+
+def chebyshev_basis(t, degree):
+    """T_0 .. T_degree at t in [-1, 1]: array (..., degree + 1)."""
+    return np.cos(np.arange(degree + 1) * np.arccos(np.clip(t, -1, 1))[..., None])
+
+
+def chebyshev_coefficients(bounds, outputs, base, degree, couple_propulsion=True):
+    """
+    Tensor-product Chebyshev interpolant of the exact model in the log of the inputs.
+
+    Returns:
+    array (degree + 1, ..., degree + 1, n_outputs)
+        Coefficients, one axis per input.
+    """
+    log_bounds = np.log(np.array(list(bounds.values()), dtype=float))
+    nodes = chebyshev_nodes(degree)
+    grid = np.meshgrid(*[np.exp(lo + (hi - lo) * (nodes + 1) / 2) for lo, hi in log_bounds], indexing="ij")
+    values = evaluate_points({name: g.ravel() for name, g in zip(bounds, grid)}, base, outputs, couple_propulsion)
+    coefficients = np.stack([values[name].reshape(grid[0].shape) for name in outputs], axis=-1)
+    # Discrete Chebyshev transform along every input axis
+    transform = 2 / (degree + 1) * chebyshev_basis(nodes, degree).T
+    transform[0] /= 2
+    for axis in range(len(bounds)):
+        coefficients = np.moveaxis(np.tensordot(transform, coefficients, axes=([1], [axis])), 0, axis)
+    return coefficients
+
+
+def sparse_terms(coefficients, budget):
+    """
+    Drops the smallest terms of a dense Chebyshev series within an error budget per output.
+
+    Parameters:
+    coefficients : array (degree + 1, ..., degree + 1, n_outputs)
+    budget : array (n_outputs,)
+        Largest sum of dropped |coefficients| per output.
+
+    Returns:
+    tuple : (terms, truncation)
+        terms (K, n_inputs + n_outputs) as Surrogate.terms and the sum of dropped |coefficients| per output.
+    """
+    shape, n_outputs = coefficients.shape[:-1], coefficients.shape[-1]
+    c = coefficients.reshape(-1, n_outputs)
+    droppable = np.ones(len(c), dtype=bool)
+    for k in range(n_outputs):
+        order = np.argsort(np.abs(c[:, k]))
+        fits = np.zeros(len(c), dtype=bool)
+        fits[order[np.cumsum(np.abs(c[order, k])) <= budget[k]]] = True
+        droppable &= fits
+    orders = np.column_stack(np.unravel_index(np.flatnonzero(~droppable), shape))
+    return np.column_stack([orders, c[~droppable]]), np.abs(c[droppable]).sum(axis=0)
+
+
+class Surrogate:
+    """
+    Sparse Chebyshev surrogate of HASA + propulsion outputs over a box of inputs.
+
+    Parameters:
+    bounds : dict
+        {input name: (low, high)}, positive bounds (the series is in log of the inputs).
+    outputs : tuple
+        Output names.
+    terms : array (K, n_inputs + n_outputs)
+        Per term, the Chebyshev order along every input, then its coefficient for every output.
+    base : dict
+        Values of the other inputs (for the exact fallback).
+    errors : dict
+        {output: {"absolute": maximum error on the validation points, "relative": the same over the
+        output range, "truncation": sum of the dropped coefficients}}.
+    tol : float
+        Accepted error relative to the output range; outputs above it are evaluated exactly.
+    couple_propulsion : bool
+        As sweep.evaluate_points.
+    """
+
+    def __init__(self, bounds, outputs, terms, base, errors, tol, couple_propulsion=True):
+        self.names = tuple(bounds)
+        self.bounds = np.array([bounds[name] for name in self.names], dtype=float)
+        self.outputs = tuple(outputs)
+        self.terms = terms
+        self.base = base
+        self.errors = errors
+        self.tol = tol
+        self.couple_propulsion = couple_propulsion
+        log_bounds = np.log(self.bounds)
+        self._center, self._half = log_bounds.mean(axis=1), (log_bounds[:, 1] - log_bounds[:, 0]) / 2
+        d = len(self.names)
+        self._orders = np.asarray(terms[:, :d], dtype=np.intp)
+        self._coefficients = np.ascontiguousarray(terms[:, d:])
+        self.degree = int(self._orders.max())
+        self._degrees = np.arange(self.degree + 1)
+        # Index of the basis value of every term along every input in the flat (n_inputs, degree + 1) basis
+        self._index = (np.arange(d)[:, None] * (self.degree + 1) + self._orders.T).copy()
+        self._values = {**X37B_MISSION, **base}
+        self.exact_outputs = tuple(name for name, error in errors.items() if error.get("relative", 0) > tol)
+
+    @classmethod
+    def build(cls, bounds, outputs=DEFAULT_OUTPUTS, base=None, tol=1e-4, max_degree=10, n_validation=4096,
+              couple_propulsion=True, seed=0, progress=False):
+        """
+        Samples the exact model and fits the surrogate.
+
+        Parameters:
+        bounds : dict
+            {input name: (low, high)} of the HASA or mission inputs spanned (see default_bounds).
+        outputs : tuple
+            HASA outputs (or sized inputs such as W_prop).
+        base : dict
+            Values of the other inputs (default: X-37B).
+        tol : float
+            Target maximum error relative to each output's range on the validation points.
+        max_degree : int
+            Highest degree per input tried (the model is evaluated (degree + 1) ** len(bounds) times).
+        n_validation : int
+            Latin hypercube points the surrogate is checked against.
+
+        Returns:
+        Surrogate
+        """
+        base = x37b_inputs() if base is None else base
+        validation = LatinHypercube(bounds, n_validation, seed=seed).points(0, n_validation)
+        x = np.column_stack([validation[name] for name in bounds])
+        exact = evaluate_points(validation, base, outputs, couple_propulsion)
+        scale = np.array([np.ptp(exact[name]) or np.abs(exact[name]).max() or 1.0 for name in outputs])
+
+        for degree in range(2, max_degree + 1):
+            start = time.perf_counter()
+            dense = chebyshev_coefficients(bounds, outputs, base, degree, couple_propulsion)
+            terms, truncation = sparse_terms(dense, TRUNCATION_SHARE * tol * scale)
+            approx = cls(bounds, outputs, terms, base, {}, tol, couple_propulsion).evaluate(x)
+            errors = {}
+            for k, name in enumerate(outputs):
+                error = float(np.abs(approx[k] - exact[name]).max())
+                errors[name] = {"absolute": error, "relative": error / scale[k], "truncation": float(truncation[k])}
+            surrogate = cls(bounds, outputs, terms, base, errors, tol, couple_propulsion)
+            worst = max(error["relative"] for error in errors.values())
+            if progress:
+                print(f"degree {degree}: {dense[..., 0].size} model points, {len(terms)} terms kept, "
+                      f"max relative error {worst:.2e} ({time.perf_counter() - start:.2f} s)")
+            if worst <= tol:
+                break
+        return surrogate
+
+    def evaluate(self, x):
+        """
+        Surrogate values at points inside the box (no fallback).
+
+        Parameters:
+        x : array (n_inputs,) or (N, n_inputs)
+            Inputs in the order of self.names.
+
+        Returns:
+        array (n_outputs,) or (n_outputs, N)
+        """
+        x = np.asarray(x, dtype=float)
+        if x.ndim == 1:
+            t = (np.log(x) - self._center) / self._half
+            basis = np.cos(self._degrees * np.arccos(np.minimum(np.maximum(t, -1), 1))[:, None])
+            return np.multiply.reduce(basis.take(self._index)) @ self._coefficients
+        block = max(1, BLOCK_ELEMENTS // self._orders.size)
+        if len(x) > block:
+            return np.concatenate([self.evaluate(x[i:i + block]) for i in range(0, len(x), block)], axis=1)
+        basis = chebyshev_basis((np.log(x) - self._center) / self._half, self.degree)  # (N, n_inputs, degree + 1)
+        return (np.multiply.reduce(basis.reshape(len(x), -1)[:, self._index], axis=1) @ self._coefficients).T
+
+    def inside(self, x):
+        """Whether points (N, n_inputs) are in the validated box."""
+        x = np.atleast_2d(x)
+        return np.all((x >= self.bounds[:, 0]) & (x <= self.bounds[:, 1]), axis=1)
+
+    def __call__(self, points):
+        """
+        Outputs at design points, exact outside the box and for the outputs that missed tol.
+
+        Parameters:
+        points : dict
+            {input name: scalar or 1-D array}; inputs of the box that are missing take their base value.
+
+        Returns:
+        dict
+            {output: array (N,)}, plus "exact" (bool array: points evaluated with the exact model);
+            floats for scalar inputs.
+        """
+        values = self._values
+        if all(np.ndim(value) == 0 for value in points.values()):
+            x = np.array([points.get(name, values[name]) for name in self.names], dtype=float)
+            if (not self.exact_outputs and np.all(x >= self.bounds[:, 0]) and np.all(x <= self.bounds[:, 1])
+                    and all(value == values.get(name) for name, value in points.items() if name not in self.names)):
+                return {**dict(zip(self.outputs, self.evaluate(x).tolist())), "exact": False}
+            result = self({name: np.atleast_1d(value) for name, value in points.items()})
+            return {name: value[0].item() for name, value in result.items()}
+
+        n = max([np.size(value) for value in points.values()] or [1])
+        x = np.column_stack([np.broadcast_to(np.asarray(points.get(name, values[name]), dtype=float), (n,))
+                             for name in self.names])
+        inside = self.inside(x)
+        for name, value in points.items():
+            if name not in self.names:  # an input the surrogate does not span must be at its base value
+                inside &= np.asarray(value) == values.get(name)
+        result = {name: np.empty(n) for name in self.outputs}
+        if inside.any():
+            approx = self.evaluate(x[inside])
+            for k, name in enumerate(self.outputs):
+                result[name][inside] = approx[k]
+        exact_points = ~inside
+        rows = np.ones(n, dtype=bool) if self.exact_outputs else exact_points
+        if rows.any():
+            sub = {name: np.broadcast_to(np.asarray(value, dtype=float), (n,))[rows] for name, value in points.items()}
+            sub.update({name: x[rows, k] for k, name in enumerate(self.names)})
+            exact = evaluate_points(sub, self.base, self.outputs, self.couple_propulsion)
+            for name in self.outputs:
+                if name in self.exact_outputs:
+                    result[name][:] = exact[name]
+                else:
+                    result[name][exact_points] = exact[name][exact_points[rows]]
+        result["exact"] = exact_points
+        return result
+
+    def save(self, path):
+        """
+        Writes the terms (path, .npy) and the JSON sidecar (path + ".json").
+
+        ".npy" is appended to a path without it (as np.save does), and the sidecar follows it;
+        returns the path written.
+        """
+        path = _npy_path(path)
+        np.save(path, self.terms)
+        with open(path + ".json", "w") as f:
+            json.dump({"bounds": dict(zip(self.names, self.bounds.tolist())), "outputs": list(self.outputs),
+                       "base": {name: float(value) for name, value in self.base.items()}, "errors": self.errors,
+                       "tol": self.tol, "couple_propulsion": self.couple_propulsion}, f, indent=1)
+        return path
+
+    @classmethod
+    def load(cls, path, mmap_mode="r"):
+        """Opens a saved surrogate (path as given to save); the terms are memory-mapped."""
+        path = _npy_path(path)
+        with open(path + ".json") as f:
+            meta = json.load(f)
+        terms = np.load(path, mmap_mode=mmap_mode)
+        return cls({name: tuple(b) for name, b in meta["bounds"].items()}, meta["outputs"], terms,
+                   meta["base"], meta["errors"], meta["tol"], meta["couple_propulsion"])
+
+
+def _npy_path(path):
+    path = os.fspath(path)
+    return path if path.endswith(".npy") else path + ".npy"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Builds a HASA + propulsion surrogate over the X-37B inputs +/-15%.")
+    parser.add_argument("path", help="surrogate file (.npy, with a .json sidecar)")
+    parser.add_argument("--tol", type=float, default=1e-4, help="maximum error relative to each output's range")
+    parser.add_argument("--max-degree", type=int, default=10)
+    parser.add_argument("--validation", type=int, default=4096, help="Latin hypercube validation points")
+    args = parser.parse_args(argv)
+
+    surrogate = Surrogate.build(default_bounds(), tol=args.tol, max_degree=args.max_degree,
+                                n_validation=args.validation, progress=True)
+    path = surrogate.save(args.path)
+    print(f"Degree {surrogate.degree}, {len(surrogate.terms)} terms over {', '.join(surrogate.names)}; "
+          f"saved to {path}")
+    for name, error in surrogate.errors.items():
+        flag = "  (exact fallback)" if name in surrogate.exact_outputs else ""
+        print(f"  {name:<24} max error {error['absolute']:10.3e} ({error['relative']:.1e} of range), "
+              f"truncation bound {error['truncation']:.1e}{flag}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from hasa.vectorized import weight_breakdown
+from hasa.x37b import x37b_inputs
+from sizing import X37B_MISSION, propulsion_inputs
+
+# Parallel design-space sweeps of the HASA + propulsion model with a memory-mapped result store.
+# The sweep is split into chunks of design points; each worker generates its points from their
+# indices (nothing is sent to the workers but the chunk number), evaluates them and writes the
+# inputs and outputs straight into a structured .npy file opened with np.lib.format.open_memmap.
+# A small "<file>.done" byte map records finished chunks, so an interrupted sweep resumes by
+# skipping them. The design parameters (design class, names, bounds or levels, seed, base inputs,
+# outputs, couple_propulsion) are kept in "<file>.params.json", and a sweep is only resumed with
+# the same parameters.
+#
+# Swept names can be any HASA input (hasa.model.INPUT_NAMES) or mission input (sizing.X37B_MISSION).
+# With couple_propulsion=True the propellant weight, thrusts and OMS/RCS volumes are recomputed
+# from W_gtot, L_f and the mission inputs (total_oms/rcs_propellant, i.e. oms/rcs_propellant_weight).
+# Usage: python sweep.py OUT.npy [--lhs N | --levels K] [--chunk-size N] [--workers N]
+
+# Outputs stored by default
+DEFAULT_OUTPUTS = ("W_prop", "W_str", "W_sub", "W_pros", "W_gtot_without_payload", "W_allow_payload")
+
+
+class FullFactorial:
+    """Full-factorial grid over {name: 1-D array of levels}; the last name varies fastest."""
+
+    def __init__(self, levels):
+        self.names = tuple(levels)
+        self.levels = [np.asarray(values, dtype=np.float64) for values in levels.values()]
+        self.n_points = int(np.prod([len(values) for values in self.levels], dtype=np.int64))
+
+    def points(self, start, stop):
+        """Design points start..stop-1 as {name: array}."""
+        idx = np.arange(start, stop, dtype=np.int64)
+        points = {}
+        stride = 1
+        for name, values in reversed(list(zip(self.names, self.levels))):
+            points[name] = values[(idx // stride) % len(values)]
+            stride *= len(values)
+        return {name: points[name] for name in self.names}
+
+
+class LatinHypercube:
+    """
+    Latin hypercube of n_points over {name: (low, high)}.
+
+    Each point is computed from its index: dimension d of point i falls into stratum
+    perm_d(i) of n_points, where perm_d is a keyed Feistel permutation of [0, n_points), with a
+    hashed jitter inside the stratum. No per-dimension permutation array is stored, so the
+    design scales to 10^9 points and any chunk can be generated independently.
+    """
+
+    def __init__(self, bounds, n_points, seed=0):
+        self.names = tuple(bounds)
+        self.bounds = [tuple(map(float, b)) for b in bounds.values()]
+        self.n_points = int(n_points)
+        self.seed = seed
+        keys = np.random.SeedSequence(seed).generate_state(5 * len(self.names), dtype=np.uint64)
+        self.keys = keys.reshape(len(self.names), 5)
+        bits = max(2, int(np.ceil(np.log2(max(self.n_points, 2)))))
+        self.half_bits = (bits + 1) // 2
+
+    def _feistel(self, x, keys):
+        half = np.uint64(self.half_bits)
+        mask = np.uint64((1 << self.half_bits) - 1)
+        left, right = x >> half, x & mask
+        for key in keys[:4]:
+            left, right = right, left ^ (_mix(right ^ key) & mask)
+        return (left << half) | right
+
+    def _permute(self, i, keys):
+        """Keyed bijection of [0, n_points) (Feistel network with cycle walking)."""
+        x = self._feistel(i, keys)
+        outside = x >= self.n_points
+        while outside.any():
+            x[outside] = self._feistel(x[outside], keys)
+            outside = x >= self.n_points
+        return x
+
+    def points(self, start, stop):
+        """Design points start..stop-1 as {name: array}."""
+        i = np.arange(start, stop, dtype=np.uint64)
+        points = {}
+        for name, (low, high), keys in zip(self.names, self.bounds, self.keys):
+            stratum = self._permute(i, keys).astype(np.float64)
+            jitter = (_mix(i ^ keys[4]) >> np.uint64(11)).astype(np.float64) / 2.0 ** 53
+            points[name] = low + (high - low) * (stratum + jitter) / self.n_points
+        return points
+
+
+def _mix(x):
+    """splitmix64 finalizer (uint64 arrays, wrapping arithmetic)."""
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def evaluate_points(points, base, outputs, couple_propulsion=True):
+    """Evaluates design points ({name: array}) and returns {output: array}."""
+    mission = {name: points.get(name, value) for name, value in X37B_MISSION.items()}
+    inputs = {**base, **{name: value for name, value in points.items() if name not in mission}}
+    if couple_propulsion:
+        inputs.update(propulsion_inputs(inputs["W_gtot"], inputs["L_f"], mission))
+    w = weight_breakdown(inputs)
+    return {name: w[name] if name in w else np.broadcast_to(inputs[name], w["W_f"].shape) for name in outputs}
+
+
+def _run_chunk(path, design, base, outputs, couple_propulsion, chunk, chunk_size):
+    """Evaluates one chunk and writes it into the memory-mapped result file (runs in a worker)."""
+    start = chunk * chunk_size
+    stop = min(start + chunk_size, design.n_points)
+    points = design.points(start, stop)
+    values = evaluate_points(points, base, outputs, couple_propulsion)
+
+    result = np.load(path, mmap_mode="r+")
+    for name, value in points.items():
+        result[name][start:stop] = value
+    for name, value in values.items():
+        result[name][start:stop] = value
+    result.flush()
+    del result
+
+    done = np.memmap(path + ".done", dtype=np.uint8, mode="r+")
+    done[chunk] = 1
+    done.flush()
+    return stop - start
+
+
+def sweep_parameters(design, base, outputs, couple_propulsion):
+    """JSON-compatible description of a sweep, compared before resuming it."""
+    parameters = {"design": type(design).__name__, "names": list(design.names), "n_points": design.n_points}
+    if isinstance(design, LatinHypercube):
+        parameters.update(bounds=[list(b) for b in design.bounds], seed=design.seed)
+    else:
+        parameters["levels"] = [values.tolist() for values in design.levels]
+    parameters.update(base={name: np.asarray(value, dtype=np.float64).tolist() for name, value in base.items()},
+                      outputs=list(outputs), couple_propulsion=bool(couple_propulsion))
+    return json.loads(json.dumps(parameters))
+
+
+def run_sweep(design, path, base=None, outputs=DEFAULT_OUTPUTS, couple_propulsion=True, chunk_size=1_000_000,
+              workers=None, progress=True):
+    """
+    Runs (or resumes) a design-space sweep into a memory-mapped structured .npy file.
+
+    Parameters:
+    design : FullFactorial or LatinHypercube
+        Design points; their names are HASA or mission inputs.
+    path : str
+        Result file; one record per design point with the swept inputs and the outputs.
+    base : dict
+        Values of the inputs that are not swept (default: X-37B).
+    outputs : tuple
+        HASA outputs (or sized inputs such as W_prop) to store.
+    couple_propulsion : bool
+        Recompute the propulsion-derived HASA inputs from W_gtot, L_f and the mission inputs.
+    chunk_size : int
+        Design points per chunk (also the resume granularity).
+    workers : int
+        Worker processes (default: os.cpu_count()).
+    progress : bool
+        Print progress and throughput.
+
+    Returns:
+    numpy.memmap
+        The result file, opened read-only.
+    """
+    base = x37b_inputs() if base is None else base
+    workers = workers or os.cpu_count()
+    dtype = np.dtype([(name, np.float64) for name in (*design.names, *outputs)])
+    n_chunks = -(-design.n_points // chunk_size)
+    parameters = sweep_parameters(design, base, outputs, couple_propulsion)
+
+    if os.path.exists(path) and os.path.exists(path + ".done"):
+        if not os.path.exists(path + ".params.json"):
+            raise ValueError(f"{path}.params.json is missing; the sweep parameters cannot be checked for resuming")
+        with open(path + ".params.json") as f:
+            previous = json.load(f)
+        changed = sorted(key for key in parameters.keys() | previous.keys() if parameters.get(key) != previous.get(key))
+        if changed:
+            raise ValueError(f"{path} holds a sweep with different parameters ({', '.join(changed)}); "
+                             "use a new file or the original arguments")
+        existing = np.load(path, mmap_mode="r")
+        if existing.dtype != dtype or existing.shape != (design.n_points,):
+            raise ValueError(f"{path} holds a different sweep ({existing.shape}, {existing.dtype})")
+        del existing
+        done = np.fromfile(path + ".done", dtype=np.uint8)
+        if done.size != n_chunks:
+            raise ValueError(f"{path}.done was written with a different chunk size")
+    else:
+        np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=(design.n_points,)).flush()
+        # (written before the .done map, whose existence marks a resumable sweep)
+        with open(path + ".params.json", "w") as f:
+            json.dump(parameters, f)
+        done = np.zeros(n_chunks, dtype=np.uint8)
+        done.tofile(path + ".done")
+
+    todo = np.flatnonzero(done == 0)
+    if progress and todo.size < n_chunks:
+        print(f"Resuming: {n_chunks - todo.size} of {n_chunks} chunks already done")
+
+    start = time.perf_counter()
+    n_done = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_run_chunk, path, design, base, outputs, couple_propulsion, int(chunk), chunk_size)
+                   for chunk in todo]
+        for k, future in enumerate(as_completed(futures), 1):
+            n_done += future.result()
+            if progress:
+                elapsed = time.perf_counter() - start
+                rate = n_done / elapsed
+                remaining = (todo.size - k) * chunk_size / rate
+                print(f"chunk {k}/{todo.size}: {n_done} points, {rate:,.0f} points/s, ETA {remaining:.0f} s")
+    return np.load(path, mmap_mode="r")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="HASA + propulsion design-space sweep into a memory-mapped .npy file.")
+    parser.add_argument("path", help="result file (.npy); rerun with the same arguments to resume")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--lhs", type=float, default=1e7, help="Latin hypercube with this many points (default)")
+    group.add_argument("--levels", type=int, help="full-factorial grid with this many levels per input")
+    parser.add_argument("--chunk-size", type=float, default=1e6)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    # Example sweep: gross weight, geometry and OMS specific impulse within +/-15% of the X-37B
+    base = x37b_inputs()
+    bounds = {name: (0.85 * base[name], 1.15 * base[name]) for name in ("W_gtot", "L_f", "S_ref", "S_btot", "V_tot")}
+    bounds["Isp_oms"] = (0.85 * X37B_MISSION["Isp_oms"], 1.15 * X37B_MISSION["Isp_oms"])
+    if args.levels:
+        design = FullFactorial({name: np.linspace(low, high, args.levels) for name, (low, high) in bounds.items()})
+    else:
+        design = LatinHypercube(bounds, int(args.lhs), seed=args.seed)
+
+    result = run_sweep(design, args.path, chunk_size=int(args.chunk_size), workers=args.workers)
+    payload = result["W_allow_payload"]
+    best = int(np.nanargmax(payload))
+    print(f"{design.n_points} design points in {args.path}; best allowable payload {payload[best]:.2f} lbs at "
+          + ", ".join(f"{name}={result[name][best]:.2f}" for name in design.names))
+
+
+if __name__ == "__main__":
+    main()